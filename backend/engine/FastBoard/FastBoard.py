@@ -1,15 +1,56 @@
 from engine.constants import WHITE, PIECE_REPRESENTATION
 from engine.FastBoard.PieceList import PieceList
+from engine.FastBoard.zobrist import PIECE_KEYS, BLACK_TO_MOVE, CASTLING_KEYS, EN_PASSANT_KEYS, hash_position
+from engine.FastBoard.moves import (SQUARE_MASK, TYPE_MASK, TO_SHIFT, PIECE_SHIFT, CAPTURE_SHIFT,
+                                    PROMOTION_SHIFT, DOUBLE_PUSH, EN_PASSANT, CASTLE,
+                                    square_name, parse_square)
+from engine.MoveGen.tables import PIECE_SQUARE_TABLES
+from engine.utils import fen_to_placements, placements_to_slots
+
+# Material value of each piece type: pawn, knight, bishop, rook, queen, king
+PIECE_VALUES = (1, 3, 3, 5, 9, 0)
+
+# Castling rights, one bit each, in FEN order
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+CASTLING_LETTERS = 'KQkq'
+
+# Rights that survive a move from or to each square: moving the king or a
+# rook, or capturing a rook on its home square, gives up the matching rights
+CASTLING_MASKS = [15] * 64
+CASTLING_MASKS[3] = 15 & ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)
+CASTLING_MASKS[0] = 15 & ~WHITE_KINGSIDE
+CASTLING_MASKS[7] = 15 & ~WHITE_QUEENSIDE
+CASTLING_MASKS[59] = 15 & ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)
+CASTLING_MASKS[56] = 15 & ~BLACK_KINGSIDE
+CASTLING_MASKS[63] = 15 & ~BLACK_QUEENSIDE
+
+# Right -> (color, king home, rook home)
+CASTLING_HOMES = {WHITE_KINGSIDE: (0, 3, 0), WHITE_QUEENSIDE: (0, 3, 7),
+                  BLACK_KINGSIDE: (1, 59, 56), BLACK_QUEENSIDE: (1, 59, 63)}
+
+# King target of a castle -> (rook start, rook end)
+CASTLING_ROOKS = {1: (0, 2), 5: (7, 4), 57: (56, 58), 61: (63, 60)}
+
+
+def castling_rights(letters):
+    # FEN castling letters, as a string or any collection, to rights bits
+    return sum(1 << index for index, letter in enumerate(CASTLING_LETTERS) if letter in letters)
+
+
+def castling_letters(castling):
+    return ''.join(letter for index, letter in enumerate(CASTLING_LETTERS) if castling >> index & 1) or '-'
+
 
 class FastBoard():
-    def __init__(self, active=WHITE, pieces=None) -> None:
-        self.pieces = PieceList(pieces) if pieces is not None else PieceList([
-            32768, 16384, 8192, 4096, 2048, 1024, 512, 256, 64, 2, 32, 4, 128, 1, 16, 36028797018963968, 
-            8, 18014398509481984, 9007199254740992, 4503599627370496,
+    def __init__(self, active=WHITE, pieces=None, types=None, castling=None, enPassant=0,
+                 halfmoveClock=0, fullmoveNumber=1) -> None:
+        self.pieces = PieceList(pieces, types) if pieces is not None else PieceList([
+            32768, 16384, 8192, 4096, 2048, 1024, 512, 256, 64, 2, 32, 4, 128, 1, 16, 8, 
+            36028797018963968, 18014398509481984, 9007199254740992, 4503599627370496,
             2251799813685248, 1125899906842624, 562949953421312, 281474976710656,
             4611686018427387904, 144115188075855872, 2305843009213693952,
             288230376151711744, 9223372036854775808, 72057594037927936,
-            576460752303423488, 1152921504606846976])
+            1152921504606846976, 576460752303423488])
         
         
         
@@ -21,54 +62,241 @@ class FastBoard():
         self.occupied = 0
         
         
+        # Material and piece square sums per color, kept up to date by every
+        # piece change so the evaluator reads them instead of summing pieces
+        self.material = [0, 0]
+        self.pieceSquare = [0, 0]
+
         for piece, pieceType, pieceColor in self.pieces:
             self.pieceTypes[pieceType] |= piece
             self.colors[pieceColor] |= piece
             self.occupied |= piece
+            self.material[pieceColor] += PIECE_VALUES[pieceType]
+            self.pieceSquare[pieceColor] += PIECE_SQUARE_TABLES[(pieceColor * 6 + pieceType) * 64
+                                                                + piece.bit_length() - 1]
+
+        # Castling rights bits; by default every right the king and rook
+        # placement still allows
+        self.castling = self.placement_castling() if castling is None else castling
+
+        # Square a pawn can be captured on en passant, as a bitboard, 0 if none
+        self.enPassant = enPassant
+        self.halfmoveClock = halfmoveClock
+        self.fullmoveNumber = fullmoveNumber
+
+        # (castling, enPassant, halfmoveClock, hash) from before each move
+        # made, none of which can be worked out again when it is taken back
+        self.history = []
+
+        # Zobrist key of the position, kept up to date incrementally by _make
+        self.hash = hash_position(self.pieces, self.active, self.castling, self.enPassant)
+
+    def placement_castling(self):
+        castling = 0
+        for right, (color, king, rook) in CASTLING_HOMES.items():
+            ownPieces = self.colors[color]
+            if ownPieces & self.pieceTypes[5] & 1 << king and ownPieces & self.pieceTypes[3] & 1 << rook:
+                castling |= right
+        return castling
+
+    @classmethod
+    def from_fen(cls, fen):
+        _, active, castling, enPassant, halfmoves, fullmoves = fen.split(' ')
+        pieces, types = placements_to_slots(fen_to_placements(fen))
+        return cls(active=int(active == 'b'), pieces=pieces, types=types,
+                   castling=castling_rights(castling),
+                   enPassant=0 if enPassant == '-' else 1 << parse_square(enPassant),
+                   halfmoveClock=int(halfmoves), fullmoveNumber=int(fullmoves))
+
+    def make_fen(self):
+        rows = []
+        for rank in reversed(range(8)):
+            row, empty = '', 0
+            # a file first, which is the high bit of the rank
+            for square in range(rank * 8 + 7, rank * 8 - 1, -1):
+                pieceType = self.pieces.piece_type(square)
+                if pieceType is None:
+                    empty += 1
+                    continue
+                if empty:
+                    row, empty = row + str(empty), 0
+                letter = 'pnbrqk'[pieceType]
+                row += letter if self.colors[1] >> square & 1 else letter.upper()
+            rows.append(row + str(empty) if empty else row)
+
+        enPassant = square_name(self.enPassant.bit_length() - 1) if self.enPassant else '-'
+        return ' '.join(['/'.join(rows), 'b' if self.active else 'w', castling_letters(self.castling),
+                         enPassant, str(self.halfmoveClock), str(self.fullmoveNumber)])
+
+    def serialize(self):
+        # Compact, picklable snapshot used to hand positions to search workers
+        return (tuple(self.pieces[:]), tuple(self.pieces.typeLookup), int(self.active),
+                self.castling, self.enPassant, self.halfmoveClock, self.fullmoveNumber)
+
+    @classmethod
+    def deserialize(cls, state):
+        pieces, types, active, castling, enPassant, halfmoveClock, fullmoveNumber = state
+        return cls(active=active, pieces=list(pieces), types=types, castling=castling,
+                   enPassant=enPassant, halfmoveClock=halfmoveClock, fullmoveNumber=fullmoveNumber)
 
     def __add__(self, move):
-        return self._update(move)
+        return self._make(move)
     
     def __sub__(self, move):
-        return self._update(move, reverse=True)
+        return self._unmake(move)
 
-    def _update(self, move, reverse=False):
-        p0, p1 = (move.end, move.start) if reverse else (move.start, move.end)
-        color = not self.active if reverse else self.active
+    def _move_piece(self, pieceType, color, start, end):
+        self.pieces.update(start, end)
+        squares = 1 << start | 1 << end
+        self.pieceTypes[pieceType] ^= squares
+        self.colors[color] ^= squares
+        keys = PIECE_KEYS[color][pieceType]
+        self.hash ^= keys[start] ^ keys[end]
+        table = (color * 6 + pieceType) * 64
+        self.pieceSquare[color] += PIECE_SQUARE_TABLES[table + end] - PIECE_SQUARE_TABLES[table + start]
 
-        self.pieces.update(p0, p1, color)
+    def _remove_piece(self, pieceType, color, square):
+        self.pieces.remove(square)
+        self.pieceTypes[pieceType] ^= 1 << square
+        self.colors[color] ^= 1 << square
+        self.hash ^= PIECE_KEYS[color][pieceType][square]
+        self.material[color] -= PIECE_VALUES[pieceType]
+        self.pieceSquare[color] -= PIECE_SQUARE_TABLES[(color * 6 + pieceType) * 64 + square]
 
-        self.pieceTypes[move.pieceType] &= ~p0
-        self.colors[color] &= ~p0
+    def _put_piece(self, pieceType, color, square):
+        self.pieces.insert(square, pieceType, color)
+        self.pieceTypes[pieceType] ^= 1 << square
+        self.colors[color] ^= 1 << square
+        self.hash ^= PIECE_KEYS[color][pieceType][square]
+        self.material[color] += PIECE_VALUES[pieceType]
+        self.pieceSquare[color] += PIECE_SQUARE_TABLES[(color * 6 + pieceType) * 64 + square]
 
-        self.pieceTypes[move.pieceType] |= p1
-        self.colors[color] |= p1
+    def _change_piece(self, color, square, pieceType, newType):
+        self.pieces.promote(square, newType)
+        self.pieceTypes[pieceType] ^= 1 << square
+        self.pieceTypes[newType] ^= 1 << square
+        self.hash ^= PIECE_KEYS[color][pieceType][square] ^ PIECE_KEYS[color][newType][square]
+        self.material[color] += PIECE_VALUES[newType] - PIECE_VALUES[pieceType]
+        self.pieceSquare[color] += (PIECE_SQUARE_TABLES[(color * 6 + newType) * 64 + square]
+                                    - PIECE_SQUARE_TABLES[(color * 6 + pieceType) * 64 + square])
 
-        is_capture = move.captureType is not None
-        
+    def _make(self, move):
+        start, end = move & SQUARE_MASK, move >> TO_SHIFT & SQUARE_MASK
+        pieceType = move >> PIECE_SHIFT & TYPE_MASK
+        captured = move >> CAPTURE_SHIFT & TYPE_MASK
+        promotion = move >> PROMOTION_SHIFT & TYPE_MASK
+        color = self.active
 
-        if reverse and is_capture:
-            self.pieces.insert(p0, move.captureType, not color)
-            self.pieceTypes[move.captureType] |= p0
-            self.colors[not color] |= p0
-        
-        elif is_capture:
-            self.pieces.remove(p1, not color)
-            self.colors[not color] &= ~p1
-            if move.pieceType != move.captureType:
-                self.pieceTypes[move.captureType] &= ~p1
+        self.history.append((self.castling, self.enPassant, self.halfmoveClock, self.hash))
+
+        # A captured piece leaves before the mover arrives: the mailbox holds
+        # one piece per square
+        if captured:
+            captureSquare = end
+            if move & EN_PASSANT:
+                captureSquare = end - 8 if color == WHITE else end + 8
+            self._remove_piece(captured - 1, not color, captureSquare)
+
+        # The moving piece itself, inlined as every move has one
+        self.pieces.update(start, end)
+        squares = 1 << start | 1 << end
+        self.pieceTypes[pieceType] ^= squares
+        self.colors[color] ^= squares
+        keys = PIECE_KEYS[color][pieceType]
+        self.hash ^= keys[start] ^ keys[end]
+        table = (color * 6 + pieceType) * 64
+        self.pieceSquare[color] += PIECE_SQUARE_TABLES[table + end] - PIECE_SQUARE_TABLES[table + start]
+
+        if promotion:
+            self._change_piece(color, end, pieceType, promotion - 1)
+        elif move & CASTLE:
+            rookStart, rookEnd = CASTLING_ROOKS[end]
+            self._move_piece(3, color, rookStart, rookEnd)
+
+        # Swap the castling and en passant keys for the new rights and square
+        key = self.hash ^ CASTLING_KEYS[self.castling] ^ BLACK_TO_MOVE
+        if self.enPassant:
+            key ^= EN_PASSANT_KEYS[(self.enPassant.bit_length() - 1) & 7]
+
+        self.castling &= CASTLING_MASKS[start] & CASTLING_MASKS[end]
+        key ^= CASTLING_KEYS[self.castling]
+
+        if move & DOUBLE_PUSH:
+            passed = (start + end) >> 1
+            self.enPassant = 1 << passed
+            key ^= EN_PASSANT_KEYS[passed & 7]
+        else:
+            self.enPassant = 0
+        self.hash = key
+
+        self.halfmoveClock = 0 if pieceType == 0 or captured else self.halfmoveClock + 1
+        # The move number goes up once black has moved
+        self.fullmoveNumber += color
 
         self.occupied = self.colors[0] | self.colors[1]
 
         self.active = not self.active
 
         return self
+
+    def _unmake(self, move):
+        start, end = move & SQUARE_MASK, move >> TO_SHIFT & SQUARE_MASK
+        pieceType = move >> PIECE_SHIFT & TYPE_MASK
+        captured = move >> CAPTURE_SHIFT & TYPE_MASK
+        promotion = move >> PROMOTION_SHIFT & TYPE_MASK
+
+        self.active = not self.active
+        color = self.active
+
+        # Pieces go back in the reverse order they were moved
+        if promotion:
+            self._change_piece(color, end, promotion - 1, pieceType)
+        elif move & CASTLE:
+            rookStart, rookEnd = CASTLING_ROOKS[end]
+            self._move_piece(3, color, rookEnd, rookStart)
+
+        self.pieces.update(end, start)
+        squares = 1 << start | 1 << end
+        self.pieceTypes[pieceType] ^= squares
+        self.colors[color] ^= squares
+        table = (color * 6 + pieceType) * 64
+        self.pieceSquare[color] += PIECE_SQUARE_TABLES[table + start] - PIECE_SQUARE_TABLES[table + end]
+
+        if captured:
+            captureSquare = end
+            if move & EN_PASSANT:
+                captureSquare = end - 8 if color == WHITE else end + 8
+            self._put_piece(captured - 1, not color, captureSquare)
+
+        self.castling, self.enPassant, self.halfmoveClock, self.hash = self.history.pop()
+        self.fullmoveNumber -= color
+
+        self.occupied = self.colors[0] | self.colors[1]
+
+        return self
     
+    def make_null(self):
+        # Pass the turn without moving, for null move pruning. Only the side
+        # to move and the en passant square change.
+        self.history.append((self.castling, self.enPassant, self.halfmoveClock, self.hash))
+        key = self.hash ^ BLACK_TO_MOVE
+        if self.enPassant:
+            key ^= EN_PASSANT_KEYS[(self.enPassant.bit_length() - 1) & 7]
+            self.enPassant = 0
+        self.hash = key
+        self.active = not self.active
+        return self
+
+    def unmake_null(self):
+        self.active = not self.active
+        self.castling, self.enPassant, self.halfmoveClock, self.hash = self.history.pop()
+        return self
+
     def get_piece_type(self, piece):
-        for pieceType, pieceSet in enumerate(self.pieceTypes):
-            if piece & pieceSet != 0:
-                return pieceType
-        raise RuntimeError('Could not find piece type')
+        pieceType = self.pieces.piece_type(piece.bit_length() - 1)
+        if pieceType is None:
+            raise RuntimeError('Could not find piece type')
+        return pieceType
 
     def __str__(self):
         squares = ['.'] * 64  
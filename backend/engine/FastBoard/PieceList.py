@@ -1,13 +1,33 @@
+# Slot layout of a full set of pieces. A slot's type is only where it
+# starts: a slot takes the type of whatever piece is inserted into it and
+# changes type on promotion, so any mix of up to 16 pieces per color fits.
+SLOT_COLORS = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
+SLOT_TYPES =  [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 5, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 5]
+#              wp wp wp wp wp wp wp wp wn wn wb wb wr wr wq wk bp bp bp bp bp bp bp bp bn bn bb bb br br bq bk
+
+
 class PieceList(list):
-    def __init__(self, *args):
-        list.__init__(self, *args)
+    def __init__(self, pieces=(), types=None):
+        list.__init__(self, pieces)
         
-        self.colorCounts = [16, 16]
         self.colorRanges = [(0, 16), (16, 32)]
-        self.colorLookup = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1]
-        self.typeLookup =  [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 5, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 2, 2, 3, 3, 4, 5]
-        #                   wp wp wp wp wp wp wp wp wn wn wb wb wr wr wq wk bp bp bp bp bp bp bp bp bn bn bb bb br br bq bk
+        self.colorCounts = [sum(1 for piece in self[start:end] if piece != 0)
+                            for start, end in self.colorRanges]
+        self.colorLookup = SLOT_COLORS
+        self.typeLookup = list(SLOT_TYPES if types is None else types)
         self.numPieces = 32
+
+        # Mailbox from square to the slot holding its piece (-1 when empty),
+        # and the empty slots of each color, so moving, removing and inserting
+        # a piece never scans the list
+        self.slots = [-1] * 64
+        self.freeSlots = [[], []]
+        for index in reversed(range(self.numPieces)):
+            piece = self[index]
+            if piece == 0:
+                self.freeSlots[self.colorLookup[index]].append(index)
+            else:
+                self.slots[piece.bit_length() - 1] = index
         
     def __iter__(self):
         for index in range(self.numPieces):
@@ -25,36 +45,45 @@ class PieceList(list):
             yield piece, self.typeLookup[index]
             
             
-    def update(self, p0, p1, color):
-        start, end = self.colorRanges[color]
-        for index in range(start,end):
-            piece = self[index]
-            if piece == p0:
-                self[index] = p1
-                return self.typeLookup[index]
-        raise RuntimeError("Cannot update piece")
+    def update(self, start, end):
+        index = self.slots[start]
+        if index < 0:
+            raise RuntimeError("Cannot update piece")
+        self[index] = 1 << end
+        self.slots[start] = -1
+        self.slots[end] = index
+        return self.typeLookup[index]
     
-    def remove(self, piece, color):
+    def remove(self, square):
+        index = self.slots[square]
+        if index < 0:
+            raise RuntimeError(f'Cannot remove piece')
+        self[index] = 0
+        self.slots[square] = -1
+        color = self.colorLookup[index]
         self.colorCounts[color] -= 1
-        start,end = self.colorRanges[color]
-        for index in range(start,end):
-            if self[index] == piece:
-                self[index] = 0
-                return self.typeLookup[index]
-        raise RuntimeError(f'Cannot remove piece')
+        # Freed slots are reused last in, first out, so unmaking a capture
+        # puts the piece back in its old slot
+        self.freeSlots[color].append(index)
+        return self.typeLookup[index]
     
-    def insert(self, piece, pieceType, color):
+    def insert(self, square, pieceType, color):
+        freeSlots = self.freeSlots[color]
+        if not freeSlots:
+            raise RuntimeError(f'Cannot insert piece')
+        index = freeSlots.pop()
+        self[index] = 1 << square
+        self.typeLookup[index] = pieceType
+        self.slots[square] = index
         self.colorCounts[color] += 1
-        start,end = self.colorRanges[color]
-        for index in range(start,end):
-            indexCanStorePiece = self[index] == 0 \
-                            and self.typeLookup[index]  == pieceType \
-                            and self.colorLookup[index] == color
 
-            if indexCanStorePiece:
-                self[index] = piece
-                return
-        raise RuntimeError(f'Cannot insert piece')
+    def promote(self, square, pieceType):
+        self.typeLookup[self.slots[square]] = pieceType
+
+    def piece_type(self, square):
+        # Type of the piece on a square, None when it is empty
+        index = self.slots[square]
+        return self.typeLookup[index] if index >= 0 else None
 
     def size(self, color):
         return self.colorCounts[color]
\ No newline at end of file
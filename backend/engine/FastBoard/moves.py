@@ -0,0 +1,81 @@
+# Moves are packed into a single int so the search never allocates per move:
+#   bits 0-5    from square
+#   bits 6-11   to square
+#   bits 12-14  moving piece type
+#   bits 15-17  captured piece type + 1, 0 for a quiet move
+#   bits 18-20  promotion piece type + 1, 0 for none
+#   bit  21     color of the side moving
+#   bits 22-24  flags
+# Squares are bit indexes, h1 = 0 ... a8 = 63. Hot loops shift and mask
+# inline with these constants instead of calling the accessors below.
+
+TO_SHIFT = 6
+PIECE_SHIFT = 12
+CAPTURE_SHIFT = 15
+PROMOTION_SHIFT = 18
+COLOR_SHIFT = 21
+
+SQUARE_MASK = 0x3F
+TYPE_MASK = 0x7
+CAPTURE_MASK = TYPE_MASK << CAPTURE_SHIFT
+PROMOTION_MASK = TYPE_MASK << PROMOTION_SHIFT
+
+DOUBLE_PUSH = 1 << 22
+EN_PASSANT = 1 << 23
+CASTLE = 1 << 24
+
+FILES = 'hgfedcba'
+PROMOTION_LETTERS = 'pnbrqk'
+
+
+def encode(start, end, pieceType, color, captureType=None, promotion=None, flags=0):
+    move = start | end << TO_SHIFT | pieceType << PIECE_SHIFT | color << COLOR_SHIFT | flags
+    if captureType is not None:
+        move |= (captureType + 1) << CAPTURE_SHIFT
+    if promotion is not None:
+        move |= (promotion + 1) << PROMOTION_SHIFT
+    return move
+
+
+def move_start(move):
+    return move & SQUARE_MASK
+
+
+def move_end(move):
+    return move >> TO_SHIFT & SQUARE_MASK
+
+
+def move_piece(move):
+    return move >> PIECE_SHIFT & TYPE_MASK
+
+
+def move_capture(move):
+    captured = move >> CAPTURE_SHIFT & TYPE_MASK
+    return captured - 1 if captured else None
+
+
+def move_promotion(move):
+    promotion = move >> PROMOTION_SHIFT & TYPE_MASK
+    return promotion - 1 if promotion else None
+
+
+def move_color(move):
+    return move >> COLOR_SHIFT & 1
+
+
+def is_capture(move):
+    return move & CAPTURE_MASK != 0
+
+
+def square_name(square):
+    return f"{FILES[square & 7]}{(square >> 3) + 1}"
+
+
+def parse_square(name):
+    return (int(name[1]) - 1) * 8 + FILES.index(name[0])
+
+
+def move_name(move):
+    name = square_name(move_start(move)) + square_name(move_end(move))
+    promotion = move_promotion(move)
+    return name if promotion is None else name + PROMOTION_LETTERS[promotion]
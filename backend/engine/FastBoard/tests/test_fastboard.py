@@ -0,0 +1,123 @@
+import pytest
+
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import (encode, move_name, move_capture, move_promotion, parse_square,
+                                    CASTLE, EN_PASSANT, DOUBLE_PUSH)
+from engine.FastBoard.zobrist import hash_position
+from engine.constants import START_FEN
+from engine.utils import fen_to_bitboards
+
+
+def test_default_board_is_start_position():
+    assert FastBoard().pieces[:] == fen_to_bitboards(START_FEN)
+
+
+def test_hash_matches_recomputed_hash_after_moves():
+    board = FastBoard()
+    start = board.hash
+
+    moves = [encode(11, 27, 0, 0), encode(52, 36, 0, 1), encode(27, 36, 0, 0, 0)]
+
+    for move in moves:
+        board += move
+        assert board.hash == hash_position(board.pieces, board.active, board.castling, board.enPassant)
+
+    for move in reversed(moves):
+        board -= move
+        assert board.hash == hash_position(board.pieces, board.active, board.castling, board.enPassant)
+
+    assert board.hash == start
+
+
+def test_hash_depends_on_side_to_move():
+    assert FastBoard(active=0).hash != FastBoard(active=1).hash
+
+
+def test_serialize_round_trip_after_capture():
+    board = FastBoard()
+    board += encode(11, 27, 0, 0)
+    board += encode(52, 36, 0, 1)
+    board += encode(27, 36, 0, 0, 0)
+
+    copy = FastBoard.deserialize(board.serialize())
+
+    assert copy.hash == board.hash
+    assert copy.occupied == board.occupied
+    assert copy.active == board.active
+    assert copy.pieces.size(1) == board.pieces.size(1) == 15
+
+
+
+def test_move_encoding_round_trip():
+    move = encode(52, 60, 0, 0, captureType=3, promotion=4)
+
+    assert move_name(move) == 'd7d8q'
+    assert move_capture(move) == 3
+    assert move_promotion(move) == 4
+    assert move_capture(encode(11, 27, 0, 0)) is None
+
+
+def test_mailbox_follows_capture_and_unmake():
+    board = FastBoard()
+    moves = [encode(11, 27, 0, 0), encode(57, 42, 1, 1), encode(6, 21, 1, 0), encode(42, 27, 1, 1, 0)]
+
+    for move in moves:
+        board += move
+    assert board.get_piece_type(1 << 27) == 1
+    assert board.pieces.piece_type(21) == 1
+    assert board.pieces.piece_type(42) is None
+    assert board.pieces.size(0) == 15
+
+    for move in reversed(moves):
+        board -= move
+    for square in range(64):
+        index = board.pieces.slots[square]
+        assert (index >= 0) == bool(board.occupied >> square & 1)
+        assert index < 0 or board.pieces[index] == 1 << square
+
+
+@pytest.mark.parametrize("fen, move, expected", [
+    ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 3 10", encode(3, 1, 5, 0, flags=CASTLE),
+     "r3k2r/8/8/8/8/8/8/R4RK1 b kq - 4 10"),
+    ("r3k2r/8/8/8/8/8/8/R3K2R b KQkq - 0 10", encode(59, 61, 5, 1, flags=CASTLE),
+     "2kr3r/8/8/8/8/8/8/R3K2R w KQ - 1 11"),
+    ("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+     encode(parse_square("e5"), parse_square("f6"), 0, 0, 0, flags=EN_PASSANT),
+     "rnbqkbnr/ppp1p1pp/5P2/3p4/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 3"),
+    ("r3k3/1P6/8/8/8/8/8/4K3 w q - 0 40", encode(parse_square("b7"), parse_square("a8"), 0, 0, 3, promotion=1),
+     "N3k3/8/8/8/8/8/8/4K3 b - - 0 40"),
+    ("4k3/8/8/8/8/8/4P3/4K3 w - - 5 40", encode(parse_square("e2"), parse_square("e4"), 0, 0, flags=DOUBLE_PUSH),
+     "4k3/8/8/8/4P3/8/8/4K3 b - e3 0 40"),
+])
+def test_special_moves_make_and_unmake(fen, move, expected):
+    board = FastBoard.from_fen(fen)
+    start = board.hash, board.material[:], board.pieceSquare[:]
+
+    board += move
+    after = FastBoard.from_fen(expected)
+    assert board.make_fen() == expected
+    assert (board.hash, board.material, board.pieceSquare) == (after.hash, after.material, after.pieceSquare)
+
+    board -= move
+    assert board.make_fen() == fen
+    assert (board.hash, board.material, board.pieceSquare) == start
+
+
+def test_promoted_pieces_fit_the_piece_list():
+    board = FastBoard.from_fen("QQQQk3/8/8/8/8/8/8/QQQQK3 w - - 0 60")
+    copy = FastBoard.deserialize(board.serialize())
+
+    assert copy.make_fen() == board.make_fen()
+    assert bin(copy.pieceTypes[4]).count('1') == 8
+
+def test_null_move_passes_the_turn():
+    fen = "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3"
+    board = FastBoard.from_fen(fen)
+    start = board.hash
+
+    board.make_null()
+    assert board.hash == FastBoard.from_fen("rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 3").hash
+
+    board.unmake_null()
+    assert board.make_fen() == fen
+    assert board.hash == start
@@ -0,0 +1,28 @@
+from random import Random
+
+# Keys are drawn from a fixed seed so every process (and every restart) agrees
+# on the hash of a position.
+_random = Random(2024)
+
+# PIECE_KEYS[color][pieceType][square]
+PIECE_KEYS = [[[_random.getrandbits(64) for _ in range(64)] for _ in range(6)]
+              for _ in range(2)]
+BLACK_TO_MOVE = _random.getrandbits(64)
+
+# CASTLING_KEYS[castling rights], EN_PASSANT_KEYS[file of the en passant square]
+CASTLING_KEYS = [_random.getrandbits(64) for _ in range(16)]
+EN_PASSANT_KEYS = [_random.getrandbits(64) for _ in range(8)]
+
+
+def square(bitboard):
+    return bitboard.bit_length() - 1
+
+
+def hash_position(pieces, active, castling=0, enPassant=0):
+    key = BLACK_TO_MOVE if active else 0
+    for piece, pieceType, color in pieces:
+        key ^= PIECE_KEYS[color][pieceType][square(piece)]
+    key ^= CASTLING_KEYS[castling]
+    if enPassant:
+        key ^= EN_PASSANT_KEYS[square(enPassant) & 7]
+    return key
@@ -1,61 +1,41 @@
-from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.FastBoard import (FastBoard, WHITE_KINGSIDE, WHITE_QUEENSIDE,
+                                        BLACK_KINGSIDE, BLACK_QUEENSIDE)
 from engine.player import Player, BlackPlayer, WhitePlayer
 import engine.MoveGen as MoveGen
 from engine.MoveGen.magic import ROOK_MAGICS, BISHOP_MAGICS 
 from engine.constants import COLOR
 from engine.Position import Position
-import engine.MoveGen.setup as setup
-from queue import PriorityQueue
-from collections import namedtuple
-from engine.bitmanipulation.utils import lsb
-
-Move = namedtuple('Move', ('start', 'end', 'pieceType', 'color', 'captureType',
-                           'captureStrength', 'isPrincipleVariation'))
-
-class MovePQ(PriorityQueue):
-    def __init__(self):
-        super().__init__()
-        self.size = 0
-
-    def push(self, move):
-        if move.isPrincipleVariation:  priority = 0
-        elif move.captureType is None: priority = 6
-        elif move.captureStrength < 0: priority = 7
-        else:                          priority = 5-move.captureStrength
-
-        self.put((priority,move))
-        self.size += 1
-
-    def clear(self):
-        self.size = 0
-        super().clear()
-
-    def pop(self):
-        self.size -= 1
-        priority,move = self.get()
-        return move
-
-    def __len__(self):
-        return self.size
-    
-    def __str__(self):
-        temp_list = []
-        while not self.empty():
-            temp_list.append(self.get())
-
-        result = ""
-        for priority, move in temp_list:
-            result += f"{move.start} -> {move.end}, "
-            self.put((priority, move))
-
-        return result
+from engine.MoveGen.tables import (KNIGHT_ATTACKS, KING_ATTACKS, PAWN_PUSHES, PAWN_ATTACKS,
+                                    rook_attacks, bishop_attacks)
+from engine.MoveGen.MoveList import MoveList, PRINCIPLE_VARIATION_SCORE
+from engine.FastBoard.moves import (SQUARE_MASK, TYPE_MASK, TO_SHIFT, PIECE_SHIFT, CAPTURE_SHIFT,
+                                    PROMOTION_SHIFT, COLOR_SHIFT, DOUBLE_PUSH, EN_PASSANT, CASTLE)
+
+WHITE, BLACK = 0, 1
+FULL_BOARD = (1 << 64) - 1
+PAWN_START_RANKS = [0xFF00, 0xFF000000000000]
+PROMOTION_RANKS = 0xFF000000000000FF
+
+# Queen first, as it is nearly always the best promotion
+PROMOTION_TYPES = (4, 3, 2, 1)
+
+# Piece values for exchanges, in pawns. The king is worth more than anything
+# it could win, so it only takes last.
+EXCHANGE_VALUES = (1, 3, 3, 5, 9, 100)
+
+# Squares are numbered h1 = 0 ... a8 = 63.
+# Per color: right -> (king target, rook, squares that must be empty,
+# squares the king crosses that must not be attacked)
+CASTLING_KING = [1 << 3, 1 << 59]
+CASTLING_RIGHTS = [
+    {WHITE_KINGSIDE: (1 << 1, 1 << 0, 0x6, 0x6), WHITE_QUEENSIDE: (1 << 5, 1 << 7, 0x70, 0x30)},
+    {BLACK_KINGSIDE: (1 << 57, 1 << 56, 0x6 << 56, 0x6 << 56),
+     BLACK_QUEENSIDE: (1 << 61, 1 << 63, 0x70 << 56, 0x30 << 56)},
+]
 
 
 class Generator:
     def __init__(self):
-        self.masks = setup.load_move_masks()
-        self.moves, self.movesets = setup.Moves, setup.MoveSets
-        self.bishopMagic, self.rookMagic = setup.load_magic()
         self.principleVariations = {}
         
         
@@ -63,22 +43,29 @@ class Generator:
         attacks = [], []
         attackSets = [0] * 2
 
+        occupied = board.occupied
+
         for piece, pieceType, color in board.pieces:
+            # Tables are indexed by square; pieces are single bits
+            square = piece.bit_length() - 1
 
             if pieceType == 0:
-                pieceAttacks = self.movesets[pieceType][color][piece][1]
+                pieceAttacks = PAWN_ATTACKS[color * 64 + square]
+
+            elif pieceType == 1:
+                pieceAttacks = KNIGHT_ATTACKS[square]
 
-            elif pieceType == 5 or pieceType == 1:
-                pieceAttacks = self.movesets[pieceType][piece]
+            elif pieceType == 5:
+                pieceAttacks = KING_ATTACKS[square]
 
-            elif pieceType == 2 or pieceType == 3:
-                args = (piece, pieceType, board.occupied)
-                pieceAttacks = self.search_magic_cache(*args)
+            elif pieceType == 2:
+                pieceAttacks = bishop_attacks(square, occupied)
+
+            elif pieceType == 3:
+                pieceAttacks = rook_attacks(square, occupied)
 
             elif pieceType == 4:
-                straights = self.search_magic_cache(piece, 2, board.occupied)
-                diagonals = self.search_magic_cache(piece, 3, board.occupied)
-                pieceAttacks = straights | diagonals
+                pieceAttacks = bishop_attacks(square, occupied) | rook_attacks(square, occupied)
 
 
             attacks[color].append(pieceAttacks)
@@ -87,83 +74,345 @@ class Generator:
         return attacks, attackSets
 
     def search_magic_cache(self, piece, pieceType, occupied):
-        magic = self.bishopMagic if pieceType == 2 else self.rookMagic
-        blockers = magic.attacks[piece] & occupied
-        magicBitboard = magic.bitboards[piece]
-        numAttackIndices = magic.indices[piece]
-        magicKey = (blockers * magicBitboard) >> (64 - numAttackIndices)
-        return magic.cache[piece][magicKey]
-
-    def find_captures(self, board, attacks, attackSets):
-        return self.find_moves(board, attacks, attackSets, minCaptureStrength = -6)
-
-    def find_strong_captures(self, board, attacks, attackSets, findTrades=False):
-        return self.find_moves(board, attacks, attackSets,
-                            minCaptureStrength = 0 if findTrades else 1)
+        if pieceType == 2:
+            return bishop_attacks(piece.bit_length() - 1, occupied)
+        return rook_attacks(piece.bit_length() - 1, occupied)
+
+    def slider_attacks(self, piece, pieceType, occupied):
+        if pieceType == 4:
+            return self.search_magic_cache(piece, 2, occupied) | self.search_magic_cache(piece, 3, occupied)
+        return self.search_magic_cache(piece, pieceType, occupied)
+
+    def attackers_to(self, board, square, color, occupied):
+        # Pieces of `color` attacking `square`, with sliders seeing through
+        # anything missing from `occupied`
+        pieceTypes = board.pieceTypes
+        queens = pieceTypes[4]
+        index = square.bit_length() - 1
+        attackers = KING_ATTACKS[index] & pieceTypes[5]
+        attackers |= KNIGHT_ATTACKS[index] & pieceTypes[1]
+        attackers |= PAWN_ATTACKS[(not color) * 64 + index] & pieceTypes[0]
+        attackers |= bishop_attacks(index, occupied) & (pieceTypes[2] | queens)
+        attackers |= rook_attacks(index, occupied) & (pieceTypes[3] | queens)
+        return attackers & board.colors[color]
+
+    def between(self, a, b):
+        # Squares strictly between two squares on a shared line, 0 otherwise
+        for pieceType in (3, 2):
+            if self.search_magic_cache(a, pieceType, b) & b:
+                return self.search_magic_cache(a, pieceType, b) & self.search_magic_cache(b, pieceType, a)
+        return 0
+
+    def check_mask(self, board, king, color):
+        # Squares a non-king piece may move to: everything while not in check,
+        # the checker or a blocking square in single check, nothing in double check
+        checkers = self.attackers_to(board, king, not color, board.occupied)
+        if checkers == 0:
+            return FULL_BOARD
+        if checkers & (checkers - 1):
+            return 0
+        return checkers | self.between(king, checkers)
+
+    def pins(self, board, king, color):
+        # Each piece of `color` pinned to its king -> the line it is confined
+        # to, including its pinner. Snipers are found with the magic tables by
+        # looking from the king through its own pieces.
+        pins = {}
+        square = king.bit_length() - 1
+        enemies = board.colors[not color]
+        queens = board.pieceTypes[4]
+        snipers = rook_attacks(square, enemies) & (board.pieceTypes[3] | queens) & enemies
+        snipers |= bishop_attacks(square, enemies) & (board.pieceTypes[2] | queens) & enemies
+        while snipers:
+            sniper = snipers & -snipers
+            snipers ^= sniper
+            line = self.between(king, sniper)
+            blockers = line & board.occupied
+            if blockers & board.colors[color] and not blockers & (blockers - 1):
+                pins[blockers] = line | sniper
+        return pins
+
+    def en_passant_is_legal(self, board, piece, enPassant, king, color):
+        # Both pawns leave the rank at once, so check the king directly
+        # instead of trusting the masks
+        captured = enPassant >> 8 if color == WHITE else enPassant << 8
+        after = board.occupied ^ piece ^ captured | enPassant
+        return not king or not self.attackers_to(board, king, not color, after) & ~captured
+
+    def find_legal_targets(self, board, piece, castling=None, enPassant=None):
+        """Bitboard of every square the piece on `piece` can legally move to.
+
+        Castling rights and the en passant square are the board's own unless
+        the caller passes others.
+        """
+        castling = board.castling if castling is None else castling
+        enPassant = board.enPassant if enPassant is None else enPassant
+        color = WHITE if piece & board.colors[WHITE] else BLACK
+        pieceType = board.get_piece_type(piece)
+        friends = board.colors[color]
+        enemies = board.colors[not color]
+        occupied = board.occupied
+        king = board.pieceTypes[5] & friends
+
+        if pieceType == 5:
+            targets = KING_ATTACKS[piece.bit_length() - 1] & ~friends
+            legal = 0
+            while targets:
+                target = targets & -targets
+                targets ^= target
+                if not self.attackers_to(board, target, not color, occupied ^ piece):
+                    legal |= target
+            return legal | self.find_castles(board, piece, color, castling)
+
+        if pieceType == 0:
+            push = PAWN_PUSHES[color * 64 + piece.bit_length() - 1]
+            targets = push & ~occupied
+            if targets and piece & PAWN_START_RANKS[color]:
+                targets |= PAWN_PUSHES[color * 64 + push.bit_length() - 1] & ~occupied
+            attackSet = PAWN_ATTACKS[color * 64 + piece.bit_length() - 1]
+            targets |= attackSet & enemies
+        elif pieceType == 1:
+            targets = KNIGHT_ATTACKS[piece.bit_length() - 1] & ~friends
+        else:
+            targets = self.slider_attacks(piece, pieceType, occupied) & ~friends
+
+        if not king:
+            legal = targets
+        else:
+            legal = targets & self.check_mask(board, king, color) & self.pins(board, king, color).get(piece, FULL_BOARD)
+
+        if pieceType == 0 and enPassant & attackSet and self.en_passant_is_legal(board, piece, enPassant, king, color):
+            legal |= enPassant
+
+        return legal
+
+    def find_castles(self, board, king, color, castling):
+        rights = CASTLING_RIGHTS[color]
+        if king != CASTLING_KING[color] or not any(right & castling for right in rights):
+            return 0
+        if self.attackers_to(board, king, not color, board.occupied):
+            return 0
+
+        castles = 0
+        rooks = board.pieceTypes[3] & board.colors[color]
+        for right, (target, rook, path, transit) in rights.items():
+            if not right & castling or not rooks & rook or board.occupied & path:
+                continue
+            safe = True
+            while transit:
+                square = transit & -transit
+                transit ^= square
+                if self.attackers_to(board, square, not color, board.occupied):
+                    safe = False
+                    break
+            if safe:
+                castles |= target
+        return castles
+
+    def is_in_check(self, board, color=None):
+        color = board.active if color is None else color
+        king = board.pieceTypes[5] & board.colors[color]
+        return king != 0 and self.attackers_to(board, king, not color, board.occupied) != 0
+
+    def has_legal_move(self, board):
+        return any(self.find_legal_targets(board, piece) for piece, _ in board.pieces.get_color(board.active))
+
+    def legal_move(self, board, start, end, promotion=4):
+        """The packed move of the side to move from `start` to `end`, or None if it is illegal.
+
+        A pawn reaching the last rank promotes to `promotion`.
+        """
+        color = board.active
+        piece = 1 << start
+        if not board.colors[color] & piece or not self.find_legal_targets(board, piece) & 1 << end:
+            return None
+
+        pieceType = board.get_piece_type(piece)
+        move = start | end << TO_SHIFT | pieceType << PIECE_SHIFT | color << COLOR_SHIFT
+        if board.colors[not color] & 1 << end:
+            move |= (board.get_piece_type(1 << end) + 1) << CAPTURE_SHIFT
+
+        if pieceType == 5 and abs((start & 7) - (end & 7)) == 2:
+            move |= CASTLE
+        elif pieceType == 0:
+            if 1 << end == board.enPassant:
+                move |= 1 << CAPTURE_SHIFT | EN_PASSANT
+            elif abs(start - end) == 16:
+                move |= DOUBLE_PUSH
+            elif 1 << end & PROMOTION_RANKS:
+                move |= (promotion + 1) << PROMOTION_SHIFT
+        return move
 
-    def find_moves(self, board, attacks, attackSets, minCaptureStrength=None):
+    def find_captures(self, board, attacks, attackSets, moves=None):
+        return self.find_moves(board, attacks, attackSets, minCaptureStrength = -6, moves=moves)
+
+    def static_exchange(self, board, move):
+        """Material won by the side to move, in pawns, when `move` starts an
+        exchange on its target square and both sides keep recapturing with
+        their least valuable attacker for as long as it pays.
+
+        Sliders behind a capturing piece join in as it leaves, since the
+        attackers are found again with the shrinking occupancy each time.
+        """
+        start, end = move & SQUARE_MASK, move >> TO_SHIFT & SQUARE_MASK
+        captured = move >> CAPTURE_SHIFT & TYPE_MASK
+        target = 1 << end
+        pieceTypes = board.pieceTypes
+
+        occupied = board.occupied ^ 1 << start
+        if move & EN_PASSANT:
+            occupied ^= 1 << (end - 8 if board.active == WHITE else end + 8)
+
+        # gains[n]: what the side making capture n has won if the exchange stops there
+        gains = [EXCHANGE_VALUES[captured - 1] if captured else 0]
+        attackerValue = EXCHANGE_VALUES[move >> PIECE_SHIFT & TYPE_MASK]
+        color = not board.active
+        while True:
+            attackers = self.attackers_to(board, target, color, occupied) & occupied
+            if not attackers:
+                break
+
+            gains.append(attackerValue - gains[-1])
+            for pieceType in range(6):
+                leastValuable = attackers & pieceTypes[pieceType]
+                if leastValuable:
+                    break
+            occupied ^= leastValuable & -leastValuable
+            attackerValue = EXCHANGE_VALUES[pieceType]
+            color = not color
+
+        # Each side may stop recapturing when that is better for it
+        for index in range(len(gains) - 1, 0, -1):
+            gains[index - 1] = -max(-gains[index - 1], gains[index])
+        return gains[0]
+
+    def find_moves(self, board, attacks, attackSets, minCaptureStrength=None, moves=None):
+        """Legal moves of the side to move, as a MoveList of packed moves.
+        They are written into `moves` when given, replacing its contents.
+
+        Non-king moves are confined to the check mask and to their pin line,
+        and king moves to unattacked squares, so no move needs to be made
+        and tested afterwards.
+        """
         onlyCaptures = minCaptureStrength is not None
-        moves = MovePQ()
+        if moves is None:
+            moves = MoveList()
+        else:
+            moves.clear()
 
         color = board.active
+        principleVariation = self.principleVariations.get(board.hash)
         friends = board.colors[color]
         enemies = board.colors[not color]
         threatened = attackSets[not color]
 
         get_piece_rank = lambda pt: pt - 1 if pt >= 2 else pt
+        slots, typeLookup = board.pieces.slots, board.pieces.typeLookup
+
+        king = board.pieceTypes[5] & friends
+        checkers = self.attackers_to(board, king, not color, board.occupied) if king & threatened else 0
+        if not checkers:
+            checkMask = FULL_BOARD
+        elif checkers & (checkers - 1):
+            # Double check: only the king can move
+            checkMask = 0
+        else:
+            checkMask = checkers | self.between(king, checkers)
+        pins = self.pins(board, king, color) if king else {}
 
         pieceIndex = 0
         for piece, pieceType in board.pieces.get_color(color):
             
             pieceAttacks = attacks[color][pieceIndex]
             pieceIndex += 1
+
+            if checkMask == 0 and pieceType != 5:
+                continue
+            pieceMask = checkMask & pins[piece] if piece in pins else checkMask
+
+            # Fields shared by every move of this piece
+            start = piece.bit_length() - 1
+            base = start | pieceType << PIECE_SHIFT | color << COLOR_SHIFT
             
             if pieceType == 0:  # Pawn
-                moveset, attackSet = self.movesets[0][color][piece]
-                blocker = self.masks.pawnBlockers[color][piece]
-                pawnIsBlocked = blocker & board.occupied != 0
+                square = color * 64 + start
+                push = PAWN_PUSHES[square]
+                pawnIsBlocked = push & board.occupied != 0
 
                 # Single move forward
-                moveMask = 0 if pawnIsBlocked else moveset & ~board.occupied
+                moveMask = 0 if pawnIsBlocked else push
 
-                ind = lsb(piece)
                 # Double move forward
-                if not pawnIsBlocked and ((color == 1 and ind // 8 == 6) or (color == 0 and ind // 8 == 1)):
+                if not pawnIsBlocked and piece & PAWN_START_RANKS[color]:
                     # Check if the square two spaces ahead is also empty
-                    double_move_bitboard = 1 << (ind + (16 if color == 0 else -16))
+                    double_move_bitboard = PAWN_PUSHES[color * 64 + push.bit_length() - 1]
                     
-                    if not (double_move_bitboard & board.occupied):
-                        moves.push(Move(piece, double_move_bitboard, pieceType, color, None, None, False))
-
-                attackMask = attackSet & enemies
-                legalMoveMask = attackMask | moveMask
+                    if not (double_move_bitboard & board.occupied) and not onlyCaptures \
+                            and double_move_bitboard & pieceMask:
+                        move = base | (double_move_bitboard.bit_length() - 1) << TO_SHIFT | DOUBLE_PUSH
+                        moves.push(move, PRINCIPLE_VARIATION_SCORE if move == principleVariation else None)
+
+                attackMask = PAWN_ATTACKS[square] & enemies
+                legalMoveMask = (attackMask | moveMask) & pieceMask
+
+                # En passant takes a pawn of equal strength
+                if PAWN_ATTACKS[square] & board.enPassant and not (onlyCaptures and minCaptureStrength > 0) \
+                        and self.en_passant_is_legal(board, piece, board.enPassant, king, color):
+                    move = base | (board.enPassant.bit_length() - 1) << TO_SHIFT | 1 << CAPTURE_SHIFT | EN_PASSANT
+                    moves.push(move, PRINCIPLE_VARIATION_SCORE if move == principleVariation else None)
                 
             elif pieceType == 5:  # King logic considering threats
                 legalMoveMask = pieceAttacks & ~friends & ~threatened
+
+                # A checking slider also covers the squares behind the king,
+                # which the attack sets miss while the king blocks them
+                if checkers & ~(board.pieceTypes[0] | board.pieceTypes[1]):
+                    targets, legalMoveMask = legalMoveMask, 0
+                    while targets:
+                        target = targets & -targets
+                        targets ^= target
+                        if not self.attackers_to(board, target, not color, board.occupied ^ piece):
+                            legalMoveMask |= target
+
+                castles = 0 if onlyCaptures or checkers else self.find_castles(board, piece, color, board.castling)
+                while castles:
+                    target = castles & -castles
+                    castles ^= target
+                    move = base | (target.bit_length() - 1) << TO_SHIFT | CASTLE
+                    moves.push(move, PRINCIPLE_VARIATION_SCORE if move == principleVariation else None)
             else:
-                legalMoveMask = pieceAttacks & ~friends
-
-            cachedMoves = self.moves[pieceType][color][piece] if pieceType == 0 else self.moves[pieceType][piece]
-
-            for moveBitboard in cachedMoves:
-                if moveBitboard & legalMoveMask != 0:
-                    isACapture = moveBitboard & enemies != 0
-                    if isACapture:
-                        captureType = board.get_piece_type(moveBitboard)
-                        captureStrength = get_piece_rank(captureType) - get_piece_rank(pieceType)
-                        if onlyCaptures and (minCaptureStrength > captureStrength):
-                            continue
-                        move = Move(piece, moveBitboard, pieceType, color, captureType, captureStrength, False)
-                    else:
-                        if onlyCaptures:
-                            continue
-                        move = Move(piece, moveBitboard, pieceType, color, None, None, False)
-
-                    moves.push(move)
+                legalMoveMask = pieceAttacks & ~friends & pieceMask
+
+            # Walk the target bits directly rather than a per-square move list
+            while legalMoveMask:
+                moveBitboard = legalMoveMask & -legalMoveMask
+                legalMoveMask ^= moveBitboard
+
+                target = moveBitboard.bit_length() - 1
+                move = base | target << TO_SHIFT
+                isACapture = moveBitboard & enemies != 0
+                if isACapture:
+                    captureType = typeLookup[slots[target]]
+                    captureStrength = get_piece_rank(captureType) - get_piece_rank(pieceType)
+                    if onlyCaptures and (minCaptureStrength > captureStrength):
+                        continue
+                    move |= (captureType + 1) << CAPTURE_SHIFT
+                elif onlyCaptures:
+                    continue
+
+                if pieceType == 0 and moveBitboard & PROMOTION_RANKS:
+                    for promotion in PROMOTION_TYPES:
+                        promotionMove = move | (promotion + 1) << PROMOTION_SHIFT
+                        moves.push(promotionMove, PRINCIPLE_VARIATION_SCORE if promotionMove == principleVariation else None)
+                    continue
+
+                moves.push(move, PRINCIPLE_VARIATION_SCORE if move == principleVariation else None)
 
         return moves
 
 
 
     def set_a_principle_variation(self, board, move):
-        self.principleVariations[board] = move
\ No newline at end of file
+        # Keyed on the Zobrist key: the board object itself is mutated in place
+        # during search, so it cannot identify a position.
+        self.principleVariations[board.hash] = move
\ No newline at end of file
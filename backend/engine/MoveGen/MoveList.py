@@ -0,0 +1,76 @@
+from engine.FastBoard.moves import PIECE_SHIFT, CAPTURE_SHIFT, TYPE_MASK, move_name
+
+# Ordering scores, highest first: the principle variation, winning and even
+# captures by MVV-LVA, killers, counter moves, quiet moves (by history, below
+# COUNTER_MOVE_SCORE), then captures that give up material
+PRINCIPLE_VARIATION_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 20
+KILLER_SCORE = 1 << 19
+COUNTER_MOVE_SCORE = 1 << 18
+QUIET_SCORE = 0
+LOSING_CAPTURE_SCORE = -(1 << 20)
+
+# pawn, knight, bishop, rook, queen, king; knights and bishops rank equally
+PIECE_RANKS = [0, 1, 1, 2, 3, 4]
+
+# No position has more than 218 legal moves
+MAX_MOVES = 256
+
+
+def score_move(move):
+    captured = move >> CAPTURE_SHIFT & TYPE_MASK
+    if not captured:
+        return QUIET_SCORE
+
+    victim, attacker = PIECE_RANKS[captured - 1], PIECE_RANKS[move >> PIECE_SHIFT & TYPE_MASK]
+    # Most valuable victim first, least valuable attacker breaking ties
+    mvvLva = victim * 8 - attacker
+    return (CAPTURE_SCORE if victim >= attacker else LOSING_CAPTURE_SCORE) + mvvLva
+
+
+class MoveList():
+    """Moves with integer ordering scores, in slots allocated once.
+
+    The first `size` slots hold the moves. clear() only resets the count, so
+    the search keeps one list per ply and refills it at every node instead
+    of allocating new ones.
+
+    pop() selects the best remaining move rather than sorting up front, so a
+    node that cuts off after a move or two never pays to order the rest.
+    Iterating yields the moves in generation order.
+    """
+
+    def __init__(self, capacity=MAX_MOVES):
+        self.moves = [0] * capacity
+        self.scores = [0] * capacity
+        self.size = 0
+
+    def push(self, move, score=None):
+        size = self.size
+        self.moves[size] = move
+        self.scores[size] = score_move(move) if score is None else score
+        self.size = size + 1
+
+    def pop(self):
+        scores, moves = self.scores, self.moves
+        last = self.size - 1
+        best = scores.index(max(scores[:last + 1]))
+
+        # Fill the hole with the last move so removal stays O(1)
+        move = moves[best]
+        moves[best] = moves[last]
+        scores[best] = scores[last]
+        self.size = last
+        return move
+
+    def clear(self):
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.moves[:self.size])
+
+    def __str__(self):
+        return ', '.join(map(move_name, self))
@@ -0,0 +1,87 @@
+from random import Random
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+# Found with magic() below, one per square (bit index). Indices are
+# ((blockers & mask) * magic) & MASK_64 >> (64 - bits in the mask).
+ROOK_MAGICS = [
+    0x0880008020104000, 0x4040002000401004, 0x2080081000802001, 0x0480100082080004,
+    0x2200100420020008, 0x0200014428220050, 0x0200040081285200, 0x0200020040289401,
+    0x8060800020400086, 0x0004402000401000, 0x0002801000200080, 0x0000800800801000,
+    0x0000800400080080, 0x0008802200800400, 0x0401010002000401, 0x44130000408A0100,
+    0x0040008010802040, 0x2160008020401080, 0x3920004010080042, 0x2080848010000800,
+    0x4002020020100408, 0x0004008002000480, 0x002044002508109A, 0x008002000083046C,
+    0x1020400480248000, 0x0020100040004020, 0x0580100080802000, 0x0142001200084220,
+    0x0008008080080401, 0x8400040080020080, 0x0010880400500102, 0x2000140200008051,
+    0x0020800101002040, 0x0000816303004000, 0xC082200041001500, 0x0000800800801000,
+    0x9000110005004800, 0x2484001002020008, 0x0022000100408040, 0x0C01204102000084,
+    0x0840204000808000, 0x0040400020008080, 0x4090801042020020, 0x8014100023010008,
+    0x4084004080080800, 0x0411504440080120, 0x1000421011140088, 0x2071000282410036,
+    0x0060208001004B00, 0x2109104000208100, 0x0200801200402200, 0x0008210050010900,
+    0x0000800400080080, 0x0004008002000480, 0x00510002000C0500, 0x8120089410410200,
+    0x10101080006101C5, 0x0104192281004001, 0x0402102000090041, 0x2403000408201001,
+    0x0002014410204802, 0x140900080400020B, 0x200A504201008804, 0x8000082086410402,
+]
+
+BISHOP_MAGICS = [
+    0x00404800B10A0221, 0x0410040904103000, 0x0008020062010010, 0x0028084110108000,
+    0x0002021040010404, 0x00108220208E0108, 0x004108082C940000, 0x010C240602102200,
+    0x1000401001810100, 0xC000484840908E00, 0x0000104420444088, 0x1081092401012101,
+    0x0042111040007100, 0x0028084110108000, 0x01800A2804020910, 0xB428150400840400,
+    0x0040000822049406, 0x0010080401881103, 0x0148001000401020, 0x2010284104008000,
+    0x0010802404A04800, 0x0090400201100101, 0x0001000058181400, 0x200A504201008804,
+    0x22020A0020085001, 0x0022090220013400, 0x2011040140404A00, 0x1010040018440008,
+    0x004884000281A000, 0x0110004082080200, 0x0004004503091010, 0x2E010028A0420800,
+    0x0010080401881103, 0x0000882009080200, 0x40C4004110080200, 0x8140202020080080,
+    0x0890008200002200, 0x0081300080050800, 0x0022040040042200, 0x1408020080004848,
+    0x0002021040010404, 0x0010A80402161030, 0x0222002824000801, 0x0000304208004080,
+    0x0000204200807411, 0x2022140802021820, 0x080538008400C500, 0x000484820A080840,
+    0x004108082C940000, 0x28804A0084201800, 0x2581020042080800, 0x00000020C2088100,
+    0x1812211202020400, 0x00004028211900C2, 0x1449510908010050, 0x0410040904103000,
+    0x010C240602102200, 0xB428150400840400, 0x00000C0900880400, 0x010400020C208818,
+    0x00404800B10A0221, 0x0100000820082080, 0x1000401001810100, 0x00404800B10A0221,
+]
+
+
+
+def blocker_subsets(mask):
+    # Every subset of `mask`, walked with the carry-rippler trick
+    subset = 0
+    while True:
+        yield subset
+        subset = (subset - mask) & mask
+        if subset == 0:
+            return
+
+
+def magic(square, bits, isBishop, seed=None, attempts=1000000):
+    """Find a multiplier that maps every blocker set of `square` to a
+    `bits` wide index with no two different attack sets colliding."""
+    # Attack imports the magic numbers from this module
+    from engine.MoveGen import Attack
+
+    if isBishop:
+        mask, compute_moves = Attack.bishop_at(square), Attack.compute_bishop_moves
+    else:
+        mask, compute_moves = Attack.rook_at(square), Attack.compute_rook_moves
+
+    blockers = list(blocker_subsets(mask))
+    attacks = [compute_moves(square, blocker) for blocker in blockers]
+    shift = 64 - bits
+    random = Random(seed)
+
+    for _ in range(attempts):
+        # Sparse candidates make good magics far more often
+        candidate = random.getrandbits(64) & random.getrandbits(64) & random.getrandbits(64)
+        if bin((mask * candidate) & 0xFF00000000000000).count('1') < 6:
+            continue
+
+        table = {}
+        for blocker, attack in zip(blockers, attacks):
+            index = ((blocker * candidate) & MASK_64) >> shift
+            if table.setdefault(index, attack) != attack:
+                break
+        else:
+            return candidate
+
+    raise RuntimeError(f'No magic found for square {square}')
@@ -1,5197 +1,24 @@
-# list[list[dict]]
-MoveSets = [
-    [
-        {1: [1, 512],
-                 2: [2, 1280],
-                 4: [4, 2560],
-                 8: [8, 5120],
-                 16: [16, 10240],
-                 32: [32, 20480],
-                 64: [64, 40960],
-                 128: [128, 16384],
-                 256: [65792, 131072],
-                 512: [131584, 327680],
-                 1024: [263168, 655360],
-                 2048: [526336, 1310720],
-                 4096: [1052672, 2621440],
-                 8192: [2105344, 5242880],
-                 16384: [4210688, 10485760],
-                 32768: [8421376, 4194304],
-                 65536: [65536, 33554432],
-                 131072: [131072, 83886080],
-                 262144: [262144, 167772160],
-                 524288: [524288, 335544320],
-                 1048576: [1048576, 671088640],
-                 2097152: [2097152, 1342177280],
-                 4194304: [4194304, 2684354560],
-                 8388608: [8388608, 1073741824],
-                 16777216: [16777216, 8589934592],
-                 33554432: [33554432, 21474836480],
-                 67108864: [67108864, 42949672960],
-                 134217728: [134217728, 85899345920],
-                 268435456: [268435456, 171798691840],
-                 536870912: [536870912, 343597383680],
-                 1073741824: [1073741824, 687194767360],
-                 2147483648: [2147483648, 274877906944],
-                 4294967296: [4294967296, 2199023255552],
-                 8589934592: [8589934592, 5497558138880],
-                 17179869184: [17179869184, 10995116277760],
-                 34359738368: [34359738368, 21990232555520],
-                 68719476736: [68719476736, 43980465111040],
-                 137438953472: [137438953472, 87960930222080],
-                 274877906944: [274877906944, 175921860444160],
-                 549755813888: [549755813888, 70368744177664],
-                 1099511627776: [1099511627776, 562949953421312],
-                 2199023255552: [2199023255552, 1407374883553280],
-                 4398046511104: [4398046511104, 2814749767106560],
-                 8796093022208: [8796093022208, 5629499534213120],
-                 17592186044416: [17592186044416, 11258999068426240],
-                 35184372088832: [35184372088832, 22517998136852480],
-                 70368744177664: [70368744177664, 45035996273704960],
-                 140737488355328: [140737488355328, 18014398509481984],
-                 281474976710656: [281474976710656, 144115188075855872],
-                 562949953421312: [562949953421312, 360287970189639680],
-                 1125899906842624: [1125899906842624, 720575940379279360],
-                 2251799813685248: [2251799813685248, 1441151880758558720],
-                 4503599627370496: [4503599627370496, 2882303761517117440],
-                 9007199254740992: [9007199254740992, 5764607523034234880],
-                 18014398509481984: [18014398509481984, 11529215046068469760],
-                 36028797018963968: [36028797018963968, 4611686018427387904],
-                 72057594037927936: [72057594037927936, 0],
-                 144115188075855872: [144115188075855872, 0],
-                 288230376151711744: [288230376151711744, 0],
-                 576460752303423488: [576460752303423488, 0],
-                 1152921504606846976: [1152921504606846976, 0],
-                 2305843009213693952: [2305843009213693952, 0],
-                 4611686018427387904: [4611686018427387904, 0],
-                 9223372036854775808: [9223372036854775808, 0]},
-        {1: [1, 0],
-                 2: [2, 0],
-                 4: [4, 0],
-                 8: [8, 0],
-                 16: [16, 0],
-                 32: [32, 0],
-                 64: [64, 0],
-                 128: [128, 0],
-                 256: [256, 2],
-                 512: [512, 5],
-                 1024: [1024, 10],
-                 2048: [2048, 20],
-                 4096: [4096, 40],
-                 8192: [8192, 80],
-                 16384: [16384, 160],
-                 32768: [32768, 64],
-                 65536: [65536, 512],
-                 131072: [131072, 1280],
-                 262144: [262144, 2560],
-                 524288: [524288, 5120],
-                 1048576: [1048576, 10240],
-                 2097152: [2097152, 20480],
-                 4194304: [4194304, 40960],
-                 8388608: [8388608, 16384],
-                 16777216: [16777216, 131072],
-                 33554432: [33554432, 327680],
-                 67108864: [67108864, 655360],
-                 134217728: [134217728, 1310720],
-                 268435456: [268435456, 2621440],
-                 536870912: [536870912, 5242880],
-                 1073741824: [1073741824, 10485760],
-                 2147483648: [2147483648, 4194304],
-                 4294967296: [4294967296, 33554432],
-                 8589934592: [8589934592, 83886080],
-                 17179869184: [17179869184, 167772160],
-                 34359738368: [34359738368, 335544320],
-                 68719476736: [68719476736, 671088640],
-                 137438953472: [137438953472, 1342177280],
-                 274877906944: [274877906944, 2684354560],
-                 549755813888: [549755813888, 1073741824],
-                 1099511627776: [1099511627776, 8589934592],
-                 2199023255552: [2199023255552, 21474836480],
-                 4398046511104: [4398046511104, 42949672960],
-                 8796093022208: [8796093022208, 85899345920],
-                 17592186044416: [17592186044416, 171798691840],
-                 35184372088832: [35184372088832, 343597383680],
-                 70368744177664: [70368744177664, 687194767360],
-                 140737488355328: [140737488355328, 274877906944],
-                 281474976710656: [282574488338432, 2199023255552],
-                 562949953421312: [565148976676864, 5497558138880],
-                 1125899906842624: [1130297953353728, 10995116277760],
-                 2251799813685248: [2260595906707456, 21990232555520],
-                 4503599627370496: [4521191813414912, 43980465111040],
-                 9007199254740992: [9042383626829824, 87960930222080],
-                 18014398509481984: [18084767253659648, 175921860444160],
-                 36028797018963968: [36169534507319296, 70368744177664],
-                 72057594037927936: [72057594037927936, 562949953421312],
-                 144115188075855872: [144115188075855872, 1407374883553280],
-                 288230376151711744: [288230376151711744, 2814749767106560],
-                 576460752303423488: [576460752303423488, 5629499534213120],
-                 1152921504606846976: [1152921504606846976, 11258999068426240],
-                 2305843009213693952: [2305843009213693952, 22517998136852480],
-                 4611686018427387904: [4611686018427387904, 45035996273704960],
-                 9223372036854775808: [9223372036854775808,
-                                       18014398509481984]}],
-        {
-            1: 132096,
-            2: 329728,
-            4: 659712,
-            8: 1319424,
-            16: 2638848,
-            32: 5277696,
-            64: 10489856,
-            128: 4202496,
-            256: 33816580,
-            512: 84410376,
-            1024: 168886289,
-            2048: 337772578,
-            4096: 675545156,
-            8192: 1351090312,
-            16384: 2685403152,
-            32768: 1075839008,
-            65536: 8657044482,
-            131072: 21609056261,
-            262144: 43234889994,
-            524288: 86469779988,
-            1048576: 172939559976,
-            2097152: 345879119952,
-            4194304: 687463207072,
-            8388608: 275414786112,
-            16777216: 2216203387392,
-            33554432: 5531918402816,
-            67108864: 11068131838464,
-            134217728: 22136263676928,
-            268435456: 44272527353856,
-            536870912: 88545054707712,
-            1073741824: 175990581010432,
-            2147483648: 70506185244672,
-            4294967296: 567348067172352,
-            8589934592: 1416171111120896,
-            17179869184: 2833441750646784,
-            34359738368: 5666883501293568,
-            68719476736: 11333767002587136,
-            137438953472: 22667534005174272,
-            274877906944: 45053588738670592,
-            549755813888: 18049583422636032,
-            1099511627776: 145241105196122112,
-            2199023255552: 362539804446949376,
-            4398046511104: 725361088165576704,
-            8796093022208: 1450722176331153408,
-            17592186044416: 2901444352662306816,
-            35184372088832: 5802888705324613632,
-            70368744177664: 11533718717099671552,
-            140737488355328: 4620693356194824192,
-            281474976710656: 288234782788157440,
-            562949953421312: 576469569871282176,
-            1125899906842624: 1224997833292120064,
-            2251799813685248: 2449995666584240128,
-            4503599627370496: 4899991333168480256,
-            9007199254740992: 9799982666336960512,
-            18014398509481984: 1152939783987658752,
-            36028797018963968: 2305878468463689728,
-            72057594037927936: 1128098930098176,
-            144115188075855872: 2257297371824128,
-            288230376151711744: 4796069720358912,
-            576460752303423488: 9592139440717824,
-            1152921504606846976: 19184278881435648,
-            2305843009213693952: 38368557762871296,
-            4611686018427387904: 4679521487814656,
-            9223372036854775808: 9077567998918656
-        },
-        {1: 9241421688590303744,
-                2: 36099303471056128,
-                4: 141012904249856,
-                8: 550848566272,
-                16: 6480472064,
-                32: 1108177604608,
-                64: 283691315142656,
-                128: 72624976668147712,
-                256: 4620710844295151618,
-                512: 9241421688590368773,
-                1024: 36099303487963146,
-                2048: 141017232965652,
-                4096: 1659000848424,
-                8192: 283693466779728,
-                16384: 72624976676520096,
-                32768: 145249953336262720,
-                65536: 2310355422147510788,
-                131072: 4620710844311799048,
-                262144: 9241421692918565393,
-                524288: 36100411639206946,
-                1048576: 424704217196612,
-                2097152: 72625527495610504,
-                4194304: 145249955479592976,
-                8388608: 290499906664153120,
-                16777216: 1155177711057110024,
-                33554432: 2310355426409252880,
-                67108864: 4620711952330133792,
-                134217728: 9241705379636978241,
-                268435456: 108724279602332802,
-                536870912: 145390965166737412,
-                1073741824: 290500455356698632,
-                2147483648: 580999811184992272,
-                4294967296: 577588851267340304,
-                8589934592: 1155178802063085600,
-                17179869184: 2310639079102947392,
-                34359738368: 4693335752243822976,
-                68719476736: 9386671504487645697,
-                137438953472: 326598935265674242,
-                274877906944: 581140276476643332,
-                549755813888: 1161999073681608712,
-                1099511627776: 288793334762704928,
-                2199023255552: 577868148797087808,
-                4398046511104: 1227793891648880768,
-                8796093022208: 2455587783297826816,
-                17592186044416: 4911175566595588352,
-                35184372088832: 9822351133174399489,
-                70368744177664: 1197958188344280066,
-                140737488355328: 2323857683139004420,
-                281474976710656: 144117404414255168,
-                562949953421312: 360293502378066048,
-                1125899906842624: 720587009051099136,
-                2251799813685248: 1441174018118909952,
-                4503599627370496: 2882348036221108224,
-                9007199254740992: 5764696068147249408,
-                18014398509481984: 11529391036782871041,
-                36028797018963968: 4611756524879479810,
-                72057594037927936: 567382630219904,
-                144115188075855872: 1416240237150208,
-                288230376151711744: 2833579985862656,
-                576460752303423488: 5667164249915392,
-                1152921504606846976: 11334324221640704,
-                2305843009213693952: 22667548931719168,
-                4611686018427387904: 45053622886727936,
-                9223372036854775808: 18049651735527937},
-        {1: 72340172838076926,
-                2: 144680345676153597,
-                4: 289360691352306939,
-                8: 578721382704613623,
-                16: 1157442765409226991,
-                32: 2314885530818453727,
-                64: 4629771061636907199,
-                128: 9259542123273814143,
-                256: 72340172838141441,
-                512: 144680345676217602,
-                1024: 289360691352369924,
-                2048: 578721382704674568,
-                4096: 1157442765409283856,
-                8192: 2314885530818502432,
-                16384: 4629771061636939584,
-                32768: 9259542123273813888,
-                65536: 72340172854657281,
-                131072: 144680345692602882,
-                262144: 289360691368494084,
-                524288: 578721382720276488,
-                1048576: 1157442765423841296,
-                2097152: 2314885530830970912,
-                4194304: 4629771061645230144,
-                8388608: 9259542123273748608,
-                16777216: 72340177082712321,
-                33554432: 144680349887234562,
-                67108864: 289360695496279044,
-                134217728: 578721386714368008,
-                268435456: 1157442769150545936,
-                536870912: 2314885534022901792,
-                1073741824: 4629771063767613504,
-                2147483648: 9259542123257036928,
-                4294967296: 72341259464802561,
-                8589934592: 144681423712944642,
-                17179869184: 289361752209228804,
-                34359738368: 578722409201797128,
-                68719476736: 1157443723186933776,
-                137438953472: 2314886351157207072,
-                274877906944: 4629771607097753664,
-                549755813888: 9259542118978846848,
-                1099511627776: 72618349279904001,
-                2199023255552: 144956323094725122,
-                4398046511104: 289632270724367364,
-                8796093022208: 578984165983651848,
-                17592186044416: 1157687956502220816,
-                35184372088832: 2315095537539358752,
-                70368744177664: 4629910699613634624,
-                140737488355328: 9259541023762186368,
-                281474976710656: 143553341945872641,
-                562949953421312: 215330564830528002,
-                1125899906842624: 358885010599838724,
-                2251799813685248: 645993902138460168,
-                4503599627370496: 1220211685215703056,
-                9007199254740992: 2368647251370188832,
-                18014398509481984: 4665518383679160384,
-                36028797018963968: 9259260648297103488,
-                72057594037927936: 18302911464433844481,
-                144115188075855872: 18231136449196065282,
-                288230376151711744: 18087586418720506884,
-                576460752303423488: 17800486357769390088,
-                1152921504606846976: 17226286235867156496,
-                2305843009213693952: 16077885992062689312,
-                4611686018427387904: 13781085504453754944,
-                9223372036854775808: 9187484529235886208},
-        {1: 9313761861428380670,
-                2: 180779649147209725,
-                4: 289501704256556795,
-                8: 578721933553179895,
-                16: 1157442771889699055,
-                32: 2314886638996058335,
-                64: 4630054752952049855,
-                128: 9332167099941961855,
-                256: 4693051017133293059,
-                512: 9386102034266586375,
-                1024: 325459994840333070,
-                2048: 578862399937640220,
-                4096: 1157444424410132280,
-                8192: 2315169224285282160,
-                16384: 4702396038313459680,
-                32768: 9404792076610076608,
-                65536: 2382695595002168069,
-                131072: 4765391190004401930,
-                262144: 9530782384287059477,
-                524288: 614821794359483434,
-                1048576: 1157867469641037908,
-                2097152: 2387511058326581416,
-                4194304: 4775021017124823120,
-                8388608: 9550042029937901728,
-                16777216: 1227517888139822345,
-                33554432: 2455035776296487442,
-                67108864: 4910072647826412836,
-                134217728: 9820426766351346249,
-                268435456: 1266167048752878738,
-                536870912: 2460276499189639204,
-                1073741824: 4920271519124312136,
-                2147483648: 9840541934442029200,
-                4294967296: 649930110732142865,
-                8589934592: 1299860225776030242,
-                17179869184: 2600000831312176196,
-                34359738368: 5272058161445620104,
-                68719476736: 10544115227674579473,
-                137438953472: 2641485286422881314,
-                274877906944: 5210911883574396996,
-                549755813888: 10421541192660455560,
-                1099511627776: 361411684042608929,
-                2199023255552: 722824471891812930,
-                4398046511104: 1517426162373248132,
-                8796093022208: 3034571949281478664,
-                17592186044416: 6068863523097809168,
-                35184372088832: 12137446670713758241,
-                70368744177664: 5827868887957914690,
-                140737488355328: 11583398706901190788,
-                281474976710656: 287670746360127809,
-                562949953421312: 575624067208594050,
-                1125899906842624: 1079472019650937860,
-                2251799813685248: 2087167920257370120,
-                4503599627370496: 4102559721436811280,
-                9007199254740992: 8133343319517438240,
-                18014398509481984: 16194909420462031425,
-                36028797018963968: 13871017173176583298,
-                72057594037927936: 18303478847064064385,
-                144115188075855872: 18232552689433215490,
-                288230376151711744: 18090419998706369540,
-                576460752303423488: 17806153522019305480,
-                1152921504606846976: 17237620560088797200,
-                2305843009213693952: 16100553540994408480,
-                4611686018427387904: 13826139127340482880,
-                9223372036854775808: 9205534180971414145},
-        {1: 0,
-                2: 0,
-                4: 0,
-                8: 0,
-                16: 0,
-                32: 0,
-                64: 0,
-                128: 0,
-                256: 0,
-                512: 0,
-                1024: 0,
-                2048: 0,
-                4096: 0,
-                8192: 0,
-                16384: 0,
-                32768: 0,
-                65536: 0,
-                131072: 0,
-                262144: 0,
-                524288: 0,
-                1048576: 0,
-                2097152: 0,
-                4194304: 0,
-                8388608: 0,
-                16777216: 0,
-                33554432: 0,
-                67108864: 0,
-                134217728: 0,
-                268435456: 0,
-                536870912: 0,
-                1073741824: 0,
-                2147483648: 0,
-                4294967296: 0,
-                8589934592: 0,
-                17179869184: 0,
-                34359738368: 0,
-                68719476736: 0,
-                137438953472: 0,
-                274877906944: 0,
-                549755813888: 0,
-                1099511627776: 0,
-                2199023255552: 0,
-                4398046511104: 0,
-                8796093022208: 0,
-                17592186044416: 0,
-                35184372088832: 0,
-                70368744177664: 0,
-                140737488355328: 0,
-                281474976710656: 0,
-                562949953421312: 0,
-                1125899906842624: 0,
-                2251799813685248: 0,
-                4503599627370496: 0,
-                9007199254740992: 0,
-                18014398509481984: 0,
-                36028797018963968: 0,
-                72057594037927936: 0,
-                144115188075855872: 0,
-                288230376151711744: 0,
-                576460752303423488: 0,
-                1152921504606846976: 0,
-                2305843009213693952: 0,
-                4611686018427387904: 0,
-                9223372036854775808: 0}
-        ]
-
+from collections import namedtuple
 
-Moves = [
-    [{1: [256, 512, 1], 2: [512, 1024, 256, 2], 4: [1024, 2048, 512, 4], 8: [2048, 4096, 1024, 8], 16: [4096, 8192, 2048, 16], 32: [8192, 16384, 4096, 32], 64: [16384, 32768, 8192, 64], 128: [32768, 16384, 128], 256: [65536, 131072, 256], 512: [131072, 262144, 65536, 512], 1024: [262144, 524288, 131072, 1024], 2048: [524288, 1048576, 262144, 2048], 4096: [1048576, 2097152, 524288, 4096], 8192: [2097152, 4194304, 1048576, 8192], 16384: [4194304, 8388608, 2097152, 16384], 32768: [8388608, 4194304, 32768], 65536: [16777216, 33554432, 65536], 131072: [33554432, 67108864, 16777216, 131072], 262144: [67108864, 134217728, 33554432, 262144], 524288: [134217728, 268435456, 67108864, 524288], 1048576: [268435456, 536870912, 134217728, 1048576], 2097152: [536870912, 1073741824, 268435456, 2097152], 4194304: [1073741824, 2147483648, 536870912, 4194304], 8388608: [2147483648, 1073741824, 8388608], 16777216: [4294967296, 8589934592, 16777216], 33554432: [8589934592, 17179869184, 4294967296, 33554432], 67108864: [17179869184, 34359738368, 8589934592, 67108864], 134217728: [34359738368, 68719476736, 17179869184, 134217728], 268435456: [68719476736, 137438953472, 34359738368, 268435456], 536870912: [137438953472, 274877906944, 68719476736, 536870912], 1073741824: [274877906944, 549755813888, 137438953472, 1073741824], 2147483648: [549755813888, 274877906944, 2147483648], 4294967296: [1099511627776, 2199023255552, 4294967296], 8589934592: [2199023255552, 4398046511104, 1099511627776, 8589934592], 17179869184: [4398046511104, 8796093022208, 2199023255552, 17179869184], 34359738368: [8796093022208, 17592186044416, 4398046511104, 34359738368], 68719476736: [17592186044416, 35184372088832, 8796093022208, 68719476736], 137438953472: [35184372088832, 70368744177664, 17592186044416, 137438953472], 274877906944: [70368744177664, 140737488355328, 35184372088832, 274877906944], 549755813888: [140737488355328, 70368744177664, 549755813888], 1099511627776: [281474976710656, 562949953421312, 1099511627776], 2199023255552: [562949953421312, 1125899906842624, 281474976710656, 2199023255552], 4398046511104: [1125899906842624, 2251799813685248, 562949953421312, 4398046511104], 8796093022208: [2251799813685248, 4503599627370496, 1125899906842624, 8796093022208], 17592186044416: [4503599627370496, 9007199254740992, 2251799813685248, 17592186044416], 35184372088832: [9007199254740992, 18014398509481984, 4503599627370496, 35184372088832], 70368744177664: [18014398509481984, 36028797018963968, 9007199254740992, 70368744177664], 140737488355328: [36028797018963968, 18014398509481984, 140737488355328], 281474976710656: [72057594037927936, 144115188075855872, 281474976710656], 562949953421312: [144115188075855872, 288230376151711744, 72057594037927936, 562949953421312], 1125899906842624: [288230376151711744, 576460752303423488, 144115188075855872, 1125899906842624], 2251799813685248: [576460752303423488, 1152921504606846976, 288230376151711744, 2251799813685248], 4503599627370496: [1152921504606846976, 2305843009213693952, 576460752303423488, 4503599627370496], 9007199254740992: [2305843009213693952, 4611686018427387904, 1152921504606846976, 9007199254740992], 18014398509481984: [4611686018427387904, 9223372036854775808, 2305843009213693952, 18014398509481984], 36028797018963968: [9223372036854775808, 4611686018427387904, 36028797018963968], 72057594037927936: [36893488147419103232, 72057594037927936], 144115188075855872: [73786976294838206464, 18446744073709551616, 144115188075855872], 288230376151711744: [147573952589676412928, 36893488147419103232, 288230376151711744], 576460752303423488: [295147905179352825856, 73786976294838206464, 576460752303423488], 1152921504606846976: [590295810358705651712, 147573952589676412928, 1152921504606846976], 2305843009213693952: [1180591620717411303424, 295147905179352825856, 2305843009213693952], 4611686018427387904: [2361183241434822606848, 590295810358705651712, 4611686018427387904], 9223372036854775808: [1180591620717411303424, 9223372036854775808]},
-            {1: [1], 2: [2], 4: [4], 8: [8], 16: [16], 32: [32], 64: [64], 128: [128], 256: [1, 2, 256], 512: [2, 1, 4, 512], 1024: [4, 2, 8, 1024], 2048: [8, 4, 16, 2048], 4096: [16, 8, 32, 4096], 8192: [32, 16, 64, 8192], 16384: [64, 32, 128, 16384], 32768: [128, 64, 32768], 65536: [256, 512, 65536], 131072: [512, 256, 1024, 131072], 262144: [1024, 512, 2048, 262144], 524288: [2048, 1024, 4096, 524288], 1048576: [4096, 2048, 8192, 1048576], 2097152: [8192, 4096, 16384, 2097152], 4194304: [16384, 8192, 32768, 4194304], 8388608: [32768, 16384, 8388608], 16777216: [65536, 131072, 16777216], 33554432: [131072, 65536, 262144, 33554432], 67108864: [262144, 131072, 524288, 67108864], 134217728: [524288, 262144, 1048576, 134217728], 268435456: [1048576, 524288, 2097152, 268435456], 536870912: [2097152, 1048576, 4194304, 536870912], 1073741824: [4194304, 2097152, 8388608, 1073741824], 2147483648: [8388608, 4194304, 2147483648], 4294967296: [16777216, 33554432, 4294967296], 8589934592: [33554432, 16777216, 67108864, 8589934592], 17179869184: [67108864, 33554432, 134217728, 17179869184], 34359738368: [134217728, 67108864, 268435456, 34359738368], 68719476736: [268435456, 134217728, 536870912, 68719476736], 137438953472: [536870912, 268435456, 1073741824, 137438953472], 274877906944: [1073741824, 536870912, 2147483648, 274877906944], 549755813888: [2147483648, 1073741824, 549755813888], 1099511627776: [4294967296, 8589934592, 1099511627776], 2199023255552: [8589934592, 4294967296, 17179869184, 2199023255552], 4398046511104: [17179869184, 8589934592, 34359738368, 4398046511104], 8796093022208: [34359738368, 17179869184, 68719476736, 8796093022208], 17592186044416: [68719476736, 34359738368, 137438953472, 17592186044416], 35184372088832: [137438953472, 68719476736, 274877906944, 35184372088832], 70368744177664: [274877906944, 137438953472, 549755813888, 70368744177664], 140737488355328: [549755813888, 274877906944, 140737488355328], 281474976710656: [1099511627776, 2199023255552, 281474976710656], 562949953421312: [2199023255552, 1099511627776, 4398046511104, 562949953421312], 1125899906842624: [4398046511104, 2199023255552, 8796093022208, 1125899906842624], 2251799813685248: [8796093022208, 4398046511104, 17592186044416, 2251799813685248], 4503599627370496: [17592186044416, 8796093022208, 35184372088832, 4503599627370496], 9007199254740992: [35184372088832, 17592186044416, 70368744177664, 9007199254740992], 18014398509481984: [70368744177664, 35184372088832, 140737488355328, 18014398509481984], 36028797018963968: [140737488355328, 70368744177664, 36028797018963968], 72057594037927936: [281474976710656, 562949953421312, 72057594037927936], 144115188075855872: [562949953421312, 281474976710656, 1125899906842624, 144115188075855872], 288230376151711744: [1125899906842624, 562949953421312, 2251799813685248, 288230376151711744], 576460752303423488: [2251799813685248, 1125899906842624, 4503599627370496, 576460752303423488], 1152921504606846976: [4503599627370496, 2251799813685248, 9007199254740992, 1152921504606846976], 2305843009213693952: [9007199254740992, 4503599627370496, 18014398509481984, 2305843009213693952], 4611686018427387904: [18014398509481984, 9007199254740992, 36028797018963968, 4611686018427387904], 9223372036854775808: [36028797018963968, 18014398509481984, 9223372036854775808]}],
-           {1: [131072, 1024],
-            2: [262144, 2048, 65536],
-            4: [524288, 4096, 131072, 256],
-            8: [1048576, 8192, 262144, 512],
-            16: [2097152, 16384, 524288, 1024],
-            32: [4194304, 32768, 1048576, 2048],
-            64: [8388608, 2097152, 4096],
-            128: [4194304, 8192],
-            256: [4, 33554432, 262144],
-            512: [8, 67108864, 524288, 16777216],
-            1024: [16, 1, 134217728, 1048576, 33554432, 65536],
-            2048: [32, 2, 268435456, 2097152, 67108864, 131072],
-            4096: [64, 4, 536870912, 4194304, 134217728, 262144],
-            8192: [128, 8, 1073741824, 8388608, 268435456, 524288],
-            16384: [16, 2147483648, 536870912, 1048576],
-            32768: [32, 1073741824, 2097152],
-            65536: [2, 1024, 8589934592, 67108864],
-            131072: [4, 2048, 1, 17179869184, 134217728, 4294967296],
-            262144: [8,
-                     4096,
-                     2,
-                     256,
-                     34359738368,
-                     268435456,
-                     8589934592,
-                     16777216],
-            524288: [16,
-                     8192,
-                     4,
-                     512,
-                     68719476736,
-                     536870912,
-                     17179869184,
-                     33554432],
-            1048576: [32,
-                      16384,
-                      8,
-                      1024,
-                      137438953472,
-                      1073741824,
-                      34359738368,
-                      67108864],
-            2097152: [64,
-                      32768,
-                      16,
-                      2048,
-                      274877906944,
-                      2147483648,
-                      68719476736,
-                      134217728],
-            4194304: [128, 32, 4096, 549755813888, 137438953472, 268435456],
-            8388608: [64, 8192, 274877906944, 536870912],
-            16777216: [512, 262144, 2199023255552, 17179869184],
-            33554432: [1024,
-                       524288,
-                       256,
-                       4398046511104,
-                       34359738368,
-                       1099511627776],
-            67108864: [2048,
-                       1048576,
-                       512,
-                       65536,
-                       8796093022208,
-                       68719476736,
-                       2199023255552,
-                       4294967296],
-            134217728: [4096,
-                        2097152,
-                        1024,
-                        131072,
-                        17592186044416,
-                        137438953472,
-                        4398046511104,
-                        8589934592],
-            268435456: [8192,
-                        4194304,
-                        2048,
-                        262144,
-                        35184372088832,
-                        274877906944,
-                        8796093022208,
-                        17179869184],
-            536870912: [16384,
-                        8388608,
-                        4096,
-                        524288,
-                        70368744177664,
-                        549755813888,
-                        17592186044416,
-                        34359738368],
-            1073741824: [32768,
-                         8192,
-                         1048576,
-                         140737488355328,
-                         35184372088832,
-                         68719476736],
-            2147483648: [16384, 2097152, 70368744177664, 137438953472],
-            4294967296: [131072, 67108864, 562949953421312, 4398046511104],
-            8589934592: [262144,
-                         134217728,
-                         65536,
-                         1125899906842624,
-                         8796093022208,
-                         281474976710656],
-            17179869184: [524288,
-                          268435456,
-                          131072,
-                          16777216,
-                          2251799813685248,
-                          17592186044416,
-                          562949953421312,
-                          1099511627776],
-            34359738368: [1048576,
-                          536870912,
-                          262144,
-                          33554432,
-                          4503599627370496,
-                          35184372088832,
-                          1125899906842624,
-                          2199023255552],
-            68719476736: [2097152,
-                          1073741824,
-                          524288,
-                          67108864,
-                          9007199254740992,
-                          70368744177664,
-                          2251799813685248,
-                          4398046511104],
-            137438953472: [4194304,
-                           2147483648,
-                           1048576,
-                           134217728,
-                           18014398509481984,
-                           140737488355328,
-                           4503599627370496,
-                           8796093022208],
-            274877906944: [8388608,
-                           2097152,
-                           268435456,
-                           36028797018963968,
-                           9007199254740992,
-                           17592186044416],
-            549755813888: [4194304,
-                           536870912,
-                           18014398509481984,
-                           35184372088832],
-            1099511627776: [33554432,
-                            17179869184,
-                            144115188075855872,
-                            1125899906842624],
-            2199023255552: [67108864,
-                            34359738368,
-                            16777216,
-                            288230376151711744,
-                            2251799813685248,
-                            72057594037927936],
-            4398046511104: [134217728,
-                            68719476736,
-                            33554432,
-                            4294967296,
-                            576460752303423488,
-                            4503599627370496,
-                            144115188075855872,
-                            281474976710656],
-            8796093022208: [268435456,
-                            137438953472,
-                            67108864,
-                            8589934592,
-                            1152921504606846976,
-                            9007199254740992,
-                            288230376151711744,
-                            562949953421312],
-            17592186044416: [536870912,
-                             274877906944,
-                             134217728,
-                             17179869184,
-                             2305843009213693952,
-                             18014398509481984,
-                             576460752303423488,
-                             1125899906842624],
-            35184372088832: [1073741824,
-                             549755813888,
-                             268435456,
-                             34359738368,
-                             4611686018427387904,
-                             36028797018963968,
-                             1152921504606846976,
-                             2251799813685248],
-            70368744177664: [2147483648,
-                             536870912,
-                             68719476736,
-                             9223372036854775808,
-                             2305843009213693952,
-                             4503599627370496],
-            140737488355328: [1073741824,
-                              137438953472,
-                              4611686018427387904,
-                              9007199254740992],
-            281474976710656: [8589934592, 4398046511104, 288230376151711744],
-            562949953421312: [17179869184,
-                              8796093022208,
-                              4294967296,
-                              576460752303423488],
-            1125899906842624: [34359738368,
-                               17592186044416,
-                               8589934592,
-                               1099511627776,
-                               1152921504606846976,
-                               72057594037927936],
-            2251799813685248: [68719476736,
-                               35184372088832,
-                               17179869184,
-                               2199023255552,
-                               2305843009213693952,
-                               144115188075855872],
-            4503599627370496: [137438953472,
-                               70368744177664,
-                               34359738368,
-                               4398046511104,
-                               4611686018427387904,
-                               288230376151711744],
-            9007199254740992: [274877906944,
-                               140737488355328,
-                               68719476736,
-                               8796093022208,
-                               9223372036854775808,
-                               576460752303423488],
-            18014398509481984: [549755813888,
-                                137438953472,
-                                17592186044416,
-                                1152921504606846976],
-            36028797018963968: [274877906944,
-                                35184372088832,
-                                2305843009213693952],
-            72057594037927936: [2199023255552, 1125899906842624],
-            144115188075855872: [4398046511104,
-                                 2251799813685248,
-                                 1099511627776],
-            288230376151711744: [8796093022208,
-                                 4503599627370496,
-                                 2199023255552,
-                                 281474976710656],
-            576460752303423488: [17592186044416,
-                                 9007199254740992,
-                                 4398046511104,
-                                 562949953421312],
-            1152921504606846976: [35184372088832,
-                                  18014398509481984,
-                                  8796093022208,
-                                  1125899906842624],
-            2305843009213693952: [70368744177664,
-                                  36028797018963968,
-                                  17592186044416,
-                                  2251799813685248],
-            4611686018427387904: [140737488355328,
-                                  35184372088832,
-                                  4503599627370496],
-            9223372036854775808: [70368744177664, 9007199254740992]},
-           {1: [512,
-                262144,
-                134217728,
-                68719476736,
-                35184372088832,
-                18014398509481984,
-                9223372036854775808],
-            2: [256,
-                1024,
-                524288,
-                268435456,
-                137438953472,
-                70368744177664,
-                36028797018963968],
-            4: [512,
-                2048,
-                65536,
-                1048576,
-                536870912,
-                274877906944,
-                140737488355328],
-            8: [1024,
-                4096,
-                131072,
-                2097152,
-                16777216,
-                1073741824,
-                549755813888],
-            16: [2048, 8192, 262144, 4194304, 33554432, 2147483648, 4294967296],
-            32: [4096,
-                 16384,
-                 524288,
-                 8388608,
-                 67108864,
-                 8589934592,
-                 1099511627776],
-            64: [8192,
-                 32768,
-                 1048576,
-                 134217728,
-                 17179869184,
-                 2199023255552,
-                 281474976710656],
-            128: [16384,
-                  2097152,
-                  268435456,
-                  34359738368,
-                  4398046511104,
-                  562949953421312,
-                  72057594037927936],
-            256: [131072,
-                  2,
-                  67108864,
-                  34359738368,
-                  17592186044416,
-                  9007199254740992,
-                  4611686018427387904],
-            512: [1,
-                  65536,
-                  262144,
-                  4,
-                  134217728,
-                  68719476736,
-                  35184372088832,
-                  18014398509481984,
-                  9223372036854775808],
-            1024: [2,
-                   131072,
-                   524288,
-                   8,
-                   16777216,
-                   268435456,
-                   137438953472,
-                   70368744177664,
-                   36028797018963968],
-            2048: [4,
-                   262144,
-                   1048576,
-                   16,
-                   33554432,
-                   536870912,
-                   4294967296,
-                   274877906944,
-                   140737488355328],
-            4096: [8,
-                   524288,
-                   2097152,
-                   32,
-                   67108864,
-                   1073741824,
-                   8589934592,
-                   549755813888,
-                   1099511627776],
-            8192: [16,
-                   1048576,
-                   4194304,
-                   64,
-                   134217728,
-                   2147483648,
-                   17179869184,
-                   2199023255552,
-                   281474976710656],
-            16384: [32,
-                    2097152,
-                    8388608,
-                    128,
-                    268435456,
-                    34359738368,
-                    4398046511104,
-                    562949953421312,
-                    72057594037927936],
-            32768: [64,
-                    4194304,
-                    536870912,
-                    68719476736,
-                    8796093022208,
-                    1125899906842624,
-                    144115188075855872],
-            65536: [33554432,
-                    512,
-                    17179869184,
-                    4,
-                    8796093022208,
-                    4503599627370496,
-                    2305843009213693952],
-            131072: [256,
-                     16777216,
-                     67108864,
-                     1024,
-                     34359738368,
-                     8,
-                     17592186044416,
-                     9007199254740992,
-                     4611686018427387904],
-            262144: [512,
-                     33554432,
-                     134217728,
-                     2048,
-                     1,
-                     4294967296,
-                     68719476736,
-                     16,
-                     35184372088832,
-                     18014398509481984,
-                     9223372036854775808],
-            524288: [1024,
-                     67108864,
-                     268435456,
-                     4096,
-                     2,
-                     8589934592,
-                     137438953472,
-                     32,
-                     1099511627776,
-                     70368744177664,
-                     36028797018963968],
-            1048576: [2048,
-                      134217728,
-                      536870912,
-                      8192,
-                      4,
-                      17179869184,
-                      274877906944,
-                      64,
-                      2199023255552,
-                      140737488355328,
-                      281474976710656],
-            2097152: [4096,
-                      268435456,
-                      1073741824,
-                      16384,
-                      8,
-                      34359738368,
-                      549755813888,
-                      128,
-                      4398046511104,
-                      562949953421312,
-                      72057594037927936],
-            4194304: [8192,
-                      536870912,
-                      2147483648,
-                      32768,
-                      16,
-                      68719476736,
-                      8796093022208,
-                      1125899906842624,
-                      144115188075855872],
-            8388608: [16384,
-                      1073741824,
-                      32,
-                      137438953472,
-                      17592186044416,
-                      2251799813685248,
-                      288230376151711744],
-            16777216: [8589934592,
-                       131072,
-                       4398046511104,
-                       1024,
-                       2251799813685248,
-                       8,
-                       1152921504606846976],
-            33554432: [65536,
-                       4294967296,
-                       17179869184,
-                       262144,
-                       8796093022208,
-                       2048,
-                       4503599627370496,
-                       16,
-                       2305843009213693952],
-            67108864: [131072,
-                       8589934592,
-                       34359738368,
-                       524288,
-                       256,
-                       1099511627776,
-                       17592186044416,
-                       4096,
-                       9007199254740992,
-                       32,
-                       4611686018427387904],
-            134217728: [262144,
-                        17179869184,
-                        68719476736,
-                        1048576,
-                        512,
-                        2199023255552,
-                        35184372088832,
-                        8192,
-                        1,
-                        281474976710656,
-                        18014398509481984,
-                        64,
-                        9223372036854775808],
-            268435456: [524288,
-                        34359738368,
-                        137438953472,
-                        2097152,
-                        1024,
-                        4398046511104,
-                        70368744177664,
-                        16384,
-                        2,
-                        562949953421312,
-                        36028797018963968,
-                        128,
-                        72057594037927936],
-            536870912: [1048576,
-                        68719476736,
-                        274877906944,
-                        4194304,
-                        2048,
-                        8796093022208,
-                        140737488355328,
-                        32768,
-                        4,
-                        1125899906842624,
-                        144115188075855872],
-            1073741824: [2097152,
-                         137438953472,
-                         549755813888,
-                         8388608,
-                         4096,
-                         17592186044416,
-                         8,
-                         2251799813685248,
-                         288230376151711744],
-            2147483648: [4194304,
-                         274877906944,
-                         8192,
-                         35184372088832,
-                         16,
-                         4503599627370496,
-                         576460752303423488],
-            4294967296: [2199023255552,
-                         33554432,
-                         1125899906842624,
-                         262144,
-                         576460752303423488,
-                         2048,
-                         16],
-            8589934592: [16777216,
-                         1099511627776,
-                         4398046511104,
-                         67108864,
-                         2251799813685248,
-                         524288,
-                         1152921504606846976,
-                         4096,
-                         32],
-            17179869184: [33554432,
-                          2199023255552,
-                          8796093022208,
-                          134217728,
-                          65536,
-                          281474976710656,
-                          4503599627370496,
-                          1048576,
-                          2305843009213693952,
-                          8192,
-                          64],
-            34359738368: [67108864,
-                          4398046511104,
-                          17592186044416,
-                          268435456,
-                          131072,
-                          562949953421312,
-                          9007199254740992,
-                          2097152,
-                          256,
-                          72057594037927936,
-                          4611686018427387904,
-                          16384,
-                          128],
-            68719476736: [134217728,
-                          8796093022208,
-                          35184372088832,
-                          536870912,
-                          262144,
-                          1125899906842624,
-                          18014398509481984,
-                          4194304,
-                          512,
-                          144115188075855872,
-                          9223372036854775808,
-                          32768,
-                          1],
-            137438953472: [268435456,
-                           17592186044416,
-                           70368744177664,
-                           1073741824,
-                           524288,
-                           2251799813685248,
-                           36028797018963968,
-                           8388608,
-                           1024,
-                           288230376151711744,
-                           2],
-            274877906944: [536870912,
-                           35184372088832,
-                           140737488355328,
-                           2147483648,
-                           1048576,
-                           4503599627370496,
-                           2048,
-                           576460752303423488,
-                           4],
-            549755813888: [1073741824,
-                           70368744177664,
-                           2097152,
-                           9007199254740992,
-                           4096,
-                           1152921504606846976,
-                           8],
-            1099511627776: [562949953421312,
-                            8589934592,
-                            288230376151711744,
-                            67108864,
-                            524288,
-                            4096,
-                            32],
-            2199023255552: [4294967296,
-                            281474976710656,
-                            1125899906842624,
-                            17179869184,
-                            576460752303423488,
-                            134217728,
-                            1048576,
-                            8192,
-                            64],
-            4398046511104: [8589934592,
-                            562949953421312,
-                            2251799813685248,
-                            34359738368,
-                            16777216,
-                            72057594037927936,
-                            1152921504606846976,
-                            268435456,
-                            2097152,
-                            16384,
-                            128],
-            8796093022208: [17179869184,
-                            1125899906842624,
-                            4503599627370496,
-                            68719476736,
-                            33554432,
-                            144115188075855872,
-                            2305843009213693952,
-                            536870912,
-                            65536,
-                            4194304,
-                            32768],
-            17592186044416: [34359738368,
-                             2251799813685248,
-                             9007199254740992,
-                             137438953472,
-                             67108864,
-                             288230376151711744,
-                             4611686018427387904,
-                             1073741824,
-                             131072,
-                             8388608,
-                             256],
-            35184372088832: [68719476736,
-                             4503599627370496,
-                             18014398509481984,
-                             274877906944,
-                             134217728,
-                             576460752303423488,
-                             9223372036854775808,
-                             2147483648,
-                             262144,
-                             512,
-                             1],
-            70368744177664: [137438953472,
-                             9007199254740992,
-                             36028797018963968,
-                             549755813888,
-                             268435456,
-                             1152921504606846976,
-                             524288,
-                             1024,
-                             2],
-            140737488355328: [274877906944,
-                              18014398509481984,
-                              536870912,
-                              2305843009213693952,
-                              1048576,
-                              2048,
-                              4],
-            281474976710656: [144115188075855872,
-                              2199023255552,
-                              17179869184,
-                              134217728,
-                              1048576,
-                              8192,
-                              64],
-            562949953421312: [1099511627776,
-                              72057594037927936,
-                              288230376151711744,
-                              4398046511104,
-                              34359738368,
-                              268435456,
-                              2097152,
-                              16384,
-                              128],
-            1125899906842624: [2199023255552,
-                               144115188075855872,
-                               576460752303423488,
-                               8796093022208,
-                               4294967296,
-                               68719476736,
-                               536870912,
-                               4194304,
-                               32768],
-            2251799813685248: [4398046511104,
-                               288230376151711744,
-                               1152921504606846976,
-                               17592186044416,
-                               8589934592,
-                               137438953472,
-                               16777216,
-                               1073741824,
-                               8388608],
-            4503599627370496: [8796093022208,
-                               576460752303423488,
-                               2305843009213693952,
-                               35184372088832,
-                               17179869184,
-                               274877906944,
-                               33554432,
-                               2147483648,
-                               65536],
-            9007199254740992: [17592186044416,
-                               1152921504606846976,
-                               4611686018427387904,
-                               70368744177664,
-                               34359738368,
-                               549755813888,
-                               67108864,
-                               131072,
-                               256],
-            18014398509481984: [35184372088832,
-                                2305843009213693952,
-                                9223372036854775808,
-                                140737488355328,
-                                68719476736,
-                                134217728,
-                                262144,
-                                512,
-                                1],
-            36028797018963968: [70368744177664,
-                                4611686018427387904,
-                                137438953472,
-                                268435456,
-                                524288,
-                                1024,
-                                2],
-            72057594037927936: [562949953421312,
-                                4398046511104,
-                                34359738368,
-                                268435456,
-                                2097152,
-                                16384,
-                                128],
-            144115188075855872: [281474976710656,
-                                 1125899906842624,
-                                 8796093022208,
-                                 68719476736,
-                                 536870912,
-                                 4194304,
-                                 32768],
-            288230376151711744: [562949953421312,
-                                 2251799813685248,
-                                 1099511627776,
-                                 17592186044416,
-                                 137438953472,
-                                 1073741824,
-                                 8388608],
-            576460752303423488: [1125899906842624,
-                                 4503599627370496,
-                                 2199023255552,
-                                 35184372088832,
-                                 4294967296,
-                                 274877906944,
-                                 2147483648],
-            1152921504606846976: [2251799813685248,
-                                  9007199254740992,
-                                  4398046511104,
-                                  70368744177664,
-                                  8589934592,
-                                  549755813888,
-                                  16777216],
-            2305843009213693952: [4503599627370496,
-                                  18014398509481984,
-                                  8796093022208,
-                                  140737488355328,
-                                  17179869184,
-                                  33554432,
-                                  65536],
-            4611686018427387904: [9007199254740992,
-                                  36028797018963968,
-                                  17592186044416,
-                                  34359738368,
-                                  67108864,
-                                  131072,
-                                  256],
-            9223372036854775808: [18014398509481984,
-                                  35184372088832,
-                                  68719476736,
-                                  134217728,
-                                  262144,
-                                  512,
-                                  1]},
-           {1: [256,
-                2,
-                65536,
-                4,
-                16777216,
-                8,
-                4294967296,
-                16,
-                1099511627776,
-                32,
-                281474976710656,
-                64,
-                72057594037927936,
-                128],
-            2: [1,
-                512,
-                4,
-                131072,
-                8,
-                33554432,
-                16,
-                8589934592,
-                32,
-                2199023255552,
-                64,
-                562949953421312,
-                128,
-                144115188075855872],
-            4: [2,
-                1024,
-                8,
-                1,
-                262144,
-                16,
-                67108864,
-                32,
-                17179869184,
-                64,
-                4398046511104,
-                128,
-                1125899906842624,
-                288230376151711744],
-            8: [4,
-                2048,
-                16,
-                2,
-                524288,
-                32,
-                1,
-                134217728,
-                64,
-                34359738368,
-                128,
-                8796093022208,
-                2251799813685248,
-                576460752303423488],
-            16: [8,
-                 4096,
-                 32,
-                 4,
-                 1048576,
-                 64,
-                 2,
-                 268435456,
-                 128,
-                 1,
-                 68719476736,
-                 17592186044416,
-                 4503599627370496,
-                 1152921504606846976],
-            32: [16,
-                 8192,
-                 64,
-                 8,
-                 2097152,
-                 128,
-                 4,
-                 536870912,
-                 2,
-                 137438953472,
-                 1,
-                 35184372088832,
-                 9007199254740992,
-                 2305843009213693952],
-            64: [32,
-                 16384,
-                 128,
-                 16,
-                 4194304,
-                 8,
-                 1073741824,
-                 4,
-                 274877906944,
-                 2,
-                 70368744177664,
-                 1,
-                 18014398509481984,
-                 4611686018427387904],
-            128: [64,
-                  32768,
-                  32,
-                  8388608,
-                  16,
-                  2147483648,
-                  8,
-                  549755813888,
-                  4,
-                  140737488355328,
-                  2,
-                  36028797018963968,
-                  1,
-                  9223372036854775808],
-            256: [1,
-                  65536,
-                  512,
-                  16777216,
-                  1024,
-                  4294967296,
-                  2048,
-                  1099511627776,
-                  4096,
-                  281474976710656,
-                  8192,
-                  72057594037927936,
-                  16384,
-                  32768],
-            512: [2,
-                  256,
-                  131072,
-                  1024,
-                  33554432,
-                  2048,
-                  8589934592,
-                  4096,
-                  2199023255552,
-                  8192,
-                  562949953421312,
-                  16384,
-                  144115188075855872,
-                  32768],
-            1024: [4,
-                   512,
-                   262144,
-                   2048,
-                   256,
-                   67108864,
-                   4096,
-                   17179869184,
-                   8192,
-                   4398046511104,
-                   16384,
-                   1125899906842624,
-                   32768,
-                   288230376151711744],
-            2048: [8,
-                   1024,
-                   524288,
-                   4096,
-                   512,
-                   134217728,
-                   8192,
-                   256,
-                   34359738368,
-                   16384,
-                   8796093022208,
-                   32768,
-                   2251799813685248,
-                   576460752303423488],
-            4096: [16,
-                   2048,
-                   1048576,
-                   8192,
-                   1024,
-                   268435456,
-                   16384,
-                   512,
-                   68719476736,
-                   32768,
-                   256,
-                   17592186044416,
-                   4503599627370496,
-                   1152921504606846976],
-            8192: [32,
-                   4096,
-                   2097152,
-                   16384,
-                   2048,
-                   536870912,
-                   32768,
-                   1024,
-                   137438953472,
-                   512,
-                   35184372088832,
-                   256,
-                   9007199254740992,
-                   2305843009213693952],
-            16384: [64,
-                    8192,
-                    4194304,
-                    32768,
-                    4096,
-                    1073741824,
-                    2048,
-                    274877906944,
-                    1024,
-                    70368744177664,
-                    512,
-                    18014398509481984,
-                    256,
-                    4611686018427387904],
-            32768: [128,
-                    16384,
-                    8388608,
-                    8192,
-                    2147483648,
-                    4096,
-                    549755813888,
-                    2048,
-                    140737488355328,
-                    1024,
-                    36028797018963968,
-                    512,
-                    9223372036854775808,
-                    256],
-            65536: [256,
-                    16777216,
-                    131072,
-                    1,
-                    4294967296,
-                    262144,
-                    1099511627776,
-                    524288,
-                    281474976710656,
-                    1048576,
-                    72057594037927936,
-                    2097152,
-                    4194304,
-                    8388608],
-            131072: [512,
-                     65536,
-                     33554432,
-                     262144,
-                     2,
-                     8589934592,
-                     524288,
-                     2199023255552,
-                     1048576,
-                     562949953421312,
-                     2097152,
-                     144115188075855872,
-                     4194304,
-                     8388608],
-            262144: [1024,
-                     131072,
-                     67108864,
-                     524288,
-                     4,
-                     65536,
-                     17179869184,
-                     1048576,
-                     4398046511104,
-                     2097152,
-                     1125899906842624,
-                     4194304,
-                     288230376151711744,
-                     8388608],
-            524288: [2048,
-                     262144,
-                     134217728,
-                     1048576,
-                     8,
-                     131072,
-                     34359738368,
-                     2097152,
-                     65536,
-                     8796093022208,
-                     4194304,
-                     2251799813685248,
-                     8388608,
-                     576460752303423488],
-            1048576: [4096,
-                      524288,
-                      268435456,
-                      2097152,
-                      16,
-                      262144,
-                      68719476736,
-                      4194304,
-                      131072,
-                      17592186044416,
-                      8388608,
-                      65536,
-                      4503599627370496,
-                      1152921504606846976],
-            2097152: [8192,
-                      1048576,
-                      536870912,
-                      4194304,
-                      32,
-                      524288,
-                      137438953472,
-                      8388608,
-                      262144,
-                      35184372088832,
-                      131072,
-                      9007199254740992,
-                      65536,
-                      2305843009213693952],
-            4194304: [16384,
-                      2097152,
-                      1073741824,
-                      8388608,
-                      64,
-                      1048576,
-                      274877906944,
-                      524288,
-                      70368744177664,
-                      262144,
-                      18014398509481984,
-                      131072,
-                      4611686018427387904,
-                      65536],
-            8388608: [32768,
-                      4194304,
-                      2147483648,
-                      128,
-                      2097152,
-                      549755813888,
-                      1048576,
-                      140737488355328,
-                      524288,
-                      36028797018963968,
-                      262144,
-                      9223372036854775808,
-                      131072,
-                      65536],
-            16777216: [65536,
-                       4294967296,
-                       33554432,
-                       256,
-                       1099511627776,
-                       67108864,
-                       1,
-                       281474976710656,
-                       134217728,
-                       72057594037927936,
-                       268435456,
-                       536870912,
-                       1073741824,
-                       2147483648],
-            33554432: [131072,
-                       16777216,
-                       8589934592,
-                       67108864,
-                       512,
-                       2199023255552,
-                       134217728,
-                       2,
-                       562949953421312,
-                       268435456,
-                       144115188075855872,
-                       536870912,
-                       1073741824,
-                       2147483648],
-            67108864: [262144,
-                       33554432,
-                       17179869184,
-                       134217728,
-                       1024,
-                       16777216,
-                       4398046511104,
-                       268435456,
-                       4,
-                       1125899906842624,
-                       536870912,
-                       288230376151711744,
-                       1073741824,
-                       2147483648],
-            134217728: [524288,
-                        67108864,
-                        34359738368,
-                        268435456,
-                        2048,
-                        33554432,
-                        8796093022208,
-                        536870912,
-                        8,
-                        16777216,
-                        2251799813685248,
-                        1073741824,
-                        576460752303423488,
-                        2147483648],
-            268435456: [1048576,
-                        134217728,
-                        68719476736,
-                        536870912,
-                        4096,
-                        67108864,
-                        17592186044416,
-                        1073741824,
-                        16,
-                        33554432,
-                        4503599627370496,
-                        2147483648,
-                        16777216,
-                        1152921504606846976],
-            536870912: [2097152,
-                        268435456,
-                        137438953472,
-                        1073741824,
-                        8192,
-                        134217728,
-                        35184372088832,
-                        2147483648,
-                        32,
-                        67108864,
-                        9007199254740992,
-                        33554432,
-                        2305843009213693952,
-                        16777216],
-            1073741824: [4194304,
-                         536870912,
-                         274877906944,
-                         2147483648,
-                         16384,
-                         268435456,
-                         70368744177664,
-                         64,
-                         134217728,
-                         18014398509481984,
-                         67108864,
-                         4611686018427387904,
-                         33554432,
-                         16777216],
-            2147483648: [8388608,
-                         1073741824,
-                         549755813888,
-                         32768,
-                         536870912,
-                         140737488355328,
-                         128,
-                         268435456,
-                         36028797018963968,
-                         134217728,
-                         9223372036854775808,
-                         67108864,
-                         33554432,
-                         16777216],
-            4294967296: [16777216,
-                         1099511627776,
-                         8589934592,
-                         65536,
-                         281474976710656,
-                         17179869184,
-                         256,
-                         72057594037927936,
-                         34359738368,
-                         1,
-                         68719476736,
-                         137438953472,
-                         274877906944,
-                         549755813888],
-            8589934592: [33554432,
-                         4294967296,
-                         2199023255552,
-                         17179869184,
-                         131072,
-                         562949953421312,
-                         34359738368,
-                         512,
-                         144115188075855872,
-                         68719476736,
-                         2,
-                         137438953472,
-                         274877906944,
-                         549755813888],
-            17179869184: [67108864,
-                          8589934592,
-                          4398046511104,
-                          34359738368,
-                          262144,
-                          4294967296,
-                          1125899906842624,
-                          68719476736,
-                          1024,
-                          288230376151711744,
-                          137438953472,
-                          4,
-                          274877906944,
-                          549755813888],
-            34359738368: [134217728,
-                          17179869184,
-                          8796093022208,
-                          68719476736,
-                          524288,
-                          8589934592,
-                          2251799813685248,
-                          137438953472,
-                          2048,
-                          4294967296,
-                          576460752303423488,
-                          274877906944,
-                          8,
-                          549755813888],
-            68719476736: [268435456,
-                          34359738368,
-                          17592186044416,
-                          137438953472,
-                          1048576,
-                          17179869184,
-                          4503599627370496,
-                          274877906944,
-                          4096,
-                          8589934592,
-                          1152921504606846976,
-                          549755813888,
-                          16,
-                          4294967296],
-            137438953472: [536870912,
-                           68719476736,
-                           35184372088832,
-                           274877906944,
-                           2097152,
-                           34359738368,
-                           9007199254740992,
-                           549755813888,
-                           8192,
-                           17179869184,
-                           2305843009213693952,
-                           32,
-                           8589934592,
-                           4294967296],
-            274877906944: [1073741824,
-                           137438953472,
-                           70368744177664,
-                           549755813888,
-                           4194304,
-                           68719476736,
-                           18014398509481984,
-                           16384,
-                           34359738368,
-                           4611686018427387904,
-                           64,
-                           17179869184,
-                           8589934592,
-                           4294967296],
-            549755813888: [2147483648,
-                           274877906944,
-                           140737488355328,
-                           8388608,
-                           137438953472,
-                           36028797018963968,
-                           32768,
-                           68719476736,
-                           9223372036854775808,
-                           128,
-                           34359738368,
-                           17179869184,
-                           8589934592,
-                           4294967296],
-            1099511627776: [4294967296,
-                            281474976710656,
-                            2199023255552,
-                            16777216,
-                            72057594037927936,
-                            4398046511104,
-                            65536,
-                            8796093022208,
-                            256,
-                            17592186044416,
-                            1,
-                            35184372088832,
-                            70368744177664,
-                            140737488355328],
-            2199023255552: [8589934592,
-                            1099511627776,
-                            562949953421312,
-                            4398046511104,
-                            33554432,
-                            144115188075855872,
-                            8796093022208,
-                            131072,
-                            17592186044416,
-                            512,
-                            35184372088832,
-                            2,
-                            70368744177664,
-                            140737488355328],
-            4398046511104: [17179869184,
-                            2199023255552,
-                            1125899906842624,
-                            8796093022208,
-                            67108864,
-                            1099511627776,
-                            288230376151711744,
-                            17592186044416,
-                            262144,
-                            35184372088832,
-                            1024,
-                            70368744177664,
-                            4,
-                            140737488355328],
-            8796093022208: [34359738368,
-                            4398046511104,
-                            2251799813685248,
-                            17592186044416,
-                            134217728,
-                            2199023255552,
-                            576460752303423488,
-                            35184372088832,
-                            524288,
-                            1099511627776,
-                            70368744177664,
-                            2048,
-                            140737488355328,
-                            8],
-            17592186044416: [68719476736,
-                             8796093022208,
-                             4503599627370496,
-                             35184372088832,
-                             268435456,
-                             4398046511104,
-                             1152921504606846976,
-                             70368744177664,
-                             1048576,
-                             2199023255552,
-                             140737488355328,
-                             4096,
-                             1099511627776,
-                             16],
-            35184372088832: [137438953472,
-                             17592186044416,
-                             9007199254740992,
-                             70368744177664,
-                             536870912,
-                             8796093022208,
-                             2305843009213693952,
-                             140737488355328,
-                             2097152,
-                             4398046511104,
-                             8192,
-                             2199023255552,
-                             32,
-                             1099511627776],
-            70368744177664: [274877906944,
-                             35184372088832,
-                             18014398509481984,
-                             140737488355328,
-                             1073741824,
-                             17592186044416,
-                             4611686018427387904,
-                             4194304,
-                             8796093022208,
-                             16384,
-                             4398046511104,
-                             64,
-                             2199023255552,
-                             1099511627776],
-            140737488355328: [549755813888,
-                              70368744177664,
-                              36028797018963968,
-                              2147483648,
-                              35184372088832,
-                              9223372036854775808,
-                              8388608,
-                              17592186044416,
-                              32768,
-                              8796093022208,
-                              128,
-                              4398046511104,
-                              2199023255552,
-                              1099511627776],
-            281474976710656: [1099511627776,
-                              72057594037927936,
-                              562949953421312,
-                              4294967296,
-                              1125899906842624,
-                              16777216,
-                              2251799813685248,
-                              65536,
-                              4503599627370496,
-                              256,
-                              9007199254740992,
-                              1,
-                              18014398509481984,
-                              36028797018963968],
-            562949953421312: [2199023255552,
-                              281474976710656,
-                              144115188075855872,
-                              1125899906842624,
-                              8589934592,
-                              2251799813685248,
-                              33554432,
-                              4503599627370496,
-                              131072,
-                              9007199254740992,
-                              512,
-                              18014398509481984,
-                              2,
-                              36028797018963968],
-            1125899906842624: [4398046511104,
-                               562949953421312,
-                               288230376151711744,
-                               2251799813685248,
-                               17179869184,
-                               281474976710656,
-                               4503599627370496,
-                               67108864,
-                               9007199254740992,
-                               262144,
-                               18014398509481984,
-                               1024,
-                               36028797018963968,
-                               4],
-            2251799813685248: [8796093022208,
-                               1125899906842624,
-                               576460752303423488,
-                               4503599627370496,
-                               34359738368,
-                               562949953421312,
-                               9007199254740992,
-                               134217728,
-                               281474976710656,
-                               18014398509481984,
-                               524288,
-                               36028797018963968,
-                               2048,
-                               8],
-            4503599627370496: [17592186044416,
-                               2251799813685248,
-                               1152921504606846976,
-                               9007199254740992,
-                               68719476736,
-                               1125899906842624,
-                               18014398509481984,
-                               268435456,
-                               562949953421312,
-                               36028797018963968,
-                               1048576,
-                               281474976710656,
-                               4096,
-                               16],
-            9007199254740992: [35184372088832,
-                               4503599627370496,
-                               2305843009213693952,
-                               18014398509481984,
-                               137438953472,
-                               2251799813685248,
-                               36028797018963968,
-                               536870912,
-                               1125899906842624,
-                               2097152,
-                               562949953421312,
-                               8192,
-                               281474976710656,
-                               32],
-            18014398509481984: [70368744177664,
-                                9007199254740992,
-                                4611686018427387904,
-                                36028797018963968,
-                                274877906944,
-                                4503599627370496,
-                                1073741824,
-                                2251799813685248,
-                                4194304,
-                                1125899906842624,
-                                16384,
-                                562949953421312,
-                                64,
-                                281474976710656],
-            36028797018963968: [140737488355328,
-                                18014398509481984,
-                                9223372036854775808,
-                                549755813888,
-                                9007199254740992,
-                                2147483648,
-                                4503599627370496,
-                                8388608,
-                                2251799813685248,
-                                32768,
-                                1125899906842624,
-                                128,
-                                562949953421312,
-                                281474976710656],
-            72057594037927936: [281474976710656,
-                                144115188075855872,
-                                1099511627776,
-                                288230376151711744,
-                                4294967296,
-                                576460752303423488,
-                                16777216,
-                                1152921504606846976,
-                                65536,
-                                2305843009213693952,
-                                256,
-                                4611686018427387904,
-                                1,
-                                9223372036854775808],
-            144115188075855872: [562949953421312,
-                                 72057594037927936,
-                                 288230376151711744,
-                                 2199023255552,
-                                 576460752303423488,
-                                 8589934592,
-                                 1152921504606846976,
-                                 33554432,
-                                 2305843009213693952,
-                                 131072,
-                                 4611686018427387904,
-                                 512,
-                                 9223372036854775808,
-                                 2],
-            288230376151711744: [1125899906842624,
-                                 144115188075855872,
-                                 576460752303423488,
-                                 4398046511104,
-                                 72057594037927936,
-                                 1152921504606846976,
-                                 17179869184,
-                                 2305843009213693952,
-                                 67108864,
-                                 4611686018427387904,
-                                 262144,
-                                 9223372036854775808,
-                                 1024,
-                                 4],
-            576460752303423488: [2251799813685248,
-                                 288230376151711744,
-                                 1152921504606846976,
-                                 8796093022208,
-                                 144115188075855872,
-                                 2305843009213693952,
-                                 34359738368,
-                                 72057594037927936,
-                                 4611686018427387904,
-                                 134217728,
-                                 9223372036854775808,
-                                 524288,
-                                 2048,
-                                 8],
-            1152921504606846976: [4503599627370496,
-                                  576460752303423488,
-                                  2305843009213693952,
-                                  17592186044416,
-                                  288230376151711744,
-                                  4611686018427387904,
-                                  68719476736,
-                                  144115188075855872,
-                                  9223372036854775808,
-                                  268435456,
-                                  72057594037927936,
-                                  1048576,
-                                  4096,
-                                  16],
-            2305843009213693952: [9007199254740992,
-                                  1152921504606846976,
-                                  4611686018427387904,
-                                  35184372088832,
-                                  576460752303423488,
-                                  9223372036854775808,
-                                  137438953472,
-                                  288230376151711744,
-                                  536870912,
-                                  144115188075855872,
-                                  2097152,
-                                  72057594037927936,
-                                  8192,
-                                  32],
-            4611686018427387904: [18014398509481984,
-                                  2305843009213693952,
-                                  9223372036854775808,
-                                  70368744177664,
-                                  1152921504606846976,
-                                  274877906944,
-                                  576460752303423488,
-                                  1073741824,
-                                  288230376151711744,
-                                  4194304,
-                                  144115188075855872,
-                                  16384,
-                                  72057594037927936,
-                                  64],
-            9223372036854775808: [36028797018963968,
-                                  4611686018427387904,
-                                  140737488355328,
-                                  2305843009213693952,
-                                  549755813888,
-                                  1152921504606846976,
-                                  2147483648,
-                                  576460752303423488,
-                                  8388608,
-                                  288230376151711744,
-                                  32768,
-                                  144115188075855872,
-                                  128,
-                                  72057594037927936]},
-           {1: [256,
-                512,
-                2,
-                65536,
-                262144,
-                4,
-                16777216,
-                134217728,
-                8,
-                4294967296,
-                68719476736,
-                16,
-                1099511627776,
-                35184372088832,
-                32,
-                281474976710656,
-                18014398509481984,
-                64,
-                72057594037927936,
-                9223372036854775808,
-                128],
-            2: [1,
-                256,
-                512,
-                1024,
-                4,
-                131072,
-                524288,
-                8,
-                33554432,
-                268435456,
-                16,
-                8589934592,
-                137438953472,
-                32,
-                2199023255552,
-                70368744177664,
-                64,
-                562949953421312,
-                36028797018963968,
-                128,
-                144115188075855872],
-            4: [2,
-                512,
-                1024,
-                2048,
-                8,
-                1,
-                65536,
-                262144,
-                1048576,
-                16,
-                67108864,
-                536870912,
-                32,
-                17179869184,
-                274877906944,
-                64,
-                4398046511104,
-                140737488355328,
-                128,
-                1125899906842624,
-                288230376151711744],
-            8: [4,
-                1024,
-                2048,
-                4096,
-                16,
-                2,
-                131072,
-                524288,
-                2097152,
-                32,
-                1,
-                16777216,
-                134217728,
-                1073741824,
-                64,
-                34359738368,
-                549755813888,
-                128,
-                8796093022208,
-                2251799813685248,
-                576460752303423488],
-            16: [8,
-                 2048,
-                 4096,
-                 8192,
-                 32,
-                 4,
-                 262144,
-                 1048576,
-                 4194304,
-                 64,
-                 2,
-                 33554432,
-                 268435456,
-                 2147483648,
-                 128,
-                 1,
-                 4294967296,
-                 68719476736,
-                 17592186044416,
-                 4503599627370496,
-                 1152921504606846976],
-            32: [16,
-                 4096,
-                 8192,
-                 16384,
-                 64,
-                 8,
-                 524288,
-                 2097152,
-                 8388608,
-                 128,
-                 4,
-                 67108864,
-                 536870912,
-                 2,
-                 8589934592,
-                 137438953472,
-                 1,
-                 1099511627776,
-                 35184372088832,
-                 9007199254740992,
-                 2305843009213693952],
-            64: [32,
-                 8192,
-                 16384,
-                 32768,
-                 128,
-                 16,
-                 1048576,
-                 4194304,
-                 8,
-                 134217728,
-                 1073741824,
-                 4,
-                 17179869184,
-                 274877906944,
-                 2,
-                 2199023255552,
-                 70368744177664,
-                 1,
-                 281474976710656,
-                 18014398509481984,
-                 4611686018427387904],
-            128: [64,
-                  16384,
-                  32768,
-                  32,
-                  2097152,
-                  8388608,
-                  16,
-                  268435456,
-                  2147483648,
-                  8,
-                  34359738368,
-                  549755813888,
-                  4,
-                  4398046511104,
-                  140737488355328,
-                  2,
-                  562949953421312,
-                  36028797018963968,
-                  1,
-                  72057594037927936,
-                  9223372036854775808],
-            256: [1,
-                  65536,
-                  131072,
-                  512,
-                  2,
-                  16777216,
-                  67108864,
-                  1024,
-                  4294967296,
-                  34359738368,
-                  2048,
-                  1099511627776,
-                  17592186044416,
-                  4096,
-                  281474976710656,
-                  9007199254740992,
-                  8192,
-                  72057594037927936,
-                  4611686018427387904,
-                  16384,
-                  32768],
-            512: [2,
-                  1,
-                  256,
-                  65536,
-                  131072,
-                  262144,
-                  1024,
-                  4,
-                  33554432,
-                  134217728,
-                  2048,
-                  8589934592,
-                  68719476736,
-                  4096,
-                  2199023255552,
-                  35184372088832,
-                  8192,
-                  562949953421312,
-                  18014398509481984,
-                  16384,
-                  144115188075855872,
-                  9223372036854775808,
-                  32768],
-            1024: [4,
-                   2,
-                   512,
-                   131072,
-                   262144,
-                   524288,
-                   2048,
-                   8,
-                   256,
-                   16777216,
-                   67108864,
-                   268435456,
-                   4096,
-                   17179869184,
-                   137438953472,
-                   8192,
-                   4398046511104,
-                   70368744177664,
-                   16384,
-                   1125899906842624,
-                   36028797018963968,
-                   32768,
-                   288230376151711744],
-            2048: [8,
-                   4,
-                   1024,
-                   262144,
-                   524288,
-                   1048576,
-                   4096,
-                   16,
-                   512,
-                   33554432,
-                   134217728,
-                   536870912,
-                   8192,
-                   256,
-                   4294967296,
-                   34359738368,
-                   274877906944,
-                   16384,
-                   8796093022208,
-                   140737488355328,
-                   32768,
-                   2251799813685248,
-                   576460752303423488],
-            4096: [16,
-                   8,
-                   2048,
-                   524288,
-                   1048576,
-                   2097152,
-                   8192,
-                   32,
-                   1024,
-                   67108864,
-                   268435456,
-                   1073741824,
-                   16384,
-                   512,
-                   8589934592,
-                   68719476736,
-                   549755813888,
-                   32768,
-                   256,
-                   1099511627776,
-                   17592186044416,
-                   4503599627370496,
-                   1152921504606846976],
-            8192: [32,
-                   16,
-                   4096,
-                   1048576,
-                   2097152,
-                   4194304,
-                   16384,
-                   64,
-                   2048,
-                   134217728,
-                   536870912,
-                   2147483648,
-                   32768,
-                   1024,
-                   17179869184,
-                   137438953472,
-                   512,
-                   2199023255552,
-                   35184372088832,
-                   256,
-                   281474976710656,
-                   9007199254740992,
-                   2305843009213693952],
-            16384: [64,
-                    32,
-                    8192,
-                    2097152,
-                    4194304,
-                    8388608,
-                    32768,
-                    128,
-                    4096,
-                    268435456,
-                    1073741824,
-                    2048,
-                    34359738368,
-                    274877906944,
-                    1024,
-                    4398046511104,
-                    70368744177664,
-                    512,
-                    562949953421312,
-                    18014398509481984,
-                    256,
-                    72057594037927936,
-                    4611686018427387904],
-            32768: [128,
-                    64,
-                    16384,
-                    4194304,
-                    8388608,
-                    8192,
-                    536870912,
-                    2147483648,
-                    4096,
-                    68719476736,
-                    549755813888,
-                    2048,
-                    8796093022208,
-                    140737488355328,
-                    1024,
-                    1125899906842624,
-                    36028797018963968,
-                    512,
-                    144115188075855872,
-                    9223372036854775808,
-                    256],
-            65536: [256,
-                    16777216,
-                    33554432,
-                    131072,
-                    512,
-                    1,
-                    4294967296,
-                    17179869184,
-                    262144,
-                    4,
-                    1099511627776,
-                    8796093022208,
-                    524288,
-                    281474976710656,
-                    4503599627370496,
-                    1048576,
-                    72057594037927936,
-                    2305843009213693952,
-                    2097152,
-                    4194304,
-                    8388608],
-            131072: [512,
-                     256,
-                     65536,
-                     16777216,
-                     33554432,
-                     67108864,
-                     262144,
-                     1024,
-                     2,
-                     8589934592,
-                     34359738368,
-                     524288,
-                     8,
-                     2199023255552,
-                     17592186044416,
-                     1048576,
-                     562949953421312,
-                     9007199254740992,
-                     2097152,
-                     144115188075855872,
-                     4611686018427387904,
-                     4194304,
-                     8388608],
-            262144: [1024,
-                     512,
-                     131072,
-                     33554432,
-                     67108864,
-                     134217728,
-                     524288,
-                     2048,
-                     4,
-                     1,
-                     65536,
-                     4294967296,
-                     17179869184,
-                     68719476736,
-                     1048576,
-                     16,
-                     4398046511104,
-                     35184372088832,
-                     2097152,
-                     1125899906842624,
-                     18014398509481984,
-                     4194304,
-                     288230376151711744,
-                     9223372036854775808,
-                     8388608],
-            524288: [2048,
-                     1024,
-                     262144,
-                     67108864,
-                     134217728,
-                     268435456,
-                     1048576,
-                     4096,
-                     8,
-                     2,
-                     131072,
-                     8589934592,
-                     34359738368,
-                     137438953472,
-                     2097152,
-                     32,
-                     65536,
-                     1099511627776,
-                     8796093022208,
-                     70368744177664,
-                     4194304,
-                     2251799813685248,
-                     36028797018963968,
-                     8388608,
-                     576460752303423488],
-            1048576: [4096,
-                      2048,
-                      524288,
-                      134217728,
-                      268435456,
-                      536870912,
-                      2097152,
-                      8192,
-                      16,
-                      4,
-                      262144,
-                      17179869184,
-                      68719476736,
-                      274877906944,
-                      4194304,
-                      64,
-                      131072,
-                      2199023255552,
-                      17592186044416,
-                      140737488355328,
-                      8388608,
-                      65536,
-                      281474976710656,
-                      4503599627370496,
-                      1152921504606846976],
-            2097152: [8192,
-                      4096,
-                      1048576,
-                      268435456,
-                      536870912,
-                      1073741824,
-                      4194304,
-                      16384,
-                      32,
-                      8,
-                      524288,
-                      34359738368,
-                      137438953472,
-                      549755813888,
-                      8388608,
-                      128,
-                      262144,
-                      4398046511104,
-                      35184372088832,
-                      131072,
-                      562949953421312,
-                      9007199254740992,
-                      65536,
-                      72057594037927936,
-                      2305843009213693952],
-            4194304: [16384,
-                      8192,
-                      2097152,
-                      536870912,
-                      1073741824,
-                      2147483648,
-                      8388608,
-                      32768,
-                      64,
-                      16,
-                      1048576,
-                      68719476736,
-                      274877906944,
-                      524288,
-                      8796093022208,
-                      70368744177664,
-                      262144,
-                      1125899906842624,
-                      18014398509481984,
-                      131072,
-                      144115188075855872,
-                      4611686018427387904,
-                      65536],
-            8388608: [32768,
-                      16384,
-                      4194304,
-                      1073741824,
-                      2147483648,
-                      128,
-                      32,
-                      2097152,
-                      137438953472,
-                      549755813888,
-                      1048576,
-                      17592186044416,
-                      140737488355328,
-                      524288,
-                      2251799813685248,
-                      36028797018963968,
-                      262144,
-                      288230376151711744,
-                      9223372036854775808,
-                      131072,
-                      65536],
-            16777216: [65536,
-                       4294967296,
-                       8589934592,
-                       33554432,
-                       131072,
-                       256,
-                       1099511627776,
-                       4398046511104,
-                       67108864,
-                       1024,
-                       1,
-                       281474976710656,
-                       2251799813685248,
-                       134217728,
-                       8,
-                       72057594037927936,
-                       1152921504606846976,
-                       268435456,
-                       536870912,
-                       1073741824,
-                       2147483648],
-            33554432: [131072,
-                       65536,
-                       16777216,
-                       4294967296,
-                       8589934592,
-                       17179869184,
-                       67108864,
-                       262144,
-                       512,
-                       2199023255552,
-                       8796093022208,
-                       134217728,
-                       2048,
-                       2,
-                       562949953421312,
-                       4503599627370496,
-                       268435456,
-                       16,
-                       144115188075855872,
-                       2305843009213693952,
-                       536870912,
-                       1073741824,
-                       2147483648],
-            67108864: [262144,
-                       131072,
-                       33554432,
-                       8589934592,
-                       17179869184,
-                       34359738368,
-                       134217728,
-                       524288,
-                       1024,
-                       256,
-                       16777216,
-                       1099511627776,
-                       4398046511104,
-                       17592186044416,
-                       268435456,
-                       4096,
-                       4,
-                       1125899906842624,
-                       9007199254740992,
-                       536870912,
-                       32,
-                       288230376151711744,
-                       4611686018427387904,
-                       1073741824,
-                       2147483648],
-            134217728: [524288,
-                        262144,
-                        67108864,
-                        17179869184,
-                        34359738368,
-                        68719476736,
-                        268435456,
-                        1048576,
-                        2048,
-                        512,
-                        33554432,
-                        2199023255552,
-                        8796093022208,
-                        35184372088832,
-                        536870912,
-                        8192,
-                        8,
-                        1,
-                        16777216,
-                        281474976710656,
-                        2251799813685248,
-                        18014398509481984,
-                        1073741824,
-                        64,
-                        576460752303423488,
-                        9223372036854775808,
-                        2147483648],
-            268435456: [1048576,
-                        524288,
-                        134217728,
-                        34359738368,
-                        68719476736,
-                        137438953472,
-                        536870912,
-                        2097152,
-                        4096,
-                        1024,
-                        67108864,
-                        4398046511104,
-                        17592186044416,
-                        70368744177664,
-                        1073741824,
-                        16384,
-                        16,
-                        2,
-                        33554432,
-                        562949953421312,
-                        4503599627370496,
-                        36028797018963968,
-                        2147483648,
-                        128,
-                        16777216,
-                        72057594037927936,
-                        1152921504606846976],
-            536870912: [2097152,
-                        1048576,
-                        268435456,
-                        68719476736,
-                        137438953472,
-                        274877906944,
-                        1073741824,
-                        4194304,
-                        8192,
-                        2048,
-                        134217728,
-                        8796093022208,
-                        35184372088832,
-                        140737488355328,
-                        2147483648,
-                        32768,
-                        32,
-                        4,
-                        67108864,
-                        1125899906842624,
-                        9007199254740992,
-                        33554432,
-                        144115188075855872,
-                        2305843009213693952,
-                        16777216],
-            1073741824: [4194304,
-                         2097152,
-                         536870912,
-                         137438953472,
-                         274877906944,
-                         549755813888,
-                         2147483648,
-                         8388608,
-                         16384,
-                         4096,
-                         268435456,
-                         17592186044416,
-                         70368744177664,
-                         64,
-                         8,
-                         134217728,
-                         2251799813685248,
-                         18014398509481984,
-                         67108864,
-                         288230376151711744,
-                         4611686018427387904,
-                         33554432,
-                         16777216],
-            2147483648: [8388608,
-                         4194304,
-                         1073741824,
-                         274877906944,
-                         549755813888,
-                         32768,
-                         8192,
-                         536870912,
-                         35184372088832,
-                         140737488355328,
-                         128,
-                         16,
-                         268435456,
-                         4503599627370496,
-                         36028797018963968,
-                         134217728,
-                         576460752303423488,
-                         9223372036854775808,
-                         67108864,
-                         33554432,
-                         16777216],
-            4294967296: [16777216,
-                         1099511627776,
-                         2199023255552,
-                         8589934592,
-                         33554432,
-                         65536,
-                         281474976710656,
-                         1125899906842624,
-                         17179869184,
-                         262144,
-                         256,
-                         72057594037927936,
-                         576460752303423488,
-                         34359738368,
-                         2048,
-                         1,
-                         68719476736,
-                         16,
-                         137438953472,
-                         274877906944,
-                         549755813888],
-            8589934592: [33554432,
-                         16777216,
-                         4294967296,
-                         1099511627776,
-                         2199023255552,
-                         4398046511104,
-                         17179869184,
-                         67108864,
-                         131072,
-                         562949953421312,
-                         2251799813685248,
-                         34359738368,
-                         524288,
-                         512,
-                         144115188075855872,
-                         1152921504606846976,
-                         68719476736,
-                         4096,
-                         2,
-                         137438953472,
-                         32,
-                         274877906944,
-                         549755813888],
-            17179869184: [67108864,
-                          33554432,
-                          8589934592,
-                          2199023255552,
-                          4398046511104,
-                          8796093022208,
-                          34359738368,
-                          134217728,
-                          262144,
-                          65536,
-                          4294967296,
-                          281474976710656,
-                          1125899906842624,
-                          4503599627370496,
-                          68719476736,
-                          1048576,
-                          1024,
-                          288230376151711744,
-                          2305843009213693952,
-                          137438953472,
-                          8192,
-                          4,
-                          274877906944,
-                          64,
-                          549755813888],
-            34359738368: [134217728,
-                          67108864,
-                          17179869184,
-                          4398046511104,
-                          8796093022208,
-                          17592186044416,
-                          68719476736,
-                          268435456,
-                          524288,
-                          131072,
-                          8589934592,
-                          562949953421312,
-                          2251799813685248,
-                          9007199254740992,
-                          137438953472,
-                          2097152,
-                          2048,
-                          256,
-                          4294967296,
-                          72057594037927936,
-                          576460752303423488,
-                          4611686018427387904,
-                          274877906944,
-                          16384,
-                          8,
-                          549755813888,
-                          128],
-            68719476736: [268435456,
-                          134217728,
-                          34359738368,
-                          8796093022208,
-                          17592186044416,
-                          35184372088832,
-                          137438953472,
-                          536870912,
-                          1048576,
-                          262144,
-                          17179869184,
-                          1125899906842624,
-                          4503599627370496,
-                          18014398509481984,
-                          274877906944,
-                          4194304,
-                          4096,
-                          512,
-                          8589934592,
-                          144115188075855872,
-                          1152921504606846976,
-                          9223372036854775808,
-                          549755813888,
-                          32768,
-                          16,
-                          1,
-                          4294967296],
-            137438953472: [536870912,
-                           268435456,
-                           68719476736,
-                           17592186044416,
-                           35184372088832,
-                           70368744177664,
-                           274877906944,
-                           1073741824,
-                           2097152,
-                           524288,
-                           34359738368,
-                           2251799813685248,
-                           9007199254740992,
-                           36028797018963968,
-                           549755813888,
-                           8388608,
-                           8192,
-                           1024,
-                           17179869184,
-                           288230376151711744,
-                           2305843009213693952,
-                           32,
-                           2,
-                           8589934592,
-                           4294967296],
-            274877906944: [1073741824,
-                           536870912,
-                           137438953472,
-                           35184372088832,
-                           70368744177664,
-                           140737488355328,
-                           549755813888,
-                           2147483648,
-                           4194304,
-                           1048576,
-                           68719476736,
-                           4503599627370496,
-                           18014398509481984,
-                           16384,
-                           2048,
-                           34359738368,
-                           576460752303423488,
-                           4611686018427387904,
-                           64,
-                           4,
-                           17179869184,
-                           8589934592,
-                           4294967296],
-            549755813888: [2147483648,
-                           1073741824,
-                           274877906944,
-                           70368744177664,
-                           140737488355328,
-                           8388608,
-                           2097152,
-                           137438953472,
-                           9007199254740992,
-                           36028797018963968,
-                           32768,
-                           4096,
-                           68719476736,
-                           1152921504606846976,
-                           9223372036854775808,
-                           128,
-                           8,
-                           34359738368,
-                           17179869184,
-                           8589934592,
-                           4294967296],
-            1099511627776: [4294967296,
-                            281474976710656,
-                            562949953421312,
-                            2199023255552,
-                            8589934592,
-                            16777216,
-                            72057594037927936,
-                            288230376151711744,
-                            4398046511104,
-                            67108864,
-                            65536,
-                            8796093022208,
-                            524288,
-                            256,
-                            17592186044416,
-                            4096,
-                            1,
-                            35184372088832,
-                            32,
-                            70368744177664,
-                            140737488355328],
-            2199023255552: [8589934592,
-                            4294967296,
-                            1099511627776,
-                            281474976710656,
-                            562949953421312,
-                            1125899906842624,
-                            4398046511104,
-                            17179869184,
-                            33554432,
-                            144115188075855872,
-                            576460752303423488,
-                            8796093022208,
-                            134217728,
-                            131072,
-                            17592186044416,
-                            1048576,
-                            512,
-                            35184372088832,
-                            8192,
-                            2,
-                            70368744177664,
-                            64,
-                            140737488355328],
-            4398046511104: [17179869184,
-                            8589934592,
-                            2199023255552,
-                            562949953421312,
-                            1125899906842624,
-                            2251799813685248,
-                            8796093022208,
-                            34359738368,
-                            67108864,
-                            16777216,
-                            1099511627776,
-                            72057594037927936,
-                            288230376151711744,
-                            1152921504606846976,
-                            17592186044416,
-                            268435456,
-                            262144,
-                            35184372088832,
-                            2097152,
-                            1024,
-                            70368744177664,
-                            16384,
-                            4,
-                            140737488355328,
-                            128],
-            8796093022208: [34359738368,
-                            17179869184,
-                            4398046511104,
-                            1125899906842624,
-                            2251799813685248,
-                            4503599627370496,
-                            17592186044416,
-                            68719476736,
-                            134217728,
-                            33554432,
-                            2199023255552,
-                            144115188075855872,
-                            576460752303423488,
-                            2305843009213693952,
-                            35184372088832,
-                            536870912,
-                            524288,
-                            65536,
-                            1099511627776,
-                            70368744177664,
-                            4194304,
-                            2048,
-                            140737488355328,
-                            32768,
-                            8],
-            17592186044416: [68719476736,
-                             34359738368,
-                             8796093022208,
-                             2251799813685248,
-                             4503599627370496,
-                             9007199254740992,
-                             35184372088832,
-                             137438953472,
-                             268435456,
-                             67108864,
-                             4398046511104,
-                             288230376151711744,
-                             1152921504606846976,
-                             4611686018427387904,
-                             70368744177664,
-                             1073741824,
-                             1048576,
-                             131072,
-                             2199023255552,
-                             140737488355328,
-                             8388608,
-                             4096,
-                             256,
-                             1099511627776,
-                             16],
-            35184372088832: [137438953472,
-                             68719476736,
-                             17592186044416,
-                             4503599627370496,
-                             9007199254740992,
-                             18014398509481984,
-                             70368744177664,
-                             274877906944,
-                             536870912,
-                             134217728,
-                             8796093022208,
-                             576460752303423488,
-                             2305843009213693952,
-                             9223372036854775808,
-                             140737488355328,
-                             2147483648,
-                             2097152,
-                             262144,
-                             4398046511104,
-                             8192,
-                             512,
-                             2199023255552,
-                             32,
-                             1,
-                             1099511627776],
-            70368744177664: [274877906944,
-                             137438953472,
-                             35184372088832,
-                             9007199254740992,
-                             18014398509481984,
-                             36028797018963968,
-                             140737488355328,
-                             549755813888,
-                             1073741824,
-                             268435456,
-                             17592186044416,
-                             1152921504606846976,
-                             4611686018427387904,
-                             4194304,
-                             524288,
-                             8796093022208,
-                             16384,
-                             1024,
-                             4398046511104,
-                             64,
-                             2,
-                             2199023255552,
-                             1099511627776],
-            140737488355328: [549755813888,
-                              274877906944,
-                              70368744177664,
-                              18014398509481984,
-                              36028797018963968,
-                              2147483648,
-                              536870912,
-                              35184372088832,
-                              2305843009213693952,
-                              9223372036854775808,
-                              8388608,
-                              1048576,
-                              17592186044416,
-                              32768,
-                              2048,
-                              8796093022208,
-                              128,
-                              4,
-                              4398046511104,
-                              2199023255552,
-                              1099511627776],
-            281474976710656: [1099511627776,
-                              72057594037927936,
-                              144115188075855872,
-                              562949953421312,
-                              2199023255552,
-                              4294967296,
-                              1125899906842624,
-                              17179869184,
-                              16777216,
-                              2251799813685248,
-                              134217728,
-                              65536,
-                              4503599627370496,
-                              1048576,
-                              256,
-                              9007199254740992,
-                              8192,
-                              1,
-                              18014398509481984,
-                              64,
-                              36028797018963968],
-            562949953421312: [2199023255552,
-                              1099511627776,
-                              281474976710656,
-                              72057594037927936,
-                              144115188075855872,
-                              288230376151711744,
-                              1125899906842624,
-                              4398046511104,
-                              8589934592,
-                              2251799813685248,
-                              34359738368,
-                              33554432,
-                              4503599627370496,
-                              268435456,
-                              131072,
-                              9007199254740992,
-                              2097152,
-                              512,
-                              18014398509481984,
-                              16384,
-                              2,
-                              36028797018963968,
-                              128],
-            1125899906842624: [4398046511104,
-                               2199023255552,
-                               562949953421312,
-                               144115188075855872,
-                               288230376151711744,
-                               576460752303423488,
-                               2251799813685248,
-                               8796093022208,
-                               17179869184,
-                               4294967296,
-                               281474976710656,
-                               4503599627370496,
-                               68719476736,
-                               67108864,
-                               9007199254740992,
-                               536870912,
-                               262144,
-                               18014398509481984,
-                               4194304,
-                               1024,
-                               36028797018963968,
-                               32768,
-                               4],
-            2251799813685248: [8796093022208,
-                               4398046511104,
-                               1125899906842624,
-                               288230376151711744,
-                               576460752303423488,
-                               1152921504606846976,
-                               4503599627370496,
-                               17592186044416,
-                               34359738368,
-                               8589934592,
-                               562949953421312,
-                               9007199254740992,
-                               137438953472,
-                               134217728,
-                               16777216,
-                               281474976710656,
-                               18014398509481984,
-                               1073741824,
-                               524288,
-                               36028797018963968,
-                               8388608,
-                               2048,
-                               8],
-            4503599627370496: [17592186044416,
-                               8796093022208,
-                               2251799813685248,
-                               576460752303423488,
-                               1152921504606846976,
-                               2305843009213693952,
-                               9007199254740992,
-                               35184372088832,
-                               68719476736,
-                               17179869184,
-                               1125899906842624,
-                               18014398509481984,
-                               274877906944,
-                               268435456,
-                               33554432,
-                               562949953421312,
-                               36028797018963968,
-                               2147483648,
-                               1048576,
-                               65536,
-                               281474976710656,
-                               4096,
-                               16],
-            9007199254740992: [35184372088832,
-                               17592186044416,
-                               4503599627370496,
-                               1152921504606846976,
-                               2305843009213693952,
-                               4611686018427387904,
-                               18014398509481984,
-                               70368744177664,
-                               137438953472,
-                               34359738368,
-                               2251799813685248,
-                               36028797018963968,
-                               549755813888,
-                               536870912,
-                               67108864,
-                               1125899906842624,
-                               2097152,
-                               131072,
-                               562949953421312,
-                               8192,
-                               256,
-                               281474976710656,
-                               32],
-            18014398509481984: [70368744177664,
-                                35184372088832,
-                                9007199254740992,
-                                2305843009213693952,
-                                4611686018427387904,
-                                9223372036854775808,
-                                36028797018963968,
-                                140737488355328,
-                                274877906944,
-                                68719476736,
-                                4503599627370496,
-                                1073741824,
-                                134217728,
-                                2251799813685248,
-                                4194304,
-                                262144,
-                                1125899906842624,
-                                16384,
-                                512,
-                                562949953421312,
-                                64,
-                                1,
-                                281474976710656],
-            36028797018963968: [140737488355328,
-                                70368744177664,
-                                18014398509481984,
-                                4611686018427387904,
-                                9223372036854775808,
-                                549755813888,
-                                137438953472,
-                                9007199254740992,
-                                2147483648,
-                                268435456,
-                                4503599627370496,
-                                8388608,
-                                524288,
-                                2251799813685248,
-                                32768,
-                                1024,
-                                1125899906842624,
-                                128,
-                                2,
-                                562949953421312,
-                                281474976710656],
-            72057594037927936: [281474976710656,
-                                144115188075855872,
-                                562949953421312,
-                                1099511627776,
-                                288230376151711744,
-                                4398046511104,
-                                4294967296,
-                                576460752303423488,
-                                34359738368,
-                                16777216,
-                                1152921504606846976,
-                                268435456,
-                                65536,
-                                2305843009213693952,
-                                2097152,
-                                256,
-                                4611686018427387904,
-                                16384,
-                                1,
-                                9223372036854775808,
-                                128],
-            144115188075855872: [562949953421312,
-                                 281474976710656,
-                                 72057594037927936,
-                                 288230376151711744,
-                                 1125899906842624,
-                                 2199023255552,
-                                 576460752303423488,
-                                 8796093022208,
-                                 8589934592,
-                                 1152921504606846976,
-                                 68719476736,
-                                 33554432,
-                                 2305843009213693952,
-                                 536870912,
-                                 131072,
-                                 4611686018427387904,
-                                 4194304,
-                                 512,
-                                 9223372036854775808,
-                                 32768,
-                                 2],
-            288230376151711744: [1125899906842624,
-                                 562949953421312,
-                                 144115188075855872,
-                                 576460752303423488,
-                                 2251799813685248,
-                                 4398046511104,
-                                 1099511627776,
-                                 72057594037927936,
-                                 1152921504606846976,
-                                 17592186044416,
-                                 17179869184,
-                                 2305843009213693952,
-                                 137438953472,
-                                 67108864,
-                                 4611686018427387904,
-                                 1073741824,
-                                 262144,
-                                 9223372036854775808,
-                                 8388608,
-                                 1024,
-                                 4],
-            576460752303423488: [2251799813685248,
-                                 1125899906842624,
-                                 288230376151711744,
-                                 1152921504606846976,
-                                 4503599627370496,
-                                 8796093022208,
-                                 2199023255552,
-                                 144115188075855872,
-                                 2305843009213693952,
-                                 35184372088832,
-                                 34359738368,
-                                 4294967296,
-                                 72057594037927936,
-                                 4611686018427387904,
-                                 274877906944,
-                                 134217728,
-                                 9223372036854775808,
-                                 2147483648,
-                                 524288,
-                                 2048,
-                                 8],
-            1152921504606846976: [4503599627370496,
-                                  2251799813685248,
-                                  576460752303423488,
-                                  2305843009213693952,
-                                  9007199254740992,
-                                  17592186044416,
-                                  4398046511104,
-                                  288230376151711744,
-                                  4611686018427387904,
-                                  70368744177664,
-                                  68719476736,
-                                  8589934592,
-                                  144115188075855872,
-                                  9223372036854775808,
-                                  549755813888,
-                                  268435456,
-                                  16777216,
-                                  72057594037927936,
-                                  1048576,
-                                  4096,
-                                  16],
-            2305843009213693952: [9007199254740992,
-                                  4503599627370496,
-                                  1152921504606846976,
-                                  4611686018427387904,
-                                  18014398509481984,
-                                  35184372088832,
-                                  8796093022208,
-                                  576460752303423488,
-                                  9223372036854775808,
-                                  140737488355328,
-                                  137438953472,
-                                  17179869184,
-                                  288230376151711744,
-                                  536870912,
-                                  33554432,
-                                  144115188075855872,
-                                  2097152,
-                                  65536,
-                                  72057594037927936,
-                                  8192,
-                                  32],
-            4611686018427387904: [18014398509481984,
-                                  9007199254740992,
-                                  2305843009213693952,
-                                  9223372036854775808,
-                                  36028797018963968,
-                                  70368744177664,
-                                  17592186044416,
-                                  1152921504606846976,
-                                  274877906944,
-                                  34359738368,
-                                  576460752303423488,
-                                  1073741824,
-                                  67108864,
-                                  288230376151711744,
-                                  4194304,
-                                  131072,
-                                  144115188075855872,
-                                  16384,
-                                  256,
-                                  72057594037927936,
-                                  64],
-            9223372036854775808: [36028797018963968,
-                                  18014398509481984,
-                                  4611686018427387904,
-                                  140737488355328,
-                                  35184372088832,
-                                  2305843009213693952,
-                                  549755813888,
-                                  68719476736,
-                                  1152921504606846976,
-                                  2147483648,
-                                  134217728,
-                                  576460752303423488,
-                                  8388608,
-                                  262144,
-                                  288230376151711744,
-                                  32768,
-                                  512,
-                                  144115188075855872,
-                                  128,
-                                  1,
-                                  72057594037927936]},
-           {1: [],
-            2: [],
-            4: [],
-            8: [],
-            16: [],
-            32: [],
-            64: [],
-            128: [],
-            256: [],
-            512: [],
-            1024: [],
-            2048: [],
-            4096: [],
-            8192: [],
-            16384: [],
-            32768: [],
-            65536: [],
-            131072: [],
-            262144: [],
-            524288: [],
-            1048576: [],
-            2097152: [],
-            4194304: [],
-            8388608: [],
-            16777216: [],
-            33554432: [],
-            67108864: [],
-            134217728: [],
-            268435456: [],
-            536870912: [],
-            1073741824: [],
-            2147483648: [],
-            4294967296: [],
-            8589934592: [],
-            17179869184: [],
-            34359738368: [],
-            68719476736: [],
-            137438953472: [],
-            274877906944: [],
-            549755813888: [],
-            1099511627776: [],
-            2199023255552: [],
-            4398046511104: [],
-            8796093022208: [],
-            17592186044416: [],
-            35184372088832: [],
-            70368744177664: [],
-            140737488355328: [],
-            281474976710656: [],
-            562949953421312: [],
-            1125899906842624: [],
-            2251799813685248: [],
-            4503599627370496: [],
-            9007199254740992: [],
-            18014398509481984: [],
-            36028797018963968: [],
-            72057594037927936: [],
-            144115188075855872: [],
-            288230376151711744: [],
-            576460752303423488: [],
-            1152921504606846976: [],
-            2305843009213693952: [],
-            4611686018427387904: [],
-            9223372036854775808: []}]
+# Evaluation masks for Valkulator. The piece square tables live in
+# engine.MoveGen.tables and are summed incrementally by FastBoard. Square
+# sets are also OR-ed into single masks so a term is one AND and a popcount.
 
-AntiDiagonals = {1: 9241421688590303745,
-                   2: 36099303471055874,
-                   4: 141012904183812,
-                   8: 550831656968,
-                   16: 2151686160,
-                   32: 8405024,
-                   64: 32832,
-                   128: 128,
-                   256: 4620710844295151872,
-                   512: 9241421688590303745,
-                   1024: 36099303471055874,
-                   2048: 141012904183812,
-                   4096: 550831656968,
-                   8192: 2151686160,
-                   16384: 8405024,
-                   32768: 32832,
-                   65536: 2310355422147575808,
-                   131072: 4620710844295151872,
-                   262144: 9241421688590303745,
-                   524288: 36099303471055874,
-                   1048576: 141012904183812,
-                   2097152: 550831656968,
-                   4194304: 2151686160,
-                   8388608: 8405024,
-                   16777216: 1155177711073755136,
-                   33554432: 2310355422147575808,
-                   67108864: 4620710844295151872,
-                   134217728: 9241421688590303745,
-                   268435456: 36099303471055874,
-                   536870912: 141012904183812,
-                   1073741824: 550831656968,
-                   2147483648: 2151686160,
-                   4294967296: 577588855528488960,
-                   8589934592: 1155177711073755136,
-                   17179869184: 2310355422147575808,
-                   34359738368: 4620710844295151872,
-                   68719476736: 9241421688590303745,
-                   137438953472: 36099303471055874,
-                   274877906944: 141012904183812,
-                   549755813888: 550831656968,
-                   1099511627776: 288794425616760832,
-                   2199023255552: 577588855528488960,
-                   4398046511104: 1155177711073755136,
-                   8796093022208: 2310355422147575808,
-                   17592186044416: 4620710844295151872,
-                   35184372088832: 9241421688590303745,
-                   70368744177664: 36099303471055874,
-                   140737488355328: 141012904183812,
-                   281474976710656: 144396663052566528,
-                   562949953421312: 288794425616760832,
-                   1125899906842624: 577588855528488960,
-                   2251799813685248: 1155177711073755136,
-                   4503599627370496: 2310355422147575808,
-                   9007199254740992: 4620710844295151872,
-                   18014398509481984: 9241421688590303745,
-                   36028797018963968: 36099303471055874,
-                   72057594037927936: 72057594037927936,
-                   144115188075855872: 144396663052566528,
-                   288230376151711744: 288794425616760832,
-                   576460752303423488: 577588855528488960,
-                   1152921504606846976: 1155177711073755136,
-                   2305843009213693952: 2310355422147575808,
-                   4611686018427387904: 4620710844295151872,
-                   9223372036854775808: 9241421688590303745},
-CastleSquares = {'kingside': [6, 432345564227567616],
-                   'queenside': [112, 8070450532247928832]}
-CenterFiles = (1157442765409226768, 578721382704613384)
 CenterSquares = [134217728, 268435456, 34359738368, 68719476736]
-Diagonals = {1: 1,
-               2: 258,
-               4: 66052,
-               8: 16909320,
-               16: 4328785936,
-               32: 1108169199648,
-               64: 283691315109952,
-               128: 72624976668147840,
-               256: 258,
-               512: 66052,
-               1024: 16909320,
-               2048: 4328785936,
-               4096: 1108169199648,
-               8192: 283691315109952,
-               16384: 72624976668147840,
-               32768: 145249953336295424,
-               65536: 66052,
-               131072: 16909320,
-               262144: 4328785936,
-               524288: 1108169199648,
-               1048576: 283691315109952,
-               2097152: 72624976668147840,
-               4194304: 145249953336295424,
-               8388608: 290499906672525312,
-               16777216: 16909320,
-               33554432: 4328785936,
-               67108864: 1108169199648,
-               134217728: 283691315109952,
-               268435456: 72624976668147840,
-               536870912: 145249953336295424,
-               1073741824: 290499906672525312,
-               2147483648: 580999813328273408,
-               4294967296: 4328785936,
-               8589934592: 1108169199648,
-               17179869184: 283691315109952,
-               34359738368: 72624976668147840,
-               68719476736: 145249953336295424,
-               137438953472: 290499906672525312,
-               274877906944: 580999813328273408,
-               549755813888: 1161999622361579520,
-               1099511627776: 1108169199648,
-               2199023255552: 283691315109952,
-               4398046511104: 72624976668147840,
-               8796093022208: 145249953336295424,
-               17592186044416: 290499906672525312,
-               35184372088832: 580999813328273408,
-               70368744177664: 1161999622361579520,
-               140737488355328: 2323998145211531264,
-               281474976710656: 283691315109952,
-               562949953421312: 72624976668147840,
-               1125899906842624: 145249953336295424,
-               2251799813685248: 290499906672525312,
-               4503599627370496: 580999813328273408,
-               9007199254740992: 1161999622361579520,
-               18014398509481984: 2323998145211531264,
-               36028797018963968: 4647714815446351872,
-               72057594037927936: 72624976668147840,
-               144115188075855872: 145249953336295424,
-               288230376151711744: 290499906672525312,
-               576460752303423488: 580999813328273408,
-               1152921504606846976: 1161999622361579520,
-               2305843009213693952: 2323998145211531264,
-               4611686018427387904: 4647714815446351872,
-               9223372036854775808: 9223372036854775808}
-Files = {1: 72340172838076673,
-           2: 144680345676153346,
-           4: 289360691352306692,
-           8: 578721382704613384,
-           16: 1157442765409226768,
-           32: 2314885530818453536,
-           64: 4629771061636907072,
-           128: 9259542123273814144,
-           256: 72340172838076673,
-           512: 144680345676153346,
-           1024: 289360691352306692,
-           2048: 578721382704613384,
-           4096: 1157442765409226768,
-           8192: 2314885530818453536,
-           16384: 4629771061636907072,
-           32768: 9259542123273814144,
-           65536: 72340172838076673,
-           131072: 144680345676153346,
-           262144: 289360691352306692,
-           524288: 578721382704613384,
-           1048576: 1157442765409226768,
-           2097152: 2314885530818453536,
-           4194304: 4629771061636907072,
-           8388608: 9259542123273814144,
-           16777216: 72340172838076673,
-           33554432: 144680345676153346,
-           67108864: 289360691352306692,
-           134217728: 578721382704613384,
-           268435456: 1157442765409226768,
-           536870912: 2314885530818453536,
-           1073741824: 4629771061636907072,
-           2147483648: 9259542123273814144,
-           4294967296: 72340172838076673,
-           8589934592: 144680345676153346,
-           17179869184: 289360691352306692,
-           34359738368: 578721382704613384,
-           68719476736: 1157442765409226768,
-           137438953472: 2314885530818453536,
-           274877906944: 4629771061636907072,
-           549755813888: 9259542123273814144,
-           1099511627776: 72340172838076673,
-           2199023255552: 144680345676153346,
-           4398046511104: 289360691352306692,
-           8796093022208: 578721382704613384,
-           17592186044416: 1157442765409226768,
-           35184372088832: 2314885530818453536,
-           70368744177664: 4629771061636907072,
-           140737488355328: 9259542123273814144,
-           281474976710656: 72340172838076673,
-           562949953421312: 144680345676153346,
-           1125899906842624: 289360691352306692,
-           2251799813685248: 578721382704613384,
-           4503599627370496: 1157442765409226768,
-           9007199254740992: 2314885530818453536,
-           18014398509481984: 4629771061636907072,
-           36028797018963968: 9259542123273814144,
-           72057594037927936: 72340172838076673,
-           144115188075855872: 144680345676153346,
-           288230376151711744: 289360691352306692,
-           576460752303423488: 578721382704613384,
-           1152921504606846976: 1157442765409226768,
-           2305843009213693952: 2314885530818453536,
-           4611686018427387904: 4629771061636907072,
-           9223372036854775808: 9259542123273814144}
+CenterFiles = (1157442765409226768, 578721382704613384)
 MinorPieceSquares = ([64, 32, 4, 2],
-                       [4611686018427387904,
-                        2305843009213693952,
-                        288230376151711744,
-                        144115188075855872])
-PawnBlockers = ({1: 256,
-                   2: 512,
-                   4: 1024,
-                   8: 2048,
-                   16: 4096,
-                   32: 8192,
-                   64: 16384,
-                   128: 32768,
-                   256: 65536,
-                   512: 131072,
-                   1024: 262144,
-                   2048: 524288,
-                   4096: 1048576,
-                   8192: 2097152,
-                   16384: 4194304,
-                   32768: 8388608,
-                   65536: 16777216,
-                   131072: 33554432,
-                   262144: 67108864,
-                   524288: 134217728,
-                   1048576: 268435456,
-                   2097152: 536870912,
-                   4194304: 1073741824,
-                   8388608: 2147483648,
-                   16777216: 4294967296,
-                   33554432: 8589934592,
-                   67108864: 17179869184,
-                   134217728: 34359738368,
-                   268435456: 68719476736,
-                   536870912: 137438953472,
-                   1073741824: 274877906944,
-                   2147483648: 549755813888,
-                   4294967296: 1099511627776,
-                   8589934592: 2199023255552,
-                   17179869184: 4398046511104,
-                   34359738368: 8796093022208,
-                   68719476736: 17592186044416,
-                   137438953472: 35184372088832,
-                   274877906944: 70368744177664,
-                   549755813888: 140737488355328,
-                   1099511627776: 281474976710656,
-                   2199023255552: 562949953421312,
-                   4398046511104: 1125899906842624,
-                   8796093022208: 2251799813685248,
-                   17592186044416: 4503599627370496,
-                   35184372088832: 9007199254740992,
-                   70368744177664: 18014398509481984,
-                   140737488355328: 36028797018963968,
-                   281474976710656: 72057594037927936,
-                   562949953421312: 144115188075855872,
-                   1125899906842624: 288230376151711744,
-                   2251799813685248: 576460752303423488,
-                   4503599627370496: 1152921504606846976,
-                   9007199254740992: 2305843009213693952,
-                   18014398509481984: 4611686018427387904,
-                   36028797018963968: 9223372036854775808,
-                   72057594037927936: 0,
-                   144115188075855872: 0,
-                   288230376151711744: 0,
-                   576460752303423488: 0,
-                   1152921504606846976: 0,
-                   2305843009213693952: 0,
-                   4611686018427387904: 0,
-                   9223372036854775808: 0},
-                  {1: 0,
-                   2: 0,
-                   4: 0,
-                   8: 0,
-                   16: 0,
-                   32: 0,
-                   64: 0,
-                   128: 0,
-                   256: 1,
-                   512: 2,
-                   1024: 4,
-                   2048: 8,
-                   4096: 16,
-                   8192: 32,
-                   16384: 64,
-                   32768: 128,
-                   65536: 256,
-                   131072: 512,
-                   262144: 1024,
-                   524288: 2048,
-                   1048576: 4096,
-                   2097152: 8192,
-                   4194304: 16384,
-                   8388608: 32768,
-                   16777216: 65536,
-                   33554432: 131072,
-                   67108864: 262144,
-                   134217728: 524288,
-                   268435456: 1048576,
-                   536870912: 2097152,
-                   1073741824: 4194304,
-                   2147483648: 8388608,
-                   4294967296: 16777216,
-                   8589934592: 33554432,
-                   17179869184: 67108864,
-                   34359738368: 134217728,
-                   68719476736: 268435456,
-                   137438953472: 536870912,
-                   274877906944: 1073741824,
-                   549755813888: 2147483648,
-                   1099511627776: 4294967296,
-                   2199023255552: 8589934592,
-                   4398046511104: 17179869184,
-                   8796093022208: 34359738368,
-                   17592186044416: 68719476736,
-                   35184372088832: 137438953472,
-                   70368744177664: 274877906944,
-                   140737488355328: 549755813888,
-                   281474976710656: 1099511627776,
-                   562949953421312: 2199023255552,
-                   1125899906842624: 4398046511104,
-                   2251799813685248: 8796093022208,
-                   4503599627370496: 17592186044416,
-                   9007199254740992: 35184372088832,
-                   18014398509481984: 70368744177664,
-                   36028797018963968: 140737488355328,
-                   72057594037927936: 281474976710656,
-                   144115188075855872: 562949953421312,
-                   288230376151711744: 1125899906842624,
-                   576460752303423488: 2251799813685248,
-                   1152921504606846976: 4503599627370496,
-                   2305843009213693952: 9007199254740992,
-                   4611686018427387904: 18014398509481984,
-                   9223372036854775808: 36028797018963968})
-Ranks = {1: 255,
-           2: 255,
-           4: 255,
-           8: 255,
-           16: 255,
-           32: 255,
-           64: 255,
-           128: 255,
-           256: 65280,
-           512: 65280,
-           1024: 65280,
-           2048: 65280,
-           4096: 65280,
-           8192: 65280,
-           16384: 65280,
-           32768: 65280,
-           65536: 16711680,
-           131072: 16711680,
-           262144: 16711680,
-           524288: 16711680,
-           1048576: 16711680,
-           2097152: 16711680,
-           4194304: 16711680,
-           8388608: 16711680,
-           16777216: 4278190080,
-           33554432: 4278190080,
-           67108864: 4278190080,
-           134217728: 4278190080,
-           268435456: 4278190080,
-           536870912: 4278190080,
-           1073741824: 4278190080,
-           2147483648: 4278190080,
-           4294967296: 1095216660480,
-           8589934592: 1095216660480,
-           17179869184: 1095216660480,
-           34359738368: 1095216660480,
-           68719476736: 1095216660480,
-           137438953472: 1095216660480,
-           274877906944: 1095216660480,
-           549755813888: 1095216660480,
-           1099511627776: 280375465082880,
-           2199023255552: 280375465082880,
-           4398046511104: 280375465082880,
-           8796093022208: 280375465082880,
-           17592186044416: 280375465082880,
-           35184372088832: 280375465082880,
-           70368744177664: 280375465082880,
-           140737488355328: 280375465082880,
-           281474976710656: 71776119061217280,
-           562949953421312: 71776119061217280,
-           1125899906842624: 71776119061217280,
-           2251799813685248: 71776119061217280,
-           4503599627370496: 71776119061217280,
-           9007199254740992: 71776119061217280,
-           18014398509481984: 71776119061217280,
-           36028797018963968: 71776119061217280,
-           72057594037927936: 18374686479671623680,
-           144115188075855872: 18374686479671623680,
-           288230376151711744: 18374686479671623680,
-           576460752303423488: 18374686479671623680,
-           1152921504606846976: 18374686479671623680,
-           2305843009213693952: 18374686479671623680,
-           4611686018427387904: 18374686479671623680,
-           9223372036854775808: 18374686479671623680}
-ReversedAntidiagonals = {1: 9241421688590303745,
-                           2: 4620710844295151872,
-                           4: 2310355422147575808,
-                           8: 1155177711073755136,
-                           16: 577588855528488960,
-                           32: 288794425616760832,
-                           64: 144396663052566528,
-                           128: 72057594037927936,
-                           256: 36099303471055874,
-                           512: 9241421688590303745,
-                           1024: 4620710844295151872,
-                           2048: 2310355422147575808,
-                           4096: 1155177711073755136,
-                           8192: 577588855528488960,
-                           16384: 288794425616760832,
-                           32768: 144396663052566528,
-                           65536: 141012904183812,
-                           131072: 36099303471055874,
-                           262144: 9241421688590303745,
-                           524288: 4620710844295151872,
-                           1048576: 2310355422147575808,
-                           2097152: 1155177711073755136,
-                           4194304: 577588855528488960,
-                           8388608: 288794425616760832,
-                           16777216: 550831656968,
-                           33554432: 141012904183812,
-                           67108864: 36099303471055874,
-                           134217728: 9241421688590303745,
-                           268435456: 4620710844295151872,
-                           536870912: 2310355422147575808,
-                           1073741824: 1155177711073755136,
-                           2147483648: 577588855528488960,
-                           4294967296: 2151686160,
-                           8589934592: 550831656968,
-                           17179869184: 141012904183812,
-                           34359738368: 36099303471055874,
-                           68719476736: 9241421688590303745,
-                           137438953472: 4620710844295151872,
-                           274877906944: 2310355422147575808,
-                           549755813888: 1155177711073755136,
-                           1099511627776: 8405024,
-                           2199023255552: 2151686160,
-                           4398046511104: 550831656968,
-                           8796093022208: 141012904183812,
-                           17592186044416: 36099303471055874,
-                           35184372088832: 9241421688590303745,
-                           70368744177664: 4620710844295151872,
-                           140737488355328: 2310355422147575808,
-                           281474976710656: 32832,
-                           562949953421312: 8405024,
-                           1125899906842624: 2151686160,
-                           2251799813685248: 550831656968,
-                           4503599627370496: 141012904183812,
-                           9007199254740992: 36099303471055874,
-                           18014398509481984: 9241421688590303745,
-                           36028797018963968: 4620710844295151872,
-                           72057594037927936: 128,
-                           144115188075855872: 32832,
-                           288230376151711744: 8405024,
-                           576460752303423488: 2151686160,
-                           1152921504606846976: 550831656968,
-                           2305843009213693952: 141012904183812,
-                           4611686018427387904: 36099303471055874,
-                           9223372036854775808: 9241421688590303745}
-ReversedDiagonals = {1: 9223372036854775808,
-                       2: 4647714815446351872,
-                       4: 2323998145211531264,
-                       8: 1161999622361579520,
-                       16: 580999813328273408,
-                       32: 290499906672525312,
-                       64: 145249953336295424,
-                       128: 72624976668147840,
-                       256: 4647714815446351872,
-                       512: 2323998145211531264,
-                       1024: 1161999622361579520,
-                       2048: 580999813328273408,
-                       4096: 290499906672525312,
-                       8192: 145249953336295424,
-                       16384: 72624976668147840,
-                       32768: 283691315109952,
-                       65536: 2323998145211531264,
-                       131072: 1161999622361579520,
-                       262144: 580999813328273408,
-                       524288: 290499906672525312,
-                       1048576: 145249953336295424,
-                       2097152: 72624976668147840,
-                       4194304: 283691315109952,
-                       8388608: 1108169199648,
-                       16777216: 1161999622361579520,
-                       33554432: 580999813328273408,
-                       67108864: 290499906672525312,
-                       134217728: 145249953336295424,
-                       268435456: 72624976668147840,
-                       536870912: 283691315109952,
-                       1073741824: 1108169199648,
-                       2147483648: 4328785936,
-                       4294967296: 580999813328273408,
-                       8589934592: 290499906672525312,
-                       17179869184: 145249953336295424,
-                       34359738368: 72624976668147840,
-                       68719476736: 283691315109952,
-                       137438953472: 1108169199648,
-                       274877906944: 4328785936,
-                       549755813888: 16909320,
-                       1099511627776: 290499906672525312,
-                       2199023255552: 145249953336295424,
-                       4398046511104: 72624976668147840,
-                       8796093022208: 283691315109952,
-                       17592186044416: 1108169199648,
-                       35184372088832: 4328785936,
-                       70368744177664: 16909320,
-                       140737488355328: 66052,
-                       281474976710656: 145249953336295424,
-                       562949953421312: 72624976668147840,
-                       1125899906842624: 283691315109952,
-                       2251799813685248: 1108169199648,
-                       4503599627370496: 4328785936,
-                       9007199254740992: 16909320,
-                       18014398509481984: 66052,
-                       36028797018963968: 258,
-                       72057594037927936: 72624976668147840,
-                       144115188075855872: 283691315109952,
-                       288230376151711744: 1108169199648,
-                       576460752303423488: 4328785936,
-                       1152921504606846976: 16909320,
-                       2305843009213693952: 66052,
-                       4611686018427387904: 258,
-                       9223372036854775808: 1}
-ReversedFiles = {1: 9259542123273814144,
-                   2: 4629771061636907072,
-                   4: 2314885530818453536,
-                   8: 1157442765409226768,
-                   16: 578721382704613384,
-                   32: 289360691352306692,
-                   64: 144680345676153346,
-                   128: 72340172838076673,
-                   256: 9259542123273814144,
-                   512: 4629771061636907072,
-                   1024: 2314885530818453536,
-                   2048: 1157442765409226768,
-                   4096: 578721382704613384,
-                   8192: 289360691352306692,
-                   16384: 144680345676153346,
-                   32768: 72340172838076673,
-                   65536: 9259542123273814144,
-                   131072: 4629771061636907072,
-                   262144: 2314885530818453536,
-                   524288: 1157442765409226768,
-                   1048576: 578721382704613384,
-                   2097152: 289360691352306692,
-                   4194304: 144680345676153346,
-                   8388608: 72340172838076673,
-                   16777216: 9259542123273814144,
-                   33554432: 4629771061636907072,
-                   67108864: 2314885530818453536,
-                   134217728: 1157442765409226768,
-                   268435456: 578721382704613384,
-                   536870912: 289360691352306692,
-                   1073741824: 144680345676153346,
-                   2147483648: 72340172838076673,
-                   4294967296: 9259542123273814144,
-                   8589934592: 4629771061636907072,
-                   17179869184: 2314885530818453536,
-                   34359738368: 1157442765409226768,
-                   68719476736: 578721382704613384,
-                   137438953472: 289360691352306692,
-                   274877906944: 144680345676153346,
-                   549755813888: 72340172838076673,
-                   1099511627776: 9259542123273814144,
-                   2199023255552: 4629771061636907072,
-                   4398046511104: 2314885530818453536,
-                   8796093022208: 1157442765409226768,
-                   17592186044416: 578721382704613384,
-                   35184372088832: 289360691352306692,
-                   70368744177664: 144680345676153346,
-                   140737488355328: 72340172838076673,
-                   281474976710656: 9259542123273814144,
-                   562949953421312: 4629771061636907072,
-                   1125899906842624: 2314885530818453536,
-                   2251799813685248: 1157442765409226768,
-                   4503599627370496: 578721382704613384,
-                   9007199254740992: 289360691352306692,
-                   18014398509481984: 144680345676153346,
-                   36028797018963968: 72340172838076673,
-                   72057594037927936: 9259542123273814144,
-                   144115188075855872: 4629771061636907072,
-                   288230376151711744: 2314885530818453536,
-                   576460752303423488: 1157442765409226768,
-                   1152921504606846976: 578721382704613384,
-                   2305843009213693952: 289360691352306692,
-                   4611686018427387904: 144680345676153346,
-                   9223372036854775808: 72340172838076673}
-ReversedRanks = {1: 18374686479671623680,
-                   2: 18374686479671623680,
-                   4: 18374686479671623680,
-                   8: 18374686479671623680,
-                   16: 18374686479671623680,
-                   32: 18374686479671623680,
-                   64: 18374686479671623680,
-                   128: 18374686479671623680,
-                   256: 71776119061217280,
-                   512: 71776119061217280,
-                   1024: 71776119061217280,
-                   2048: 71776119061217280,
-                   4096: 71776119061217280,
-                   8192: 71776119061217280,
-                   16384: 71776119061217280,
-                   32768: 71776119061217280,
-                   65536: 280375465082880,
-                   131072: 280375465082880,
-                   262144: 280375465082880,
-                   524288: 280375465082880,
-                   1048576: 280375465082880,
-                   2097152: 280375465082880,
-                   4194304: 280375465082880,
-                   8388608: 280375465082880,
-                   16777216: 1095216660480,
-                   33554432: 1095216660480,
-                   67108864: 1095216660480,
-                   134217728: 1095216660480,
-                   268435456: 1095216660480,
-                   536870912: 1095216660480,
-                   1073741824: 1095216660480,
-                   2147483648: 1095216660480,
-                   4294967296: 4278190080,
-                   8589934592: 4278190080,
-                   17179869184: 4278190080,
-                   34359738368: 4278190080,
-                   68719476736: 4278190080,
-                   137438953472: 4278190080,
-                   274877906944: 4278190080,
-                   549755813888: 4278190080,
-                   1099511627776: 16711680,
-                   2199023255552: 16711680,
-                   4398046511104: 16711680,
-                   8796093022208: 16711680,
-                   17592186044416: 16711680,
-                   35184372088832: 16711680,
-                   70368744177664: 16711680,
-                   140737488355328: 16711680,
-                   281474976710656: 65280,
-                   562949953421312: 65280,
-                   1125899906842624: 65280,
-                   2251799813685248: 65280,
-                   4503599627370496: 65280,
-                   9007199254740992: 65280,
-                   18014398509481984: 65280,
-                   36028797018963968: 65280,
-                   72057594037927936: 255,
-                   144115188075855872: 255,
-                   288230376151711744: 255,
-                   576460752303423488: 255,
-                   1152921504606846976: 255,
-                   2305843009213693952: 255,
-                   4611686018427387904: 255,
-                   9223372036854775808: 255}
-ReversedSquares = {1: 9223372036854775808,
-                     2: 4611686018427387904,
-                     4: 2305843009213693952,
-                     8: 1152921504606846976,
-                     16: 576460752303423488,
-                     32: 288230376151711744,
-                     64: 144115188075855872,
-                     128: 72057594037927936,
-                     256: 36028797018963968,
-                     512: 18014398509481984,
-                     1024: 9007199254740992,
-                     2048: 4503599627370496,
-                     4096: 2251799813685248,
-                     8192: 1125899906842624,
-                     16384: 562949953421312,
-                     32768: 281474976710656,
-                     65536: 140737488355328,
-                     131072: 70368744177664,
-                     262144: 35184372088832,
-                     524288: 17592186044416,
-                     1048576: 8796093022208,
-                     2097152: 4398046511104,
-                     4194304: 2199023255552,
-                     8388608: 1099511627776,
-                     16777216: 549755813888,
-                     33554432: 274877906944,
-                     67108864: 137438953472,
-                     134217728: 68719476736,
-                     268435456: 34359738368,
-                     536870912: 17179869184,
-                     1073741824: 8589934592,
-                     2147483648: 4294967296,
-                     4294967296: 2147483648,
-                     8589934592: 1073741824,
-                     17179869184: 536870912,
-                     34359738368: 268435456,
-                     68719476736: 134217728,
-                     137438953472: 67108864,
-                     274877906944: 33554432,
-                     549755813888: 16777216,
-                     1099511627776: 8388608,
-                     2199023255552: 4194304,
-                     4398046511104: 2097152,
-                     8796093022208: 1048576,
-                     17592186044416: 524288,
-                     35184372088832: 262144,
-                     70368744177664: 131072,
-                     140737488355328: 65536,
-                     281474976710656: 32768,
-                     562949953421312: 16384,
-                     1125899906842624: 8192,
-                     2251799813685248: 4096,
-                     4503599627370496: 2048,
-                     9007199254740992: 1024,
-                     18014398509481984: 512,
-                     36028797018963968: 256,
-                     72057594037927936: 128,
-                     144115188075855872: 64,
-                     288230376151711744: 32,
-                     576460752303423488: 16,
-                     1152921504606846976: 8,
-                     2305843009213693952: 4,
-                     4611686018427387904: 2,
-                     9223372036854775808: 1}
-
-PieceSquareTables = [
-    [{1: 0,
-           2: 0,
-           4: 0,
-           8: 0,
-           16: 0,
-           32: 0,
-           64: 0,
-           128: 0,
-           256: 900,
-           512: 850,
-           1024: 820,
-           2048: 1020,
-           4096: 730,
-           8192: 860,
-           16384: 830,
-           32768: 780,
-           65536: 70,
-           131072: 440,
-           262144: 310,
-           524288: 400,
-           1048576: 440,
-           2097152: 210,
-           4194304: 290,
-           8388608: 70,
-           16777216: -130,
-           33554432: 150,
-           67108864: 0,
-           134217728: 140,
-           268435456: 150,
-           536870912: -20,
-           1073741824: 160,
-           2147483648: -170,
-           4294967296: -230,
-           8589934592: 0,
-           17179869184: 10,
-           34359738368: 60,
-           68719476736: 90,
-           137438953472: 100,
-           274877906944: 30,
-           549755813888: -260,
-           1099511627776: -190,
-           2199023255552: 30,
-           4398046511104: -20,
-           8796093022208: -100,
-           17592186044416: -110,
-           35184372088832: 50,
-           70368744177664: 90,
-           140737488355328: -220,
-           281474976710656: -310,
-           562949953421312: 30,
-           1125899906842624: -140,
-           2251799813685248: -360,
-           4503599627370496: -370,
-           9007199254740992: -70,
-           18014398509481984: 80,
-           36028797018963968: -310,
-           72057594037927936: 0,
-           144115188075855872: 0,
-           288230376151711744: 0,
-           576460752303423488: 0,
-           1152921504606846976: 0,
-           2305843009213693952: 0,
-           4611686018427387904: 0,
-           9223372036854775808: 0},
-          {1: -1960,
-           2: -1624,
-           4: -1540,
-           8: -280,
-           16: -2100,
-           32: -2100,
-           64: -1484,
-           128: -1848,
-           256: -392,
-           512: -112,
-           1024: 1736,
-           2048: 112,
-           4096: -1008,
-           8192: 2800,
-           16384: -168,
-           32768: -84,
-           65536: -56,
-           131072: 1736,
-           262144: 756,
-           524288: 2044,
-           1048576: 2072,
-           2097152: 28,
-           4194304: 1876,
-           8388608: 280,
-           16777216: 476,
-           33554432: 700,
-           67108864: 1148,
-           134217728: 924,
-           268435456: 1036,
-           536870912: 1260,
-           1073741824: 672,
-           2147483648: 672,
-           4294967296: 0,
-           8589934592: 56,
-           17179869184: 980,
-           34359738368: 616,
-           68719476736: 588,
-           137438953472: 868,
-           274877906944: 140,
-           549755813888: -28,
-           1099511627776: -392,
-           2199023255552: 308,
-           4398046511104: 420,
-           8796093022208: 504,
-           17592186044416: 616,
-           35184372088832: 364,
-           70368744177664: 280,
-           140737488355328: -504,
-           281474976710656: -560,
-           562949953421312: -644,
-           1125899906842624: 0,
-           2251799813685248: 56,
-           4503599627370496: 0,
-           9007199254740992: 56,
-           18014398509481984: -420,
-           36028797018963968: -644,
-           72057594037927936: -1932,
-           144115188075855872: -616,
-           288230376151711744: -980,
-           576460752303423488: -532,
-           1152921504606846976: -672,
-           2305843009213693952: -728,
-           4611686018427387904: -644,
-           9223372036854775808: -2072},
-          {1: -1600,
-           2: -1184,
-           4: -3424,
-           8: -736,
-           16: -2432,
-           32: -2624,
-           64: -2496,
-           128: -1888,
-           256: -704,
-           512: 64,
-           1024: 992,
-           2048: -1248,
-           4096: -1344,
-           8192: 1120,
-           16384: 640,
-           32768: -352,
-           65536: -448,
-           131072: 896,
-           262144: -320,
-           524288: 1664,
-           1048576: 1312,
-           2097152: -1024,
-           4194304: 1248,
-           8388608: -288,
-           16777216: 320,
-           33554432: 480,
-           67108864: 800,
-           134217728: 832,
-           268435456: 1088,
-           536870912: 640,
-           1073741824: 544,
-           2147483648: 800,
-           4294967296: 224,
-           8589934592: 0,
-           17179869184: 512,
-           34359738368: 544,
-           68719476736: 736,
-           137438953472: 544,
-           274877906944: 320,
-           549755813888: 416,
-           1099511627776: 480,
-           2199023255552: 640,
-           4398046511104: 800,
-           8796093022208: 256,
-           17592186044416: 480,
-           35184372088832: 768,
-           70368744177664: 800,
-           140737488355328: 448,
-           281474976710656: 512,
-           562949953421312: 640,
-           1125899906842624: 192,
-           2251799813685248: 224,
-           4503599627370496: 192,
-           9007199254740992: 352,
-           18014398509481984: 640,
-           36028797018963968: 608,
-           72057594037927936: -320,
-           144115188075855872: -320,
-           288230376151711744: -480,
-           576460752303423488: -448,
-           1152921504606846976: -384,
-           2305843009213693952: -480,
-           4611686018427387904: 64,
-           9223372036854775808: -224},
-          {1: 2400,
-           2: 2688,
-           4: 1584,
-           8: 1776,
-           16: 192,
-           32: 1584,
-           64: 1392,
-           128: 1680,
-           256: 2880,
-           512: 1632,
-           1024: 2976,
-           2048: 2640,
-           4096: 3216,
-           8192: 2688,
-           16384: 1392,
-           32768: 2640,
-           65536: 720,
-           131072: 1200,
-           262144: 1296,
-           524288: 2160,
-           1048576: 1584,
-           2097152: 1344,
-           4194304: 1680,
-           8388608: 912,
-           16777216: -288,
-           33554432: -432,
-           67108864: -192,
-           134217728: 864,
-           268435456: 624,
-           536870912: 768,
-           1073741824: 240,
-           2147483648: 0,
-           4294967296: -1440,
-           8589934592: -2208,
-           17179869184: -1392,
-           34359738368: -624,
-           68719476736: -1008,
-           137438953472: -768,
-           274877906944: -1680,
-           549755813888: -1344,
-           1099511627776: -2208,
-           2199023255552: -1248,
-           4398046511104: -1680,
-           8796093022208: -1200,
-           17592186044416: -1200,
-           35184372088832: -2016,
-           70368744177664: -1344,
-           140737488355328: -2016,
-           281474976710656: -2544,
-           562949953421312: -2112,
-           1125899906842624: -2064,
-           2251799813685248: -1392,
-           4503599627370496: -1248,
-           9007199254740992: -1488,
-           18014398509481984: -1824,
-           36028797018963968: -2544,
-           72057594037927936: -1536,
-           144115188075855872: -1488,
-           288230376151711744: -864,
-           576460752303423488: -96,
-           1152921504606846976: 240,
-           2305843009213693952: -864,
-           4611686018427387904: -1152,
-           9223372036854775808: -1440},
-          {1: 2418,
-           2: 8184,
-           4: 2232,
-           8: 6417,
-           16: -9672,
-           32: -744,
-           64: 93,
-           128: 558,
-           256: 2232,
-           512: 5301,
-           1024: 7068,
-           2048: 1860,
-           4096: -930,
-           8192: 5580,
-           16384: 2976,
-           32768: 1302,
-           65536: 186,
-           131072: 3999,
-           262144: 5859,
-           524288: 6696,
-           1048576: 5580,
-           2097152: 2976,
-           4194304: 3999,
-           8388608: -186,
-           16777216: -558,
-           33554432: -1209,
-           67108864: 1860,
-           134217728: 2325,
-           268435456: 1581,
-           536870912: 2046,
-           1073741824: -1488,
-           2147483648: 93,
-           4294967296: -2046,
-           8589934592: -1860,
-           17179869184: -930,
-           34359738368: -93,
-           68719476736: -465,
-           137438953472: -186,
-           274877906944: -1395,
-           549755813888: -1302,
-           1099511627776: -2511,
-           2199023255552: -1488,
-           4398046511104: -1023,
-           8796093022208: -1488,
-           17592186044416: -1023,
-           35184372088832: -1209,
-           70368744177664: -558,
-           140737488355328: -2790,
-           281474976710656: -3534,
-           562949953421312: -1953,
-           1125899906842624: -1395,
-           2251799813685248: -1395,
-           4503599627370496: -1767,
-           9007199254740992: 0,
-           18014398509481984: -1674,
-           36028797018963968: -3348,
-           72057594037927936: -3906,
-           144115188075855872: -3162,
-           288230376151711744: -3348,
-           576460752303423488: -2883,
-           1152921504606846976: -1209,
-           2305843009213693952: -2883,
-           4611686018427387904: -2790,
-           9223372036854775808: -3627},
-          {1: -372000,
-           2: 498000,
-           4: 360000,
-           8: -594000,
-           16: -594000,
-           32: 282000,
-           64: 324000,
-           128: 24000,
-           256: 18000,
-           512: 60000,
-           1024: 330000,
-           2048: 336000,
-           4096: 336000,
-           8192: 330000,
-           16384: 60000,
-           32768: -192000,
-           65536: -186000,
-           131072: 222000,
-           262144: 168000,
-           524288: -402000,
-           1048576: 264000,
-           2097152: -342000,
-           4194304: 72000,
-           8388608: -372000,
-           16777216: -294000,
-           33554432: 0,
-           67108864: 78000,
-           134217728: -114000,
-           268435456: -24000,
-           536870912: 66000,
-           1073741824: 300000,
-           2147483648: -330000,
-           4294967296: -300000,
-           8589934592: -48000,
-           17179869184: -282000,
-           34359738368: -306000,
-           68719476736: -168000,
-           137438953472: -312000,
-           274877906944: -258000,
-           549755813888: -330000,
-           1099511627776: -192000,
-           2199023255552: -174000,
-           4398046511104: -192000,
-           8796093022208: -384000,
-           17592186044416: -474000,
-           35184372088832: -258000,
-           70368744177664: -252000,
-           140737488355328: -282000,
-           281474976710656: 24000,
-           562949953421312: 78000,
-           1125899906842624: -108000,
-           2251799813685248: -342000,
-           4503599627370496: -300000,
-           9007199254740992: -84000,
-           18014398509481984: 18000,
-           36028797018963968: -24000,
-           72057594037927936: 108000,
-           144115188075855872: 240000,
-           288230376151711744: -6000,
-           576460752303423488: 36000,
-           1152921504606846976: -84000,
-           2305843009213693952: -18000,
-           4611686018427387904: 180000,
-           9223372036854775808: 102000}],
-         [{1: 0,
-           2: 0,
-           4: 0,
-           8: 0,
-           16: 0,
-           32: 0,
-           64: 0,
-           128: 0,
-           256: -310,
-           512: 30,
-           1024: -140,
-           2048: -360,
-           4096: -370,
-           8192: -70,
-           16384: 80,
-           32768: -310,
-           65536: -190,
-           131072: 30,
-           262144: -20,
-           524288: -100,
-           1048576: -110,
-           2097152: 50,
-           4194304: 90,
-           8388608: -220,
-           16777216: -230,
-           33554432: 0,
-           67108864: 10,
-           134217728: 60,
-           268435456: 90,
-           536870912: 100,
-           1073741824: 30,
-           2147483648: -260,
-           4294967296: -130,
-           8589934592: 150,
-           17179869184: 0,
-           34359738368: 140,
-           68719476736: 150,
-           137438953472: -20,
-           274877906944: 160,
-           549755813888: -170,
-           1099511627776: 70,
-           2199023255552: 440,
-           4398046511104: 310,
-           8796093022208: 400,
-           17592186044416: 440,
-           35184372088832: 210,
-           70368744177664: 290,
-           140737488355328: 70,
-           281474976710656: 900,
-           562949953421312: 850,
-           1125899906842624: 820,
-           2251799813685248: 1020,
-           4503599627370496: 730,
-           9007199254740992: 860,
-           18014398509481984: 830,
-           36028797018963968: 780,
-           72057594037927936: 0,
-           144115188075855872: 0,
-           288230376151711744: 0,
-           576460752303423488: 0,
-           1152921504606846976: 0,
-           2305843009213693952: 0,
-           4611686018427387904: 0,
-           9223372036854775808: 0},
-          {1: -1932,
-           2: -616,
-           4: -980,
-           8: -532,
-           16: -672,
-           32: -728,
-           64: -644,
-           128: -2072,
-           256: -560,
-           512: -644,
-           1024: 0,
-           2048: 56,
-           4096: 0,
-           8192: 56,
-           16384: -420,
-           32768: -644,
-           65536: -392,
-           131072: 308,
-           262144: 420,
-           524288: 504,
-           1048576: 616,
-           2097152: 364,
-           4194304: 280,
-           8388608: -504,
-           16777216: 0,
-           33554432: 56,
-           67108864: 980,
-           134217728: 616,
-           268435456: 588,
-           536870912: 868,
-           1073741824: 140,
-           2147483648: -28,
-           4294967296: 476,
-           8589934592: 700,
-           17179869184: 1148,
-           34359738368: 924,
-           68719476736: 1036,
-           137438953472: 1260,
-           274877906944: 672,
-           549755813888: 672,
-           1099511627776: -56,
-           2199023255552: 1736,
-           4398046511104: 756,
-           8796093022208: 2044,
-           17592186044416: 2072,
-           35184372088832: 28,
-           70368744177664: 1876,
-           140737488355328: 280,
-           281474976710656: -392,
-           562949953421312: -112,
-           1125899906842624: 1736,
-           2251799813685248: 112,
-           4503599627370496: -1008,
-           9007199254740992: 2800,
-           18014398509481984: -168,
-           36028797018963968: -84,
-           72057594037927936: -1960,
-           144115188075855872: -1624,
-           288230376151711744: -1540,
-           576460752303423488: -280,
-           1152921504606846976: -2100,
-           2305843009213693952: -2100,
-           4611686018427387904: -1484,
-           9223372036854775808: -1848},
-          {1: -320,
-           2: -320,
-           4: -480,
-           8: -448,
-           16: -384,
-           32: -480,
-           64: 64,
-           128: -224,
-           256: 512,
-           512: 640,
-           1024: 192,
-           2048: 224,
-           4096: 192,
-           8192: 352,
-           16384: 640,
-           32768: 608,
-           65536: 480,
-           131072: 640,
-           262144: 800,
-           524288: 256,
-           1048576: 480,
-           2097152: 768,
-           4194304: 800,
-           8388608: 448,
-           16777216: 224,
-           33554432: 0,
-           67108864: 512,
-           134217728: 544,
-           268435456: 736,
-           536870912: 544,
-           1073741824: 320,
-           2147483648: 416,
-           4294967296: 320,
-           8589934592: 480,
-           17179869184: 800,
-           34359738368: 832,
-           68719476736: 1088,
-           137438953472: 640,
-           274877906944: 544,
-           549755813888: 800,
-           1099511627776: -448,
-           2199023255552: 896,
-           4398046511104: -320,
-           8796093022208: 1664,
-           17592186044416: 1312,
-           35184372088832: -1024,
-           70368744177664: 1248,
-           140737488355328: -288,
-           281474976710656: -704,
-           562949953421312: 64,
-           1125899906842624: 992,
-           2251799813685248: -1248,
-           4503599627370496: -1344,
-           9007199254740992: 1120,
-           18014398509481984: 640,
-           36028797018963968: -352,
-           72057594037927936: -1600,
-           144115188075855872: -1184,
-           288230376151711744: -3424,
-           576460752303423488: -736,
-           1152921504606846976: -2432,
-           2305843009213693952: -2624,
-           4611686018427387904: -2496,
-           9223372036854775808: -1888},
-          {1: -1536,
-           2: -1488,
-           4: -864,
-           8: -96,
-           16: 240,
-           32: -864,
-           64: -1152,
-           128: -1440,
-           256: -2544,
-           512: -2112,
-           1024: -2064,
-           2048: -1392,
-           4096: -1248,
-           8192: -1488,
-           16384: -1824,
-           32768: -2544,
-           65536: -2208,
-           131072: -1248,
-           262144: -1680,
-           524288: -1200,
-           1048576: -1200,
-           2097152: -2016,
-           4194304: -1344,
-           8388608: -2016,
-           16777216: -1440,
-           33554432: -2208,
-           67108864: -1392,
-           134217728: -624,
-           268435456: -1008,
-           536870912: -768,
-           1073741824: -1680,
-           2147483648: -1344,
-           4294967296: -288,
-           8589934592: -432,
-           17179869184: -192,
-           34359738368: 864,
-           68719476736: 624,
-           137438953472: 768,
-           274877906944: 240,
-           549755813888: 0,
-           1099511627776: 720,
-           2199023255552: 1200,
-           4398046511104: 1296,
-           8796093022208: 2160,
-           17592186044416: 1584,
-           35184372088832: 1344,
-           70368744177664: 1680,
-           140737488355328: 912,
-           281474976710656: 2880,
-           562949953421312: 1632,
-           1125899906842624: 2976,
-           2251799813685248: 2640,
-           4503599627370496: 3216,
-           9007199254740992: 2688,
-           18014398509481984: 1392,
-           36028797018963968: 2640,
-           72057594037927936: 2400,
-           144115188075855872: 2688,
-           288230376151711744: 1584,
-           576460752303423488: 1776,
-           1152921504606846976: 192,
-           2305843009213693952: 1584,
-           4611686018427387904: 1392,
-           9223372036854775808: 1680},
-          {1: -3906,
-           2: -3162,
-           4: -3348,
-           8: -2883,
-           16: -1209,
-           32: -2883,
-           64: -2790,
-           128: -3627,
-           256: -3534,
-           512: -1953,
-           1024: -1395,
-           2048: -1395,
-           4096: -1767,
-           8192: 0,
-           16384: -1674,
-           32768: -3348,
-           65536: -2511,
-           131072: -1488,
-           262144: -1023,
-           524288: -1488,
-           1048576: -1023,
-           2097152: -1209,
-           4194304: -558,
-           8388608: -2790,
-           16777216: -2046,
-           33554432: -1860,
-           67108864: -930,
-           134217728: -93,
-           268435456: -465,
-           536870912: -186,
-           1073741824: -1395,
-           2147483648: -1302,
-           4294967296: -558,
-           8589934592: -1209,
-           17179869184: 1860,
-           34359738368: 2325,
-           68719476736: 1581,
-           137438953472: 2046,
-           274877906944: -1488,
-           549755813888: 93,
-           1099511627776: 186,
-           2199023255552: 3999,
-           4398046511104: 5859,
-           8796093022208: 6696,
-           17592186044416: 5580,
-           35184372088832: 2976,
-           70368744177664: 3999,
-           140737488355328: -186,
-           281474976710656: 2232,
-           562949953421312: 5301,
-           1125899906842624: 7068,
-           2251799813685248: 1860,
-           4503599627370496: -930,
-           9007199254740992: 5580,
-           18014398509481984: 2976,
-           36028797018963968: 1302,
-           72057594037927936: 2418,
-           144115188075855872: 8184,
-           288230376151711744: 2232,
-           576460752303423488: 6417,
-           1152921504606846976: -9672,
-           2305843009213693952: -744,
-           4611686018427387904: 93,
-           9223372036854775808: 558},
-          {1: 108000,
-           2: 240000,
-           4: -6000,
-           8: 36000,
-           16: -84000,
-           32: -18000,
-           64: 180000,
-           128: 102000,
-           256: 24000,
-           512: 78000,
-           1024: -108000,
-           2048: -342000,
-           4096: -300000,
-           8192: -84000,
-           16384: 18000,
-           32768: -24000,
-           65536: -192000,
-           131072: -174000,
-           262144: -192000,
-           524288: -384000,
-           1048576: -474000,
-           2097152: -258000,
-           4194304: -252000,
-           8388608: -282000,
-           16777216: -300000,
-           33554432: -48000,
-           67108864: -282000,
-           134217728: -306000,
-           268435456: -168000,
-           536870912: -312000,
-           1073741824: -258000,
-           2147483648: -330000,
-           4294967296: -294000,
-           8589934592: 0,
-           17179869184: 78000,
-           34359738368: -114000,
-           68719476736: -24000,
-           137438953472: 66000,
-           274877906944: 300000,
-           549755813888: -330000,
-           1099511627776: -186000,
-           2199023255552: 222000,
-           4398046511104: 168000,
-           8796093022208: -402000,
-           17592186044416: 264000,
-           35184372088832: -342000,
-           70368744177664: 72000,
-           140737488355328: -372000,
-           281474976710656: 18000,
-           562949953421312: 60000,
-           1125899906842624: 330000,
-           2251799813685248: 336000,
-           4503599627370496: 336000,
-           9007199254740992: 330000,
-           18014398509481984: 60000,
-           36028797018963968: -192000,
-           72057594037927936: -372000,
-           144115188075855872: 498000,
-           288230376151711744: 360000,
-           576460752303423488: -594000,
-           1152921504606846976: -594000,
-           2305843009213693952: 282000,
-           4611686018427387904: 324000,
-           9223372036854775808: 24000}]]
+                     [4611686018427387904, 2305843009213693952, 288230376151711744, 144115188075855872])
 
-from collections import namedtuple
+Center = sum(CenterSquares)
+MinorPieceHomes = tuple(sum(squares) for squares in MinorPieceSquares)
 
-from engine.MoveGen.magic import BishopMagicCache, RookMagicCache
-
-def load_move_masks():
-  masks = (Ranks, Files, Diagonals, AntiDiagonals,
-               ReversedRanks, ReversedFiles, ReversedDiagonals,
-               ReversedAntidiagonals, ReversedSquares, PawnBlockers)
-  MaskSet = namedtuple('MoveMasks', ('ranks','files','diagonals','antidiagonals',
-               'reversedRanks','reversedFiles','reversedDiagonals',
-               'reversedAntidiagonals', 'reversedSquares', 'pawnBlockers'))
-  return MaskSet(*masks)
+# Files by bit index, h file first, and the files on either side of each
+Files = [0x0101010101010101 << file for file in range(8)]
+AdjacentFiles = [(Files[file - 1] if file > 0 else 0) | (Files[file + 1] if file < 7 else 0)
+                 for file in range(8)]
 
 def load_evaluation_masks():
-  masks = (CenterSquares, CenterFiles, MinorPieceSquares)
-  MaskSet = namedtuple('MoveMasks', ('centerSquares', 'centerFiles', 'minorPieceSquares'))
+  masks = (CenterSquares, CenterFiles, MinorPieceSquares, Center, MinorPieceHomes, Files, AdjacentFiles)
+  MaskSet = namedtuple('MoveMasks', ('centerSquares', 'centerFiles', 'minorPieceSquares',
+                                     'center', 'minorPieceHomes', 'files', 'adjacentFiles'))
   return MaskSet(*masks)
-
-def load_magic():
-    MagicCache = namedtuple('MagicCache', 'cache bitboards attacks indices')
-    return [MagicCache(*BishopMagicCache), MagicCache(*RookMagicCache)]
-
-
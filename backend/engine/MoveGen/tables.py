@@ -0,0 +1,258 @@
+import inspect
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+
+import engine.bitmanipulation.bitwise as bitwise
+from engine.MoveGen import Attack, magic
+from engine.MoveGen.magic import ROOK_MAGICS, BISHOP_MAGICS, MASK_64, blocker_subsets
+
+# Precomputed move generation and evaluation tables. They are built once from
+# Attack and the magic numbers, written to tables.bin next to this module and
+# memory-mapped at import, so every process (and every search worker) shares
+# the same read-only pages instead of building its own copy.
+#
+# Every table is a flat array of 64 bit integers indexed by square (bit index),
+# with per-color or per-piece tables laid out back to back:
+#   PAWN_PUSHES[color * 64 + square]
+#   PIECE_SQUARE_TABLES[(color * 6 + pieceType) * 64 + square]
+#   ROOK_ATTACKS[ROOK_OFFSETS[square] + magic index]
+
+TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables.bin')
+
+FILE_MAGIC = b'CHESSTBL'
+HEADER = struct.Struct('<8sII')
+ENTRY = struct.Struct('<24ss7xQQ')
+
+
+def tables_version():
+    # CRC of the source the tables come from: this module (builders, values
+    # and file layout) and the modules it builds with. Any change to them
+    # makes a tables.bin written before it stale.
+    version = 0
+    for module in (sys.modules[__name__], Attack, magic, bitwise):
+        version = zlib.crc32(inspect.getsource(module).encode(), version)
+    return version
+
+
+TABLES_VERSION = tables_version()
+
+# White piece-square values, square 0 first. Black uses the same tables
+# mirrored vertically.
+WHITE_PIECE_SQUARE_VALUES = [
+    # Pawn
+    [0, 0, 0, 0, 0, 0, 0, 0,
+     900, 850, 820, 1020, 730, 860, 830, 780,
+     70, 440, 310, 400, 440, 210, 290, 70,
+     -130, 150, 0, 140, 150, -20, 160, -170,
+     -230, 0, 10, 60, 90, 100, 30, -260,
+     -190, 30, -20, -100, -110, 50, 90, -220,
+     -310, 30, -140, -360, -370, -70, 80, -310,
+     0, 0, 0, 0, 0, 0, 0, 0],
+    # Knight
+    [-1960, -1624, -1540, -280, -2100, -2100, -1484, -1848,
+     -392, -112, 1736, 112, -1008, 2800, -168, -84,
+     -56, 1736, 756, 2044, 2072, 28, 1876, 280,
+     476, 700, 1148, 924, 1036, 1260, 672, 672,
+     0, 56, 980, 616, 588, 868, 140, -28,
+     -392, 308, 420, 504, 616, 364, 280, -504,
+     -560, -644, 0, 56, 0, 56, -420, -644,
+     -1932, -616, -980, -532, -672, -728, -644, -2072],
+    # Bishop
+    [-1600, -1184, -3424, -736, -2432, -2624, -2496, -1888,
+     -704, 64, 992, -1248, -1344, 1120, 640, -352,
+     -448, 896, -320, 1664, 1312, -1024, 1248, -288,
+     320, 480, 800, 832, 1088, 640, 544, 800,
+     224, 0, 512, 544, 736, 544, 320, 416,
+     480, 640, 800, 256, 480, 768, 800, 448,
+     512, 640, 192, 224, 192, 352, 640, 608,
+     -320, -320, -480, -448, -384, -480, 64, -224],
+    # Rook
+    [2400, 2688, 1584, 1776, 192, 1584, 1392, 1680,
+     2880, 1632, 2976, 2640, 3216, 2688, 1392, 2640,
+     720, 1200, 1296, 2160, 1584, 1344, 1680, 912,
+     -288, -432, -192, 864, 624, 768, 240, 0,
+     -1440, -2208, -1392, -624, -1008, -768, -1680, -1344,
+     -2208, -1248, -1680, -1200, -1200, -2016, -1344, -2016,
+     -2544, -2112, -2064, -1392, -1248, -1488, -1824, -2544,
+     -1536, -1488, -864, -96, 240, -864, -1152, -1440],
+    # Queen
+    [2418, 8184, 2232, 6417, -9672, -744, 93, 558,
+     2232, 5301, 7068, 1860, -930, 5580, 2976, 1302,
+     186, 3999, 5859, 6696, 5580, 2976, 3999, -186,
+     -558, -1209, 1860, 2325, 1581, 2046, -1488, 93,
+     -2046, -1860, -930, -93, -465, -186, -1395, -1302,
+     -2511, -1488, -1023, -1488, -1023, -1209, -558, -2790,
+     -3534, -1953, -1395, -1395, -1767, 0, -1674, -3348,
+     -3906, -3162, -3348, -2883, -1209, -2883, -2790, -3627],
+    # King
+    [-372000, 498000, 360000, -594000, -594000, 282000, 324000, 24000,
+     18000, 60000, 330000, 336000, 336000, 330000, 60000, -192000,
+     -186000, 222000, 168000, -402000, 264000, -342000, 72000, -372000,
+     -294000, 0, 78000, -114000, -24000, 66000, 300000, -330000,
+     -300000, -48000, -282000, -306000, -168000, -312000, -258000, -330000,
+     -192000, -174000, -192000, -384000, -474000, -258000, -252000, -282000,
+     24000, 78000, -108000, -342000, -300000, -84000, 18000, -24000,
+     108000, 240000, -6000, 36000, -84000, -18000, 180000, 102000],
+]
+
+
+def step_attacks(square, steps):
+    rank, file = divmod(square, 8)
+    attacks = 0
+    for rankStep, fileStep in steps:
+        if 0 <= rank + rankStep < 8 and 0 <= file + fileStep < 8:
+            attacks |= 1 << (square + 8 * rankStep + fileStep)
+    return attacks
+
+
+def magic_tables(masks, magics, compute_moves):
+    shifts, offsets, attacks = [], [], []
+    for square in range(64):
+        mask = masks[square]
+        shift = 64 - bin(mask).count('1')
+        table = [0] * (1 << (64 - shift))
+        for blockers in blocker_subsets(mask):
+            table[((blockers * magics[square]) & MASK_64) >> shift] = compute_moves(square, blockers)
+        shifts.append(shift)
+        offsets.append(len(attacks))
+        attacks.extend(table)
+    return shifts, offsets, attacks
+
+
+def build():
+    """Compute every table, as name -> (typecode, values)."""
+    rookMasks = [Attack.rook_at(square) for square in range(64)]
+    bishopMasks = [Attack.bishop_at(square) for square in range(64)]
+    rookShifts, rookOffsets, rookAttacks = magic_tables(rookMasks, ROOK_MAGICS, Attack.compute_rook_moves)
+    bishopShifts, bishopOffsets, bishopAttacks = magic_tables(bishopMasks, BISHOP_MAGICS, Attack.compute_bishop_moves)
+
+    pawnPushes = [(1 << square + 8) & MASK_64 for square in range(64)] \
+               + [1 << square - 8 if square >= 8 else 0 for square in range(64)]
+    pawnAttacks = [step_attacks(square, [(1, -1), (1, 1)]) for square in range(64)] \
+                + [step_attacks(square, [(-1, -1), (-1, 1)]) for square in range(64)]
+
+    pieceSquareValues = []
+    for color in range(2):
+        for values in WHITE_PIECE_SQUARE_VALUES:
+            if color:
+                values = [values[square ^ 56] for square in range(64)]
+            pieceSquareValues.extend(values)
+
+    return {
+        'knight_attacks': ('Q', [Attack.knight_at(square) for square in range(64)]),
+        'king_attacks': ('Q', [Attack.king_at(square) for square in range(64)]),
+        'pawn_pushes': ('Q', pawnPushes),
+        'pawn_attacks': ('Q', pawnAttacks),
+        'rook_masks': ('Q', rookMasks),
+        'rook_magics': ('Q', ROOK_MAGICS),
+        'rook_shifts': ('Q', rookShifts),
+        'rook_offsets': ('Q', rookOffsets),
+        'rook_attacks': ('Q', rookAttacks),
+        'bishop_masks': ('Q', bishopMasks),
+        'bishop_magics': ('Q', BISHOP_MAGICS),
+        'bishop_shifts': ('Q', bishopShifts),
+        'bishop_offsets': ('Q', bishopOffsets),
+        'bishop_attacks': ('Q', bishopAttacks),
+        'piece_square_tables': ('q', pieceSquareValues),
+    }
+
+
+def serialize(tables):
+    # Header, one directory entry per table, then the 8 byte aligned arrays
+    entries, chunks = [], []
+    offset = HEADER.size + ENTRY.size * len(tables)
+    for name, (typecode, values) in tables.items():
+        data = array(typecode, values).tobytes()
+        entries.append(ENTRY.pack(name.encode(), typecode.encode(), offset, len(values)))
+        chunks.append(data)
+        offset += len(data)
+
+    header = HEADER.pack(FILE_MAGIC, TABLES_VERSION, len(tables))
+    return b''.join([header] + entries + chunks)
+
+
+def deserialize(buffer):
+    view = memoryview(buffer)
+    fileMagic, version, count = HEADER.unpack_from(view, 0)
+    if fileMagic != FILE_MAGIC or version != TABLES_VERSION:
+        raise ValueError('Precomputed tables are stale or not a table file')
+
+    tables = {}
+    for index in range(count):
+        name, typecode, offset, length = ENTRY.unpack_from(view, HEADER.size + ENTRY.size * index)
+        tables[name.rstrip(b'\0').decode()] = view[offset:offset + 8 * length].cast(typecode.decode())
+    return tables
+
+
+def write(path=TABLES_PATH):
+    data = serialize(build())
+    # Written to a temporary file and renamed so concurrent processes never
+    # map a half written file
+    fd, tempPath = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tables-')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        os.chmod(tempPath, 0o644)
+        os.replace(tempPath, path)
+    except BaseException:
+        os.unlink(tempPath)
+        raise
+    return data
+
+
+def load(path=TABLES_PATH):
+    try:
+        with open(path, 'rb') as file:
+            return deserialize(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError, struct.error):
+        pass
+
+    try:
+        write(path)
+        with open(path, 'rb') as file:
+            return deserialize(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    except OSError:
+        # Read-only install: keep a private copy rather than failing
+        return deserialize(serialize(build()))
+
+
+_tables = load()
+
+KNIGHT_ATTACKS = _tables['knight_attacks']
+KING_ATTACKS = _tables['king_attacks']
+PAWN_PUSHES = _tables['pawn_pushes']
+PAWN_ATTACKS = _tables['pawn_attacks']
+
+ROOK_MASKS = _tables['rook_masks']
+ROOK_MAGIC_NUMBERS = _tables['rook_magics']
+ROOK_SHIFTS = _tables['rook_shifts']
+ROOK_OFFSETS = _tables['rook_offsets']
+ROOK_ATTACKS = _tables['rook_attacks']
+
+BISHOP_MASKS = _tables['bishop_masks']
+BISHOP_MAGIC_NUMBERS = _tables['bishop_magics']
+BISHOP_SHIFTS = _tables['bishop_shifts']
+BISHOP_OFFSETS = _tables['bishop_offsets']
+BISHOP_ATTACKS = _tables['bishop_attacks']
+
+PIECE_SQUARE_TABLES = _tables['piece_square_tables']
+
+
+def rook_attacks(square, occupied):
+    index = ((occupied & ROOK_MASKS[square]) * ROOK_MAGIC_NUMBERS[square]) & MASK_64
+    return ROOK_ATTACKS[ROOK_OFFSETS[square] + (index >> ROOK_SHIFTS[square])]
+
+
+def bishop_attacks(square, occupied):
+    index = ((occupied & BISHOP_MASKS[square]) * BISHOP_MAGIC_NUMBERS[square]) & MASK_64
+    return BISHOP_ATTACKS[BISHOP_OFFSETS[square] + (index >> BISHOP_SHIFTS[square])]
+
+
+if __name__ == '__main__':
+    write()
+    print(f'Wrote {TABLES_PATH}')
@@ -0,0 +1,79 @@
+import pytest
+
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import move_name
+from engine.MoveGen.Generator import Generator
+
+generator = Generator()
+
+
+def legal_moves(fen):
+    board = FastBoard.from_fen(fen)
+    attacks, attackSets = generator.find_attacks(board)
+    return {move_name(move) for move in generator.find_moves(board, attacks, attackSets)}
+
+
+def perft(board, depth):
+    attacks, attackSets = generator.find_attacks(board)
+    moves = generator.find_moves(board, attacks, attackSets)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        board += move
+        nodes += perft(board, depth - 1)
+        board -= move
+    return nodes
+
+
+@pytest.mark.parametrize("fen, depth, expected", [
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", 3, 8902),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1", 2, 2039),
+    ("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1", 3, 2812),
+    ("r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1", 2, 264),
+    ("rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8", 2, 1486),
+])
+def test_perft_matches_reference_counts(fen, depth, expected):
+    board = FastBoard.from_fen(fen)
+    assert perft(board, depth) == expected
+    assert board.make_fen() == fen
+
+
+def test_pinned_piece_stays_on_its_line():
+    moves = legal_moves("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    assert {move for move in moves if move.startswith("e2")} == {"e2e3", "e2e4", "e2e5", "e2e6", "e2e7"}
+
+
+def test_double_check_allows_only_king_moves():
+    moves = legal_moves("4k3/8/8/8/1b6/1N6/8/r3K3 w - - 0 1")
+    assert moves == {"e1e2", "e1f2"}
+
+
+def test_king_cannot_retreat_along_checking_line():
+    moves = legal_moves("4k3/8/8/8/8/8/8/r3K3 w - - 0 1")
+    assert "e1f1" not in moves
+    assert moves == {"e1d2", "e1e2", "e1f2"}
+
+
+def test_en_passant_that_exposes_the_king_is_illegal():
+    moves = legal_moves("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1")
+    assert "e5d6" not in moves
+    assert "e5e6" in moves
+
+
+@pytest.mark.parametrize("fen, move, expected", [
+    # undefended pawn
+    ("1k1r4/1pp4p/p7/4p3/8/P5P1/1PP4P/2K1R3 w - - 0 1", "e1e5", 1),
+    # knight for pawn once the x-rayed queens and rooks have traded off
+    ("1k1r3q/1ppn3p/p4b2/4p3/8/P2N2P1/1PP1R1BP/2K1Q3 w - - 0 1", "d3e5", -2),
+    # even pawn trade
+    ("4k3/8/2p5/3p4/4P3/8/8/4K3 w - - 0 1", "e4d5", 0),
+    # the rook behind recaptures but the pawn defender still wins a rook for a pawn
+    ("4k3/8/4p3/3p4/8/8/3R4/3RK3 w - - 0 1", "d2d5", -3),
+])
+def test_static_exchange(fen, move, expected):
+    board = FastBoard.from_fen(fen)
+    attacks, attackSets = generator.find_attacks(board)
+    captures = {move_name(capture): capture for capture in generator.find_captures(board, attacks, attackSets)}
+    assert generator.static_exchange(board, captures[move]) == expected
@@ -0,0 +1,53 @@
+from engine.FastBoard.moves import encode
+from engine.MoveGen.MoveList import MoveList, KILLER_SCORE, PRINCIPLE_VARIATION_SCORE
+
+
+def make_move(end, pieceType=0, captureType=None):
+    return encode(0, end, pieceType, 0, captureType)
+
+
+def test_pop_follows_staged_order():
+    quiet = make_move(1)
+    losingCapture = make_move(2, pieceType=4, captureType=0)
+    pawnTakesQueen = make_move(3, pieceType=0, captureType=4)
+    rookTakesQueen = make_move(4, pieceType=3, captureType=4)
+    pawnTakesPawn = make_move(5, pieceType=0, captureType=0)
+    principleVariation = make_move(6)
+    killer = make_move(7)
+
+    moves = MoveList()
+    for move in (quiet, losingCapture, pawnTakesQueen, rookTakesQueen, pawnTakesPawn):
+        moves.push(move)
+    moves.push(principleVariation, PRINCIPLE_VARIATION_SCORE)
+    moves.push(killer, KILLER_SCORE)
+
+    order = [moves.pop() for _ in range(len(moves))]
+
+    assert order == [principleVariation, pawnTakesQueen, rookTakesQueen, pawnTakesPawn,
+                     killer, quiet, losingCapture]
+    assert len(moves) == 0
+
+
+def test_iterates_in_generation_order():
+    moves = MoveList()
+    generated = [make_move(end) for end in range(5)]
+    for move in generated:
+        moves.push(move)
+
+    assert list(moves) == generated
+
+
+def test_clear_reuses_the_slots():
+    moves = MoveList()
+    slots = moves.moves
+    for end in range(5):
+        moves.push(make_move(end))
+    moves.pop()
+    moves.clear()
+    refilled = [make_move(end) for end in range(10, 13)]
+    for move in refilled:
+        moves.push(move)
+
+    assert moves.moves is slots
+    assert len(moves) == 3
+    assert list(moves) == refilled
@@ -0,0 +1,46 @@
+from random import Random
+
+import pytest
+
+from engine.MoveGen import Attack, tables
+
+
+@pytest.mark.parametrize("square", [0, 7, 27, 36, 56, 63])
+def test_magic_lookups_match_ray_scan(square):
+    random = Random(square)
+    for _ in range(200):
+        occupied = random.getrandbits(64) & random.getrandbits(64)
+        assert tables.rook_attacks(square, occupied) == Attack.compute_rook_moves(square, occupied)
+        assert tables.bishop_attacks(square, occupied) == Attack.compute_bishop_moves(square, occupied)
+
+
+def test_leaper_tables():
+    assert tables.KING_ATTACKS[0] == 770
+    assert tables.KNIGHT_ATTACKS[27] == 22136263676928
+    assert tables.PAWN_PUSHES[12] == 1 << 20
+    assert tables.PAWN_PUSHES[64 + 52] == 1 << 44
+    assert tables.PAWN_ATTACKS[27] == (1 << 34) | (1 << 36)
+
+
+def test_tables_round_trip():
+    built = tables.build()
+    loaded = tables.deserialize(tables.serialize(built))
+
+    assert set(loaded) == set(built)
+    for name, (typecode, values) in built.items():
+        assert list(loaded[name]) == list(values)
+
+
+def test_stale_tables_are_rejected():
+    data = bytearray(tables.serialize(tables.build()))
+    data[8] ^= 0xFF
+
+    with pytest.raises(ValueError):
+        tables.deserialize(data)
+
+
+def test_tables_version_follows_the_source(monkeypatch):
+    getsource = tables.inspect.getsource
+    monkeypatch.setattr(tables.inspect, "getsource", lambda module: getsource(module) + "# changed")
+
+    assert tables.tables_version() != tables.TABLES_VERSION
@@ -4,8 +4,10 @@ import engine.fen_utils as fen_utils
 from engine.piece import Piece
 import engine.pieces as pieces
 import copy
+import logging
+from collections import namedtuple
 from engine.enpassant.EnPassantStatus import EnPassantStatus
-from engine.utils import fen_to_bitboards
+from engine.utils import placements_to_slots
 from engine.Position import Position
 
 from engine.player.Player import Player   
@@ -14,16 +16,34 @@ from engine.player.WhitePlayer import WhitePlayer
 from engine.player.BlackPlayer import BlackPlayer
 from engine.Move import Move
 
-from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.FastBoard import FastBoard, castling_rights
 
 
+# Everything move_piece changes, captured before the move so unmake_move can
+# put it back. `squares` holds (position, piece, piece position, has_moved).
+UndoRecord = namedtuple('UndoRecord', ('squares', 'dead_counts', 'castling_availability',
+                                       'en_passant', 'halfmoves', 'fullmoves', 'current_player',
+                                       'fen', 'game_state'))
+
+_move_generator = None
+
+def get_move_generator():
+    # Imported and built on first use: the generator's tables are large and
+    # engine.MoveGen itself imports from this package.
+    global _move_generator
+    if _move_generator is None:
+        from engine.MoveGen.Generator import Generator
+        _move_generator = Generator()
+    return _move_generator
+
 
 class Board():
     def __init__(self, fen=constants.START_FEN, log_level=None) -> None:
         super().__init__()
         
         self.logger = get_logger(log_level)
-        self.log(f"Initializing Board with FEN: {fen}")
+        self.log_enabled = self.logger is not None and self.logger.isEnabledFor(logging.DEBUG)
+        self.log("Initializing Board with FEN: %s", fen)
             
         self.fen = fen
         self.board = fen_utils.build_board_from_fen(fen)
@@ -54,13 +74,18 @@ class Board():
             target_pawn_position=target_pawn,
             pawn_color=pawn_color,
         )
+
+        self.undo_stack = []
         
-        self.log(f"Board initialized with FEN: {fen}")
-        self.log(f"Initial board state:\n{self.print_board()}")
+        self.log("Board initialized with FEN: %s", fen)
+        if self.log_enabled:
+            self.log("Initial board state:\n%s", self.print_board())
 
-    def log(self, message):
-        if self.logger is not None:
-            self.logger.debug(message)
+    def log(self, message, *args):
+        # Formatting is left to the logger, so a disabled board only pays for
+        # the call. Anything costly to build belongs behind log_enabled.
+        if self.log_enabled:
+            self.logger.debug(message, *args)
 
     def make_fen(self):
         self.log("Starting FEN generation")
@@ -96,34 +121,38 @@ class Board():
         all_fen = [placements, active, castling, en_passant, str(self.halfmoves), str(self.fullmoves)]
         self.fen = ' '.join(all_fen)
 
-        self.log(f"FEN generated: {self.fen}")
+        self.log("FEN generated: %s", self.fen)
 
-        self.log(f"Current board state after FEN generation:\n{self.print_board()}")
+        if self.log_enabled:
+            self.log("Current board state after FEN generation:\n%s", self.print_board())
 
         return self.fen
 
     def get_piece(self, position: Position) -> Piece | None:
         rank, file = position.rank, position.file
         piece = self.board[rank - 1][file - 1]
-        self.log(f"Getting piece at position: {position}")
-        self.log(f"Piece retrieved: {piece}")
+        if self.log_enabled:
+            self.log("Getting piece at position: %s", position)
+            self.log("Piece retrieved: %s", piece)
         return piece
 
     def set_piece(self, position: Position, piece: Piece):
         rank, file = position.rank, position.file
-        self.log(f"Setting piece at position {position} to {piece}")
-        self.log(f"Piece set at position {position}")
-        self.log(f"Board state:\n{self.print_board()}")
+        if self.log_enabled:
+            self.log("Setting piece at position %s to %s", position, piece)
+            self.log("Piece set at position %s", position)
+            self.log("Board state:\n%s", self.print_board())
         self.board[rank - 1][file - 1] = piece
 
     def clear_square(self, position: Position):
-        self.log(f"Clearing square at position {position}")
-        self.log("Square cleared")
-        self.log(f"Board state:\n{self.print_board()}")
+        if self.log_enabled:
+            self.log("Clearing square at position %s", position)
+            self.log("Square cleared")
+            self.log("Board state:\n%s", self.print_board())
         self.set_piece(position, None)
 
     def get_pseudo_legal_moves(self, position: Position, log=False) -> list:
-        self.log(f"Generating pseudo-legal moves for position {position}")
+        self.log("Generating pseudo-legal moves for position %s", position)
             
         if self.is_stalemate or self.is_checkmate: 
             self.log("No moves available due to stalemate or checkmate")
@@ -143,7 +172,7 @@ class Board():
             
             for pos in path:
                 if not pos.is_on_board():
-                    self.log(f"Position {pos} is not on the board")
+                    self.log("Position %s is not on the board", pos)
                     break
 
                 piece_at_pos = self.get_piece(pos)
@@ -172,13 +201,13 @@ class Board():
             valid_moves.extend(valid_path)
         
         unique_moves = list(set(valid_moves))
-        self.log(f"Generated pseudo legal moves for {position}: {unique_moves}")
+        self.log("Generated pseudo legal moves for %s: %s", position, unique_moves)
 
         return unique_moves
 
 
     def get_all_pseudo_legal_moves(self, player: Player) -> list:
-        self.log(f"Generating all pseudo-legal moves for player {player.color}")
+        self.log("Generating all pseudo-legal moves for player %s", player.color)
 
         moves = []
         for row in self.board:
@@ -189,7 +218,7 @@ class Board():
                     continue
                 moves.extend(self.get_pseudo_legal_moves(piece.position))
         
-        self.log(f"All generated moves for {player.color}: {moves}")
+        self.log("All generated moves for %s: %s", player.color, moves)
         
         return moves
     
@@ -213,18 +242,29 @@ class Board():
         return copy_board
 
     def is_move_legal(self, from_pos: Position, to_pos: Position) -> bool:
-        self.log(f"Checking if move: {from_pos} -> {to_pos} is legal..")
-        board_copy = self.deep_copy()
-        piece = board_copy.get_piece(from_pos)
-        color = piece.get_color() 
-        if color:
-            player_to_check = BlackPlayer() if color == constants.COLOR["BLACK"] else WhitePlayer()
-        else:
-            player_to_check = board_copy.current_player.opponent()
-        board_copy.simulate_move(from_pos, to_pos)
-        self.log(f"Board state after simulated move:\n{board_copy.print_board()}")
-        self.log(f"Checking if king is in check for {player_to_check} from is move legal")
-        if board_copy.is_king_in_check(player_to_check):
+        self.log("Checking if move: %s -> %s is legal..", from_pos, to_pos)
+        piece = self.get_piece(from_pos)
+        if not piece:
+            self.log("No piece to move, illegal move.")
+            return False
+        color = piece.get_color()
+        player_to_check = BlackPlayer() if color == constants.COLOR["BLACK"] else WhitePlayer()
+
+        # move_piece refuses some moves without making them, once the game is
+        # over, and only a move it made may be unmade
+        depth = len(self.undo_stack)
+        self.simulate_move(from_pos, to_pos)
+        if len(self.undo_stack) == depth:
+            self.log("Move was not made, illegal move.")
+            return False
+        try:
+            if self.log_enabled:
+                self.log("Board state after simulated move:\n%s", self.print_board())
+            in_check = self.is_king_in_check(player_to_check)
+        finally:
+            self.unmake_move()
+
+        if in_check:
             self.log("King is in check, illegal move.")
             return False
 
@@ -232,36 +272,51 @@ class Board():
         return True
 
     def simulate_move(self, from_pos: Position, to_pos: Position):
-        self.log(f"Simulating move from {from_pos} to {to_pos}")
+        self.log("Simulating move from %s to %s", from_pos, to_pos)
         self.move_piece(from_pos, to_pos, simulate=True)
         
     def get_legal_moves(self, position: Position, log=False) -> list:
-        legal_moves = []
-        self.log(f"Getting pseudo legal moves from get legal moves for {position}")
-        pseudo_legal_moves = self.get_pseudo_legal_moves(position, log)
-        for to_pos in pseudo_legal_moves:
-            if self.is_move_legal(position, to_pos):
-                legal_moves.append(to_pos)
-        
-        legal_moves = list(set(legal_moves))
-        self.log(f"Legal moves for position {position}: {legal_moves}")
+        if self.is_stalemate or self.is_checkmate:
+            return []
+
+        if not self.get_piece(position):
+            return []
+
+        fastboard = self.to_fastboard()
+        legal_moves = self.find_legal_moves(fastboard, position)
+        if log:
+            self.log("Legal moves for position %s: %s", position, legal_moves)
         return legal_moves
-    
-    def get_legal_moves_with_origin(self, position: Position, log=False) -> list:
+
+    def find_legal_moves(self, fastboard: FastBoard, position: Position) -> list:
+        piece = self.get_piece(position)
+
+        en_passant = 0
+        if self.en_passant.available and self.en_passant.pawn_color != piece.get_color():
+            en_passant = 1 << (self.en_passant.eligible_square.index ^ 7)
+
+        # FastBoard numbers squares h1 = 0 ... a8 = 63, Position a1 = 0 ... h8 = 63
+        targets = get_move_generator().find_legal_targets(
+            fastboard, 1 << (position.index ^ 7), castling_rights(self.castling_availability), en_passant)
+
         legal_moves = []
-        self.log(f"Getting pseudo legal with origin from get legal moves for {position}")
-        pseudo_legal_moves = self.get_pseudo_legal_moves(position, log)
-        for to_pos in pseudo_legal_moves:
-            if self.is_move_legal(position, to_pos):
-                legal_moves.append(Move(position, to_pos, self.get_piece_type_from_pos(position)))
-        
-        legal_moves = list(set(legal_moves))
-        self.log(f"Legal moves for position {position}: {legal_moves}")
+        while targets:
+            target = targets & -targets
+            targets ^= target
+            legal_moves.append(Position(index=(target.bit_length() - 1) ^ 7))
         return legal_moves
+
+    def get_legal_moves_with_origin(self, position: Position, log=False) -> list:
+        piece_type = self.get_piece_type_from_pos(position)
+        return [Move(position, to_pos, piece_type) for to_pos in self.get_legal_moves(position, log)]
     
     
     def get_all_legal_moves(self, player: Player, log=False) -> list:
-        self.log(f"Getting all legal moves for player: {player}")
+        if self.is_stalemate or self.is_checkmate:
+            self.all_legal_moves[player.color] = []
+            return []
+
+        fastboard = self.to_fastboard()
         moves = []
         for row in self.board:
             for piece in row:
@@ -269,15 +324,16 @@ class Board():
                     continue 
                 if piece.get_color() != player.color: 
                     continue
-                moves.extend(self.get_legal_moves(piece.position, log))
+                moves.extend(self.find_legal_moves(fastboard, piece.position))
         self.all_legal_moves[player.color] = moves
         
         moves = list(set(moves))
-        self.log(f"All legal moves for {player.color}: {moves}")
+        if log:
+            self.log("All legal moves for %s: %s", player.color, moves)
         return moves
 
     def get_all_legal_moves_with_origin(self, player: Player, log=False) -> list:
-        self.log(f"Getting all legal moves with origin for player: {player}")
+        self.log("Getting all legal moves with origin for player: %s", player)
         moves = []
         for row in self.board:
             for piece in row:
@@ -289,16 +345,16 @@ class Board():
         self.all_legal_moves[player.color] = moves
         
         moves = list(set(moves))
-        self.log(f"All legal moves for {player.color}: {moves}")
+        self.log("All legal moves for %s: %s", player.color, moves)
         return moves
 
 
     def is_king_in_check(self, player: Player) -> bool:
         king = self.get_king_location(player)
-        self.log(f"Checking if king in check for player: {player} whose king is at {king}")
+        self.log("Checking if king in check for player: %s whose king is at %s", player, king)
         opponent = player.opponent()
         all_possible_moves = self.get_all_pseudo_legal_moves(opponent)
-        self.log(f"For that got all pseudo legal moves for {opponent} and current player is {player}: {all_possible_moves}")
+        self.log("For that got all pseudo legal moves for %s and current player is %s: %s", opponent, player, all_possible_moves)
         for move in all_possible_moves:
             if move == king:
                 self.king_in_check = player
@@ -315,7 +371,7 @@ class Board():
                 if piece.get_color() != player.color: 
                     continue 
                 if piece.get_name().lower() == 'k':
-                    self.log(f"King found for {player} at {piece.position}")
+                    self.log("King found for %s at %s", player, piece.position)
                     return piece.position
         self.log("King not found for player")
         return Position()
@@ -331,7 +387,7 @@ class Board():
             eligible_square_rank = to_rank  + 1 if moved_piece.get_color() == constants.COLOR["WHITE"] else to_rank - 1
             eligible_square = Position(rank=eligible_square_rank, file=to_file)
             self.en_passant.set(eligible_square, to_pos, moved_piece.get_color())
-            self.log(f"En passant set for {moved_piece.get_color()} at {eligible_square}")
+            self.log("En passant set for %s at %s", moved_piece.get_color(), eligible_square)
 
         else:
             self.en_passant.clear()
@@ -339,7 +395,7 @@ class Board():
             
 
     def check_en_passant_possible_for_piece(self, piece: Piece):
-        self.log(f"Checking en passant possibility for piece at {piece.position}")
+        self.log("Checking en passant possibility for piece at %s", piece.position)
         
         piece_pos = piece.position
         rank, file = piece_pos.rank, piece_pos.file
@@ -363,7 +419,7 @@ class Board():
         if self.is_stalemate:
             return (constants.NO_KILL, constants.STALEMATE)
         
-        self.log(f"Received command for move: {from_pos} -> {to_pos}")
+        self.log("Received command for move: %s -> %s", from_pos, to_pos)
         piece = self.get_piece(from_pos)
         piece_at_pos = self.get_piece(to_pos)
 
@@ -375,6 +431,8 @@ class Board():
             self.log("Move not valid")
             return constants.ERROR_MOVE_NOT_POSSIBLE
 
+        self.undo_stack.append(self.make_undo_record(from_pos, to_pos, piece))
+
         kill_status = constants.NO_KILL
         special_status = constants.NO_CHECK
         
@@ -393,14 +451,73 @@ class Board():
         
         special_status = self.post_move_checks(from_pos, to_pos) if not simulate else constants.NO_CHECK
         self.current_player = self.current_player.opponent() if not simulate else self.current_player
-        self.log(f"Swapped current player from {self.current_player.opponent()} -> {self.current_player}")
+        if self.log_enabled:
+            self.log("Swapped current player from %s -> %s", self.current_player.opponent(), self.current_player)
         
         self.fen = self.make_fen()
         
-        self.log(f"Completed move: {from_pos} -> {to_pos} with kill status: {kill_status} and special status: {special_status}")
-        self.log(f"Updated FEN: {self.fen}")
+        self.log("Completed move: %s -> %s with kill status: %s and special status: %s", from_pos, to_pos, kill_status, special_status)
+        self.log("Updated FEN: %s", self.fen)
         return (kill_status, special_status) if not detailed_return else (kill_status, special_status, piece)
         
+    def make_undo_record(self, from_pos: Position, to_pos: Position, piece: Piece) -> UndoRecord:
+        touched = [from_pos, to_pos]
+        if isinstance(piece, pieces.King) and abs(to_pos.file - from_pos.file) > 1:
+            rank = from_pos.algebraic[1]
+            touched.extend(Position(algebraic=file + rank) for file in 'adfh')
+        if isinstance(piece, pieces.Pawn) and self.en_passant.available and to_pos == self.en_passant.eligible_square:
+            touched.append(self.en_passant.target_pawn_position)
+
+        squares = []
+        for position in touched:
+            occupant = self.get_piece(position)
+            if occupant is None:
+                squares.append((position, None, None, None))
+            else:
+                squares.append((position, occupant, occupant.position, occupant.has_moved))
+
+        en_passant = self.en_passant
+        castling = self.castling_availability
+        return UndoRecord(
+            squares=squares,
+            dead_counts=(len(self.dead_pieces[constants.COLOR["WHITE"]]), len(self.dead_pieces[constants.COLOR["BLACK"]])),
+            castling_availability=castling if isinstance(castling, str) else set(castling),
+            en_passant=(en_passant.available, en_passant.eligible_square,
+                        en_passant.target_pawn_position, en_passant.pawn_color),
+            halfmoves=self.halfmoves,
+            fullmoves=self.fullmoves,
+            current_player=self.current_player,
+            fen=self.fen,
+            game_state=(self.is_stalemate, self.is_checkmate, self.winner, self.king_in_check),
+        )
+
+    def unmake_move(self):
+        if not self.undo_stack:
+            return False
+
+        undo = self.undo_stack.pop()
+        self.log("Unmaking last move")
+
+        for position, piece, piece_position, has_moved in undo.squares:
+            self.board[position.rank - 1][position.file - 1] = piece
+            if piece is not None:
+                piece.position = piece_position
+                piece.has_moved = has_moved
+
+        white_dead, black_dead = undo.dead_counts
+        del self.dead_pieces[constants.COLOR["WHITE"]][white_dead:]
+        del self.dead_pieces[constants.COLOR["BLACK"]][black_dead:]
+
+        self.castling_availability = undo.castling_availability
+        (self.en_passant.available, self.en_passant.eligible_square,
+         self.en_passant.target_pawn_position, self.en_passant.pawn_color) = undo.en_passant
+        self.halfmoves = undo.halfmoves
+        self.fullmoves = undo.fullmoves
+        self.current_player = undo.current_player
+        self.fen = undo.fen
+        self.is_stalemate, self.is_checkmate, self.winner, self.king_in_check = undo.game_state
+        return True
+
     def update_board(self, from_pos: Position, to_pos: Position):
         self.log("Updating board state post-move")
         
@@ -413,13 +530,14 @@ class Board():
 
         
     def post_move_checks(self, from_pos: Position, to_pos: Position):
-        self.log(f"Checking post-move conditions for {from_pos} -> {to_pos}")
+        self.log("Checking post-move conditions for %s -> %s", from_pos, to_pos)
          
         if self.try_pawn_promote(to_pos, do_it=False) == constants.PAWN_CAN_PROMOTE:
             self.log("Pawn promotion possible after move")
             return constants.PROMOTE_POSSIBLE
 
-        self.log(f"Checking if game is over for {self.current_player.opponent()}")
+        if self.log_enabled:
+            self.log("Checking if game is over for %s", self.current_player.opponent())
         if self.is_game_over():
             self.log("Game over")
             return constants.CHECKMATE if self.is_checkmate else constants.STALEMATE
@@ -431,7 +549,7 @@ class Board():
         return constants.NO_CHECK
         
     def is_valid_move(self, from_pos: Position, to_pos: Position):
-        self.log(f"Validating move {from_pos} -> {to_pos}")
+        self.log("Validating move %s -> %s", from_pos, to_pos)
         possible_moves = self.get_pseudo_legal_moves(from_pos)
         if to_pos not in possible_moves:
             self.log("Move not valid based on pseudo-legal moves")
@@ -439,7 +557,7 @@ class Board():
         return True
     
     def move(self, from_pos: Position, to_pos: Position):
-        self.log(f"Executing move {from_pos} -> {to_pos}")
+        self.log("Executing move %s -> %s", from_pos, to_pos)
         
         piece = self.get_piece(from_pos)
         if piece is None:
@@ -449,7 +567,7 @@ class Board():
         self.set_piece(to_pos, piece)
         piece.update_position(to_pos)
         if killed_piece: 
-            self.log(f"Piece killed at {to_pos}")
+            self.log("Piece killed at %s", to_pos)
             self.dead_pieces[killed_piece.get_color()].append(killed_piece)
             return constants.KILL
         
@@ -458,7 +576,7 @@ class Board():
 
         
     def check_for_castle(self, from_pos: Position, to_pos: Position):
-        self.log(f"Checking for castle move: {from_pos} to {to_pos}")
+        self.log("Checking for castle move: %s to %s", from_pos, to_pos)
         
         piece = self.get_piece(from_pos)
         has_castled = False
@@ -481,13 +599,13 @@ class Board():
                     removed_pawn = self.get_piece(self.en_passant.target_pawn_position)
                     self.clear_square(self.en_passant.target_pawn_position)
                     self.dead_pieces[removed_pawn.get_color()].append(removed_pawn)
-                    self.log(f"En passant executed, removing pawn at {self.en_passant.target_pawn_position}")
+                    self.log("En passant executed, removing pawn at %s", self.en_passant.target_pawn_position)
                     return True
         self.log("En passant not executed")
         return False
               
     def get_castlable_moves(self, piece):
-        self.log(f"Getting castlable moves for king at {piece.position}")
+        self.log("Getting castlable moves for king at %s", piece.position)
         moves = []
             
         if isinstance(piece, pieces.King):
@@ -550,7 +668,7 @@ class Board():
     def is_targeted_square(self, position: Position):
         player = self.current_player.opponent()
         legal_moves = self.all_legal_moves[player.color]
-        self.log(f"Checking if square {position} is targeted by {player}: {position in legal_moves}")
+        self.log("Checking if square %s is targeted by %s: %s", position, player, position in legal_moves)
         return position in legal_moves
     
     def castle(self, piece: Piece, from_pos: Position, to_pos: Position):
@@ -613,7 +731,7 @@ class Board():
             if is_rook_ready_for_castling(self.board[0][7], 'r'):
                 self.castling_availability += 'k'
 
-        self.log(f"Updated castling availability: {self.castling_availability}")
+        self.log("Updated castling availability: %s", self.castling_availability)
 
     def is_game_over(self):
         self.log("Checking if the game is over")
@@ -624,7 +742,7 @@ class Board():
         current = self.current_player # White
         opponent = self.current_player.opponent()
         all_legal_moves = self.get_all_legal_moves(opponent, log=False)
-        self.log(f"All legal moves for player {opponent} are: {all_legal_moves}")
+        self.log("All legal moves for player %s are: %s", opponent, all_legal_moves)
         
         if len(all_legal_moves) == 0:
             if self.are_only_kings_on_board():
@@ -633,7 +751,7 @@ class Board():
                 self.log("Game is a stalemate due to only kings left on the board")
             
             else:
-                self.log(f"No legal moves possible for player {opponent}, checking for check conditions")
+                self.log("No legal moves possible for player %s, checking for check conditions", opponent)
                 king_in_check = self.is_king_in_check(opponent)
                 if king_in_check:
                     self.is_checkmate = True
@@ -667,7 +785,7 @@ class Board():
         piece = self.get_piece(position)
         
         if not isinstance(piece, pieces.Pawn):
-            self.log(f"No pawn at position {position} to promote")
+            self.log("No pawn at position %s to promote", position)
             return constants.PAWN_CANNOT_PROMOTE
         
         final_rank = constants.MAX_RANK if piece.get_color() == constants.COLOR["BLACK"] else constants.MIN_RANK 
@@ -675,18 +793,18 @@ class Board():
         can_promote = rank == final_rank
         if not do_it: 
             if can_promote: 
-                self.log(f"Pawn at {position} can be promoted")
+                self.log("Pawn at %s can be promoted", position)
                 
                 return constants.PAWN_CAN_PROMOTE
             else: 
-                self.log(f"Pawn at {position} cannot be promoted yet")
+                self.log("Pawn at %s cannot be promoted yet", position)
                 return constants.PAWN_CANNOT_PROMOTE  
        
         if can_promote:
             promoted_piece = self.make_promotion_piece(promote_to, position, piece.get_color())
             self.set_piece(position, promoted_piece)
             self.fen = self.make_fen() 
-            self.log(f"Pawn at {position} promoted to {promote_to}")
+            self.log("Pawn at %s promoted to %s", position, promote_to)
               
             if self.is_game_over():
                 self.log("Game over after promotion")
@@ -694,7 +812,7 @@ class Board():
                 return constants.SUCCESS_PAWN_PROMOTED_CHECKMATE if self.is_checkmate else constants.SUCCESS_PAWN_PROMOTED_STALEMATE
             
             if self.is_king_in_check(self.current_player):
-                self.log(f"King in check after promotion at {position}")
+                self.log("King in check after promotion at %s", position)
                 return constants.SUCCESS_PAWN_PROMOTED_CHECK
             
         return constants.SUCCESS_PAWN_PROMOTED
@@ -742,7 +860,23 @@ class Board():
         return piece.get_name()
     
     def to_fastboard(self) -> FastBoard:
-        return FastBoard(pieces=fen_to_bitboards(self.fen), active=1 if isinstance(self.current_player, BlackPlayer) else 0)
+        # Read from the squares rather than self.fen, which is only refreshed
+        # at the end of move_piece
+        placements = []
+        for r, row in enumerate(self.board):
+            for c, piece in enumerate(row):
+                if piece:
+                    placements.append((piece.get_name(), (7 - r) * 8 + 7 - c))
+
+        active = 1 if isinstance(self.current_player, BlackPlayer) else 0
+        en_passant = 0
+        if self.en_passant.available and self.en_passant.pawn_color != active:
+            en_passant = 1 << (self.en_passant.eligible_square.index ^ 7)
+
+        bitboards, types = placements_to_slots(placements)
+        return FastBoard(pieces=bitboards, types=types, active=active,
+                         castling=castling_rights(self.castling_availability), enPassant=en_passant,
+                         halfmoveClock=self.halfmoves, fullmoveNumber=self.fullmoves)
         
 
     
@@ -7,7 +7,11 @@ def verbose(self, message, *args, **kws):
     pass
 logging.Logger.verbose = verbose
 
+# Shared by every Board; added to the logger only once
+_file_handler = None
+
 def get_logger(log_level):
+    global _file_handler
     if log_level is None:
         return None
     
@@ -26,11 +30,12 @@ def get_logger(log_level):
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     # ch.setFormatter(formatter)
     
-    fh = logging.FileHandler('chess.log')
-    fh.setLevel(log_level)  
-    fh.setFormatter(formatter)
+    if _file_handler is None:
+        _file_handler = logging.FileHandler('chess.log')
+        _file_handler.setFormatter(formatter)
 
-    # logger.addHandler(ch)
-    logger.addHandler(fh)
+        # logger.addHandler(ch)
+        logger.addHandler(_file_handler)
+    _file_handler.setLevel(log_level)
 
     return logger
\ No newline at end of file
@@ -1,6 +1,8 @@
-from engine.bitmanipulation.utils import lsb
 from engine.Move import Move 
 from engine.Position import Position
+from engine.FastBoard.PieceList import SLOT_TYPES
+from engine.FastBoard.moves import (move_start, move_end, move_piece, move_color,
+                                    move_capture, move_promotion)
 
 def lists_equal(lst1, lst2, verbose=False):
     if not lst1 and lst2: 
@@ -64,38 +66,104 @@ def boards_equal(board1, board2, verbose=False):
 
     return True
 
-def fen_to_bitboards(fen):
-    pieces_placement = fen.split(' ')[0]
-    rows = pieces_placement.split('/')
-    
-    bitboards = [0] * 32 
+# First PieceList slot of each piece, matching PieceList.SLOT_TYPES
+PIECE_SLOTS = {
+    'P': 0, 'N': 8, 'B': 10, 'R': 12, 'Q': 14, 'K': 15,
+    'p': 16, 'n': 24, 'b': 26, 'r': 28, 'q': 30, 'k': 31
+}
 
-    piece_count = {
-        'R': 0, 'N': 0, 'B': 0, 'Q': 0, 'K': 0, 'P': 0,
-        'r': 0, 'n': 0, 'b': 0, 'q': 0, 'k': 0, 'p': 0
-    }
+PIECE_TYPES = {'p': 0, 'n': 1, 'b': 2, 'r': 3, 'q': 4, 'k': 5}
+
+# Number of slots each piece has in a PieceList
+PIECE_SLOT_COUNTS = {
+    'P': 8, 'N': 2, 'B': 2, 'R': 2, 'Q': 1, 'K': 1,
+    'p': 8, 'n': 2, 'b': 2, 'r': 2, 'q': 1, 'k': 1
+}
+
+
+def placements_to_bitboards(placements):
+    """Lay (piece letter, bit index) pairs out as FastBoard piece slots."""
+    bitboards = [0] * 32
+    piece_count = dict.fromkeys(PIECE_SLOTS, 0)
+
+    for char, bit_position in placements:
+        if piece_count[char] == PIECE_SLOT_COUNTS[char]:
+            raise RuntimeError(f"No free piece slot for '{char}'")
+        bitboards[PIECE_SLOTS[char] + piece_count[char]] = 1 << bit_position
+        piece_count[char] += 1
+
+    return bitboards
+
+
+def placements_to_slots(placements):
+    """Lay (piece letter, bit index) pairs out as FastBoard piece slots and slot types.
+
+    Pieces fill their usual slots first; extra pieces of a kind, such as a
+    promoted queen, take any free slot of their color.
+    """
+    bitboards = [0] * 32
+    types = list(SLOT_TYPES)
+    piece_count = dict.fromkeys(PIECE_SLOTS, 0)
+
+    extra = []
+    for char, bit_position in placements:
+        if piece_count[char] == PIECE_SLOT_COUNTS[char]:
+            extra.append((char, bit_position))
+            continue
+        bitboards[PIECE_SLOTS[char] + piece_count[char]] = 1 << bit_position
+        piece_count[char] += 1
+
+    for char, bit_position in extra:
+        color_start = 16 if char.islower() else 0
+        free = [slot for slot in range(color_start, color_start + 16) if bitboards[slot] == 0]
+        if not free:
+            raise RuntimeError(f"No free piece slot for '{char}'")
+        bitboards[free[0]] = 1 << bit_position
+        types[free[0]] = PIECE_TYPES[char.lower()]
+
+    return bitboards, types
 
-    piece_start_indices = {
-        'R': 12, 'N': 8, 'B': 10, 'Q': 15, 'K': 14, 'P': 0,
-        'r': 28, 'n': 24, 'b': 26, 'q': 31, 'k': 30, 'p': 16
-    }
 
+def fen_to_placements(fen):
+    pieces_placement = fen.split(' ')[0]
+    rows = pieces_placement.split('/')
     rows.reverse()
-    
+
+    placements = []
     for row_index, row in enumerate(rows):
         file_index = 0
         for char in row:
             if char.isdigit():
                 file_index += int(char)
             elif char.isalpha():
-                current_piece_index = piece_start_indices[char] + piece_count[char]
                 adjusted_file_index = 7 - file_index  # This line inverts the order
-                bit_position = (8 * row_index) + adjusted_file_index
-                bitboards[current_piece_index] = 1 << bit_position
-                piece_count[char] += 1
+                placements.append((char, (8 * row_index) + adjusted_file_index))
                 file_index += 1
 
-    return bitboards
+    return placements
+
+
+def fen_to_bitboards(fen):
+    return placements_to_bitboards(fen_to_placements(fen))
+
+
+def position_to_square(position):
+    # Position indexes run a1 = 0 along each rank, bitboard squares h1 = 0
+    return position.index ^ 7
+
+
+def square_to_position(square):
+    return Position(index=square ^ 7)
+
+
+def object_move_to_bitboard(fastboard, from_pos, to_pos, promotion=4):
+    """Pack a move given as Positions for the FastBoard it is about to be played on.
+
+    Returns None if the move is not legal there.
+    """
+    from engine.board import get_move_generator
+    return get_move_generator().legal_move(fastboard, position_to_square(from_pos),
+                                           position_to_square(to_pos), promotion)
 
 
 def bitboard_move_to_object(move):
@@ -107,14 +175,13 @@ def bitboard_move_to_object(move):
         4: 'q',
         5: 'k'
     }
-    start = Position(index=lsb(move.start))
-    end = Position(index=lsb(move.end))
-    print(f"Found start and end: ", move.start, lsb(move.start), lsb(move.end))
-    piece_type = piece_map[move.pieceType] if move.color == 1 else piece_map[move.pieceType].upper()
-    color = move.color 
-    capture = move.captureType
-    
-    return Move(start, end, piece_type, color=color, capture=capture)
-    
-    
-    
\ No newline at end of file
+    start = square_to_position(move_start(move))
+    end = square_to_position(move_end(move))
+    piece_type = move_piece(move)
+    color = move_color(move)
+    piece_type = piece_map[piece_type] if color == 1 else piece_map[piece_type].upper()
+    capture = move_capture(move)
+    promotion = move_promotion(move)
+    promotion = piece_map[promotion] if promotion is not None else None
+
+    return Move(start, end, piece_type, promotion=promotion, color=color, capture=capture)
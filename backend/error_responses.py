@@ -1,6 +1,8 @@
 ERROR_TYPE_NODATA = 'err-no-data'
 ERROR_TYPE_NOPOSITION = 'err-no-pos'
 ERROR_TYPE_NOPROMOTE_TYPE = 'err-no-promote-type'
+ERROR_TYPE_NOGAME = 'err-no-game'
+ERROR_TYPE_TIME_LIMIT = 'err-time-limit'
 
 RESPONSE_ERROR_DATA = {
     'type': 'error',
@@ -27,4 +29,22 @@ RESPONSE_ERROR_PROMOTE_TYPE = {
         'type': ERROR_TYPE_NOPROMOTE_TYPE,
         'message': 'No promotion type provided!'
     },
+}
+
+RESPONSE_ERROR_NO_GAME = {
+    'type': 'error',
+    'data': None,
+    'error': {
+        'type': ERROR_TYPE_NOGAME,
+        'message': 'No game in progress, send init first!'
+    },
+}
+
+RESPONSE_ERROR_TIME_LIMIT = {
+    'type': 'error',
+    'data': None,
+    'error': {
+        'type': ERROR_TYPE_TIME_LIMIT,
+        'message': 'time_limit must be a positive number of milliseconds!'
+    },
 }
\ No newline at end of file
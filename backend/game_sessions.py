@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+
+import engine.constants as constants
+from engine.board import get_move_generator
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import PROMOTION_MASK, PROMOTION_SHIFT, is_capture, move_end
+from engine.utils import position_to_square, square_to_position
+
+PROMOTION_PIECES = {'queen': 4, 'rook': 3, 'bishop': 2, 'knight': 1}
+
+
+class GameSession():
+    """One game, played on a FastBoard with the same status codes as Board."""
+
+    # Longest a ponder search runs, in milliseconds, so a player who walks
+    # away does not leave the engine searching for good
+    PONDER_TIME_LIMIT = 60000
+
+    def __init__(self, session_id, fen=constants.START_FEN):
+        self.session_id = session_id
+        self.fastboard = FastBoard.from_fen(fen)
+        self.generator = get_move_generator()
+        self.last_move = None
+        self._valkyrie = None
+        self._ponder_thread = None
+        self._ponder_stop = None
+        self.last_active = time.monotonic()
+
+    @property
+    def valkyrie(self):
+        # Only needed when searching in-process, so it is built on first use
+        # rather than paying for its tables in every session.
+        if self._valkyrie is None:
+            from valkyrie.Valkyrie import Valkyrie
+            self._valkyrie = Valkyrie()
+        return self._valkyrie
+
+    def touch(self):
+        self.last_active = time.monotonic()
+
+    def start_pondering(self, time_limit=PONDER_TIME_LIMIT):
+        """Search the reply the engine expects on a background thread while
+        the player thinks, so the engine's next search finds that position in
+        its table. Returns False when there is no expected reply."""
+        self.stop_pondering()
+        entry = self.valkyrie.table.lookup(self.fastboard.hash)
+        if entry is None or entry[3] is None:
+            return False
+
+        # The thread searches its own copy, the session's board keeps changing
+        board = FastBoard.deserialize(self.fastboard.serialize())
+        board += entry[3]
+        self._ponder_stop = threading.Event()
+        self._ponder_thread = threading.Thread(target=self.valkyrie.ponder, args=(board, self._ponder_stop),
+                                               kwargs={'timeLimit': time_limit}, daemon=True)
+        self._ponder_thread.start()
+        return True
+
+    def stop_pondering(self):
+        if self._ponder_thread is None:
+            return
+        self._ponder_stop.set()
+        self._ponder_thread.join()
+        self._ponder_thread = None
+
+    def make_fen(self):
+        return self.fastboard.make_fen()
+
+    def game_status(self):
+        # Status of the side to move, as Board.post_move_checks reports it
+        board = self.fastboard
+        if board.occupied == board.pieceTypes[5]:
+            return constants.STALEMATE
+        in_check = self.generator.is_in_check(board)
+        if not self.generator.has_legal_move(board):
+            return constants.CHECKMATE if in_check else constants.STALEMATE
+        return constants.CHECK if in_check else constants.NO_CHECK
+
+    def get_legal_moves(self, position):
+        if self.game_status() in (constants.CHECKMATE, constants.STALEMATE):
+            return []
+
+        piece = 1 << position_to_square(position)
+        if not self.fastboard.colors[self.fastboard.active] & piece:
+            return []
+
+        targets = self.generator.find_legal_targets(self.fastboard, piece)
+        legal_moves = []
+        while targets:
+            target = targets & -targets
+            targets ^= target
+            legal_moves.append(square_to_position(target.bit_length() - 1))
+        return legal_moves
+
+    def move_piece(self, from_pos, to_pos):
+        """Play a move given as Positions; returns (kill status, special status)."""
+        status = self.game_status()
+        if status in (constants.CHECKMATE, constants.STALEMATE):
+            return (constants.NO_KILL, status)
+
+        start = position_to_square(from_pos)
+        if not self.fastboard.occupied & (1 << start):
+            return constants.ERROR_NO_PIECE_TO_MOVE
+
+        # Promotions are made to a queen until promote_pawn says otherwise
+        move = self.generator.legal_move(self.fastboard, start, position_to_square(to_pos))
+        if move is None:
+            return constants.ERROR_MOVE_NOT_POSSIBLE
+
+        kill_status = self.play(move)
+        if move & PROMOTION_MASK:
+            return (kill_status, constants.PROMOTE_POSSIBLE)
+        return (kill_status, self.game_status())
+
+    def play(self, move):
+        self.fastboard += move
+        self.last_move = move
+        return constants.KILL if is_capture(move) else constants.NO_KILL
+
+    def promote_pawn(self, position, promote_to="queen"):
+        # Swaps the piece the last move promoted to for the one asked for
+        move = self.last_move
+        promoted = move is not None and move & PROMOTION_MASK and move_end(move) == position_to_square(position)
+        if not promoted or promote_to not in PROMOTION_PIECES:
+            return (constants.NOT_PROMOTED, constants.PAWN_CANNOT_PROMOTE)
+
+        self.fastboard -= move
+        self.play(move & ~PROMOTION_MASK | (PROMOTION_PIECES[promote_to] + 1) << PROMOTION_SHIFT)
+
+        status = self.game_status()
+        if status == constants.CHECKMATE:
+            return constants.SUCCESS_PAWN_PROMOTED_CHECKMATE
+        if status == constants.STALEMATE:
+            return constants.SUCCESS_PAWN_PROMOTED_STALEMATE
+        if status == constants.CHECK:
+            return constants.SUCCESS_PAWN_PROMOTED_CHECK
+        return constants.SUCCESS_PAWN_PROMOTED
+
+
+class SessionRegistry():
+    def __init__(self, max_sessions=500, idle_timeout=1800):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+
+        # Least recently used session first
+        self.sessions = OrderedDict()
+
+    def create(self, session_id):
+        self.evict_idle()
+
+        self.remove(session_id)
+        while len(self.sessions) >= self.max_sessions:
+            self.sessions.popitem(last=False)[1].stop_pondering()
+
+        session = GameSession(session_id)
+        self.sessions[session_id] = session
+        return session
+
+    def get(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+
+        session.touch()
+        self.sessions.move_to_end(session_id)
+        return session
+
+    def remove(self, session_id):
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.stop_pondering()
+
+    def evict_idle(self):
+        cutoff = time.monotonic() - self.idle_timeout
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_active > cutoff:
+                break
+            self.remove(session_id)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self.sessions
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 import json
-from engine import Board
+import asyncio
 import error_responses
 from engine import fen_utils
 import engine.constants
@@ -8,25 +8,84 @@ from fastapi.middleware.cors import CORSMiddleware
 from engine.Position import Position
 
 from engine.utils import bitboard_move_to_object
-from valkyrie.Valkyrie import Valkyrie
+from valkyrie.SearchExecutor import SearchExecutor
+from valkyrie.LazySMP import LazySMP, SearchBusy, WorkerLost
+from game_sessions import SessionRegistry
 from engine.player.WhitePlayer import WhitePlayer
 
+import hmac
 import logging
+import os
 import time 
-
-from collections import namedtuple
+import uuid
+from contextlib import asynccontextmanager
 
 logging.basicConfig(level=logging.DEBUG)
 
 logger = logging.getLogger("chess_backend")
 
-Move = namedtuple('Move', ('start', 'end', 'pieceType', 'color', 'captureType',
-                           'captureStrength', 'isPrincipleVariation'))
-app = FastAPI(debug=True)
-board = None
-valkyrie = None
-fastboard = None 
-in_progress = False
+# Default search budget for next_move, in milliseconds, when the client does
+# not send one, and the most a client may ask for.
+DEFAULT_SEARCH_TIME = 3000
+MAX_SEARCH_TIME = int(os.environ.get("MAX_SEARCH_TIME", 30000))
+
+# Iterative deepening goes on until the budget runs out. This only caps it
+# where iterations come cheap, such as forced lines with few legal moves.
+MAX_SEARCH_DEPTH = 64
+
+# Number of engine worker processes; defaults to one per core. With 0 the
+# search runs in-process on the session's own engine.
+SEARCH_WORKERS = int(os.environ["SEARCH_WORKERS"]) if "SEARCH_WORKERS" in os.environ else None
+
+# Worker processes for a next_move sent with "priority": "high", which runs
+# one Lazy SMP search over all of them instead of a single core. 0 disables it.
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", 0))
+# Secret a client sends as "analysis_token" along with the high priority;
+# without one set no client gets the analysis workers. One such search runs
+# at a time, others get the regular search meanwhile.
+ANALYSIS_TOKEN = os.environ.get("ANALYSIS_TOKEN", "")
+
+# Search the expected reply while the player thinks, in the game's search
+# worker until a search is sent to that worker. With the in-process engine
+# (SEARCH_WORKERS=0) it runs on a thread instead, which shares the GIL with
+# the event loop; that engine already searches on the loop.
+PONDER = os.environ.get("PONDER") == "1"
+
+# Upper bound on live games, and seconds after which an untouched game is dropped
+MAX_SESSIONS = int(os.environ.get("MAX_SESSIONS", 500))
+SESSION_IDLE_TIMEOUT = int(os.environ.get("SESSION_IDLE_TIMEOUT", 1800))
+# Seconds between sweeps for idle games
+SESSION_EVICT_INTERVAL = int(os.environ.get("SESSION_EVICT_INTERVAL", 60))
+
+sessions = SessionRegistry(max_sessions=MAX_SESSIONS, idle_timeout=SESSION_IDLE_TIMEOUT)
+search_executor = None
+analysis_search = None
+
+
+async def evict_idle_sessions():
+    # Creating a game also sweeps, but a server that sees no new games would
+    # otherwise keep idle ones, and their ponder threads, on open connections
+    while True:
+        await asyncio.sleep(SESSION_EVICT_INTERVAL)
+        sessions.evict_idle()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    global search_executor, analysis_search
+    if SEARCH_WORKERS != 0:
+        search_executor = SearchExecutor(workers=SEARCH_WORKERS)
+    if ANALYSIS_WORKERS > 0:
+        analysis_search = LazySMP(workers=ANALYSIS_WORKERS)
+    evictor = asyncio.create_task(evict_idle_sessions())
+    yield
+    evictor.cancel()
+    if search_executor is not None:
+        search_executor.shutdown()
+    if analysis_search is not None:
+        analysis_search.shutdown()
+
+app = FastAPI(debug=True, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -41,22 +100,43 @@ async def root():
     return {"message": "Chess Game Backend Running"}
 
 
-async def init_board(websocket, message):
-    global board, valkyrie, fastboard
-    board = Board()
-    valkyrie = Valkyrie()
-    fastboard = board.to_fastboard()
+def parse_time_limit(value):
+    # Search budget in milliseconds from a client's time_limit, clamped to
+    # MAX_SEARCH_TIME. None when it is not a positive number.
+    if value is None:
+        return DEFAULT_SEARCH_TIME
+    if isinstance(value, bool):
+        return None
+    try:
+        time_limit = float(value)
+    except (TypeError, ValueError):
+        return None
+    if not time_limit > 0:
+        return None
+    return min(time_limit, MAX_SEARCH_TIME)
+
+
+def analysis_allowed(data):
+    # A high priority next_move from a client holding ANALYSIS_TOKEN
+    token = data.get('analysis_token')
+    if data.get('priority') != 'high' or not ANALYSIS_TOKEN or not isinstance(token, str):
+        return False
+    return hmac.compare_digest(token.encode(), ANALYSIS_TOKEN.encode())
+
+
+async def init_board(websocket, message, session_id):
+    session = sessions.create(session_id)
     
     response = {
         'type': 'init',
         'data': {
-            'fen': board.make_fen()
+            'fen': session.make_fen()
         },
         'error': None,
     }
     await websocket.send_text(json.dumps(response))
     
-async def configuration(websocket, message):
+async def configuration(websocket, message, session_id):
     response = {
         'type': 'configuration',
         'data': {
@@ -87,8 +167,11 @@ async def configuration(websocket, message):
     await websocket.send_text(json.dumps(response))
     
 
-async def possible_moves(websocket, message):
-    global board
+async def possible_moves(websocket, message, session_id):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_NO_GAME))
+        return
 
     if "data" not in message: 
         await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_DATA))
@@ -98,7 +181,7 @@ async def possible_moves(websocket, message):
     position = message['data']['position']
     
     position = Position(algebraic=position)
-    possible_moves = board.get_legal_moves(position, log=True)
+    possible_moves = session.get_legal_moves(position)
     chess_notation_moves = fen_utils.algebraic_list(possible_moves)
     response = {
         'type': 'poss_moves',
@@ -110,8 +193,11 @@ async def possible_moves(websocket, message):
     await websocket.send_text(json.dumps(response))
 
 
-async def make_move(websocket, message):
-    global board, fastboard
+async def make_move(websocket, message, session_id):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_NO_GAME))
+        return
 
     if "data" not in message: 
         await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_DATA))
@@ -126,33 +212,10 @@ async def make_move(websocket, message):
     from_pos = Position(algebraic=from_pos)
     to_pos = Position(algebraic=to_pos)
 
-    move_return = board.move_piece(from_pos, to_pos, detailed_return=True)
-    
-    if len(move_return) == 3:
-        is_kill, special, piece = move_return 
-    else: 
-        is_kill = -1
-        special = move_return if len(move_return) == 1 else move_return[1]
-        piece = None
-    
-    if special >= 0:
-        move_start = from_pos.index 
-        move_end = to_pos.index 
-        
-        piece_map = {
-            'p': 0,
-            'n': 1,
-            'b': 2,
-            'r': 3,
-            'q': 4,
-            'k': 5
-        }
-        
-        move = Move((1 << move_start), (1 << move_end), piece_map[piece.get_name().lower()], piece.get_color(), 1 if is_kill == 3 else None, None, None)
-        fastboard += move
+    is_kill, special = session.move_piece(from_pos, to_pos)
     
-    else: 
-        print("Error Making Move ", from_pos, to_pos, move, special)
+    if special < 0:
+        print("Error Making Move ", from_pos, to_pos, special)
         return
     
     response = {
@@ -160,7 +223,7 @@ async def make_move(websocket, message):
         'data': {
             'from_pos': from_pos.algebraic,
             'to_pos': to_pos.algebraic,
-            'fen': board.make_fen(),
+            'fen': session.make_fen(),
             'move_success': 1,
             'is_kill': is_kill,
             'special': special
@@ -171,8 +234,11 @@ async def make_move(websocket, message):
 
     await websocket.send_text(json.dumps(response))
 
-async def promote_pawn(websocket, message):
-    global board
+async def promote_pawn(websocket, message, session_id):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_NO_GAME))
+        return
 
     if "data" not in message: 
         await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_DATA))
@@ -185,12 +251,12 @@ async def promote_pawn(websocket, message):
     position = Position(algebraic=position)
     promote_to = message['data']['promote_to']
 
-    promoted, special = board.try_pawn_promote(position, promote_to=promote_to, do_it=True)
+    promoted, special = session.promote_pawn(position, promote_to=promote_to)
 
     response = {
         'type': 'promote_pawn',
         'data': {
-            'fen': board.make_fen(),
+            'fen': session.make_fen(),
             'promoted': promoted,
             'special': special
         },
@@ -198,32 +264,63 @@ async def promote_pawn(websocket, message):
 
     await websocket.send_text(json.dumps(response))
     
-async def next_move(websocket, message):
-    global board, valkyrie, fastboard, in_progress
+async def next_move(websocket, message, session_id):
+    session = sessions.get(session_id)
+    if session is None:
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_NO_GAME))
+        return
+    fastboard = session.fastboard
 
     whole_start = time.time()
+
+    data = message.get('data') or {}
+    if not isinstance(data, dict):
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_DATA))
+        return
+    time_limit = parse_time_limit(data.get('time_limit'))
+    if time_limit is None:
+        await websocket.send_text(json.dumps(error_responses.RESPONSE_ERROR_TIME_LIMIT))
+        return
+    high_priority = analysis_allowed(data)
+    # Joins the ponder thread, which stops within a few thousand nodes
+    await asyncio.get_running_loop().run_in_executor(None, session.stop_pondering)
     
     start_ = time.time()
-    best_move = valkyrie.best_move(fastboard)
+    # the search runs in a worker process so the event loop keeps serving
+    # other clients meanwhile
+    best_move = None
+    if high_priority and analysis_search is not None:
+        try:
+            best_move = await analysis_search.best_move(fastboard, maxDepth=MAX_SEARCH_DEPTH, timeLimit=time_limit)
+        except SearchBusy:
+            logger.info("Analysis workers busy, using the regular search")
+        except WorkerLost:
+            logger.exception("Analysis search lost a worker, using the regular search")
+    if best_move is None:
+        if search_executor is not None:
+            best_move = await search_executor.best_move(fastboard, maxDepth=MAX_SEARCH_DEPTH, timeLimit=time_limit,
+                                                        sessionId=session_id)
+        else:
+            best_move = session.valkyrie.best_move(fastboard, maxDepth=MAX_SEARCH_DEPTH, timeLimit=time_limit)
     end_ = time.time()
     
     print(f"Best Move search: {end_ - start_}s")
-    if not best_move:
+    if best_move is None:
         print("Error: Valkyrie could not find the best move!")
         return 
     
     best_move_object = bitboard_move_to_object(best_move)
     
     start = time.time()
-    is_kill, special = board.move_piece(best_move_object.from_pos, best_move_object.to_pos)
+    is_kill = session.play(best_move)
+    special = session.game_status()
     end = time.time()
-    
-    if special >= 0:
-        fastboard += best_move
-        
-    else: 
-        print("Error Making Move ", best_move, best_move_object, special)
-        return 
+
+    if PONDER and special not in (engine.constants.CHECKMATE, engine.constants.STALEMATE):
+        if search_executor is not None:
+            search_executor.ponder(fastboard, session_id, timeLimit=session.PONDER_TIME_LIMIT)
+        else:
+            session.start_pondering()
 
     print(f"Board Piece Movement: {end - start}s")
 
@@ -232,7 +329,7 @@ async def next_move(websocket, message):
         'data': {
             'from_pos': best_move_object.from_pos.algebraic,
             'to_pos': best_move_object.to_pos.algebraic,
-            'fen': board.make_fen(),
+            'fen': session.make_fen(),
             'move_success': 1,
             'is_kill': is_kill,
             'special': special
@@ -242,7 +339,6 @@ async def next_move(websocket, message):
     whole_end = time.time()
     print(f"Total time taken to process a best move: {whole_end - whole_start}")
     await websocket.send_text(json.dumps(response))
-    in_progress = False
 
 message_handlers = {
     'init': init_board,
@@ -256,6 +352,9 @@ message_handlers = {
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await websocket.accept()
+
+    # Every connection plays its own game
+    session_id = uuid.uuid4().hex
     try:
         while True:
             data = await websocket.receive_text()
@@ -268,7 +367,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
                 handler = message_handlers.get(message["type"])
                 if handler:
-                    await handler(websocket, message)
+                    await handler(websocket, message, session_id)
                 else:
                     logger.error(f"Unknown message type: {message['type']}")
                     await websocket.send_text(json.dumps({"error": "Unknown message type"}))
@@ -278,5 +377,9 @@ async def websocket_endpoint(websocket: WebSocket):
             except KeyError as e:
                 logger.error(f"Missing key in message: {e}", exc_info=True)
                 await websocket.send_text(json.dumps({"error": f"Missing key: {e}"}))
+    except WebSocketDisconnect:
+        logger.info(f"Client disconnected, closing game {session_id}")
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
\ No newline at end of file
+        logger.error(f"An error occurred: {e}", exc_info=True)
+    finally:
+        sessions.remove(session_id)
\ No newline at end of file
@@ -1,57 +1,316 @@
-from valkyrie.Valkyrie import Valkyrie 
-from engine.FastBoard.FastBoard import FastBoard 
-from engine.MoveGen.Generator import Generator 
-from engine.bitmanipulation.utils import lsb
-from engine.Position import Position
-
-
-def present_move(move):
-    start = Position(index=lsb(move.start))
-    end = Position(index=lsb(move.end)) 
-    
-    return f"{start}{end}"
-    
-
-def init():
-    global generator, board 
-    board = FastBoard()
-    generator = Generator()
-    
-def perft(depth, divide=4):
-    global generator, board
-    nodes = 0
-    captures = 0
-
-    if depth == 0:
-        return 1, 0
-    
-    attacks, attackSets = generator.find_attacks(board)
-    moves = generator.find_moves(board, attacks, attackSets)
-    
-    if divide == depth:
-        while len(moves) > 0:
-            move = moves.pop()
+"""Perft: count the leaves of the legal move tree to check the move generator.
+
+Run from the backend directory:
+
+    python -m perft.perft 5                       # start position to depth 5
+    python -m perft.perft 4 --fen "<fen>" --divide
+    python -m perft.perft 3 --stats               # captures, checks, mates...
+    python -m perft.perft 4 --suite               # verify the reference suite
+    python -m perft.perft 6 --suite --jobs 0      # ...on every core
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from engine.constants import START_FEN
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import CAPTURE_MASK, PROMOTION_MASK, EN_PASSANT, CASTLE, move_name
+from engine.MoveGen.Generator import Generator
+from valkyrie.TranspositionTable import TranspositionTable
+
+# Published node counts, from depth 1 up
+# https://www.chessprogramming.org/Perft_Results
+REFERENCE_SUITE = [
+    ('start', START_FEN,
+     [20, 400, 8902, 197281, 4865609, 119060324]),
+    ('kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+     [48, 2039, 97862, 4085603, 193690690]),
+    ('position 3', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+     [14, 191, 2812, 43238, 674624, 11030083]),
+    ('position 4', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+     [6, 264, 9467, 422333, 15833292]),
+    ('position 5', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+     [44, 1486, 62379, 2103487, 89941194]),
+    ('position 6', 'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+     [46, 2079, 89890, 3894594, 164075551]),
+]
+
+
+class PerftStats():
+    FIELDS = ('nodes', 'captures', 'enPassant', 'castles', 'promotions', 'checks', 'mates')
+
+    def __init__(self, *values):
+        for field, value in zip(self.FIELDS, values or [0] * len(self.FIELDS)):
+            setattr(self, field, value)
+
+    def __iadd__(self, other):
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, PerftStats) and all(getattr(self, field) == getattr(other, field)
+                                                     for field in self.FIELDS)
+
+    def __repr__(self):
+        return ' | '.join(f'{field}: {getattr(self, field)}' for field in self.FIELDS)
+
+
+class Perft():
+    """Move tree walker.
+
+    count() is the fast path: leaves are counted from the length of the
+    move list without being made, and subtree counts can be cached in a
+    hash table. collect() makes every leaf to gather statistics, so it does
+    neither.
+    """
+
+    def __init__(self, generator=None, hashSize=0):
+        self.generator = generator if generator is not None else Generator()
+        self.table = TranspositionTable(hashSize) if hashSize else None
+
+    def moves(self, board):
+        attacks, attackSets = self.generator.find_attacks(board)
+        return self.generator.find_moves(board, attacks, attackSets)
+
+    def count(self, board, depth):
+        if depth == 0:
+            return 1
+
+        table = self.table
+        if table is not None:
+            entry = table.lookup(board.hash)
+            if entry is not None and entry[0] == depth:
+                return entry[1]
+
+        moves = self.moves(board)
+        if depth == 1:
+            return len(moves)
+
+        nodes = 0
+        for move in moves:
             board += move
-            count, _ = perft(depth - 1) 
+            nodes += self.count(board, depth - 1)
             board -= move
-            print(f"Move {present_move(move)}: {count}")
-            nodes += count
-            captures += 1 if move.captureType is not None else 0
-    else:
-        while len(moves) > 0:
-            move = moves.pop()
+
+        if table is not None:
+            table.store(board.hash, depth, nodes, TranspositionTable.EXACT, None)
+        return nodes
+
+    def collect(self, board, depth, stats=None):
+        stats = PerftStats() if stats is None else stats
+        if depth == 0:
+            stats.nodes += 1
+            return stats
+
+        generator = self.generator
+        for move in self.moves(board):
+            if depth > 1:
+                board += move
+                self.collect(board, depth - 1, stats)
+                board -= move
+                continue
+
+            stats.nodes += 1
+            stats.captures += move & CAPTURE_MASK != 0
+            stats.enPassant += move & EN_PASSANT != 0
+            stats.castles += move & CASTLE != 0
+            stats.promotions += move & PROMOTION_MASK != 0
+
+            board += move
+            if generator.is_in_check(board):
+                stats.checks += 1
+                stats.mates += not generator.has_legal_move(board)
+            board -= move
+        return stats
+
+    def divide(self, board, depth, stats=False):
+        """(move, count or PerftStats) for every root move."""
+        results = []
+        for move in self.moves(board):
             board += move
-            nodes += perft(depth - 1)[0]
+            results.append((move, self.collect(board, depth - 1) if stats else self.count(board, depth - 1)))
             board -= move
+        return results
+
+
+# One walker per worker process, created by the pool initializer so each
+# worker keeps its own generator and hash table across tasks
+_walker = None
+
+
+def _init_worker(hashSize):
+    global _walker
+    _walker = Perft(hashSize=hashSize)
+
+
+def _walk(state, line, depth, stats):
+    board = FastBoard.deserialize(state)
+    for move in line:
+        board += move
+    return _walker.collect(board, depth) if stats else _walker.count(board, depth)
+
+
+class ParallelPerft():
+    """Perft with the subtrees below the first one or two plies spread over
+    a process pool. Same count/collect/divide interface as Perft.
 
-    return nodes, captures
+    Splitting two plies deep gives a few hundred similar sized tasks instead
+    of the twenty-odd very uneven root subtrees, which keeps every worker busy
+    until the end.
+    """
+
+    def __init__(self, workers=None, hashSize=0, splitDepth=2):
+        # spawn for the same reasons as SearchExecutor, and so workers build
+        # their own generator instead of inheriting a half used one
+        context = multiprocessing.get_context("spawn")
+        self.pool = ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                        initializer=_init_worker, initargs=(hashSize,))
+        self.walker = Perft()
+        self.splitDepth = splitDepth
+
+    def divide(self, board, depth, stats=False):
+        # Stats are gathered on the last ply, so at least one must be left to the workers
+        splitDepth = min(self.splitDepth, depth - 1)
+        if splitDepth < 1:
+            return self.walker.divide(board, depth, stats)
+
+        state = board.serialize()
+        roots = self.walker.moves(board)
+        results = {move: PerftStats() if stats else 0 for move in roots}
+
+        tasks = []
+        for move in roots:
+            if splitDepth == 1:
+                tasks.append((move, self.pool.submit(_walk, state, (move,), depth - 1, stats)))
+                continue
+            board += move
+            for reply in self.walker.moves(board):
+                tasks.append((move, self.pool.submit(_walk, state, (move, reply), depth - 2, stats)))
+            board -= move
+
+        for move, task in tasks:
+            results[move] += task.result()
+        return list(results.items())
+
+    def count(self, board, depth):
+        if depth == 0:
+            return 1
+        return sum(nodes for _, nodes in self.divide(board, depth))
+
+    def collect(self, board, depth):
+        total = PerftStats()
+        for _, stats in self.divide(board, depth, stats=True):
+            total += stats
+        return total
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+
+def perft(fen=START_FEN, depth=1, hashSize=0):
+    return Perft(hashSize=hashSize).count(FastBoard.from_fen(fen), depth)
+
+
+def run_suite(maxDepth, walker=None, out=sys.stdout):
+    """Check every reference position up to maxDepth; True if all counts match."""
+    walker = walker if walker is not None else Perft()
+    passed = True
+    for name, fen, counts in REFERENCE_SUITE:
+        board = FastBoard.from_fen(fen)
+        for depth, expected in enumerate(counts[:maxDepth], start=1):
+            start = time.perf_counter()
+            nodes = walker.count(board, depth)
+            elapsed = time.perf_counter() - start
+
+            ok = nodes == expected
+            passed &= ok
+            print(f'{name:<10} depth {depth}: {nodes:>10} {"ok" if ok else f"FAIL, expected {expected}"}'
+                  f'  ({nodes_per_second(nodes, elapsed)} nps)', file=out)
+    return passed
+
+
+def nodes_per_second(nodes, elapsed):
+    return int(nodes / elapsed) if elapsed > 0 else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Count the leaf nodes of the legal move tree.')
+    parser.add_argument('depth', type=int, nargs='?', default=4)
+    parser.add_argument('--fen', default=START_FEN)
+    parser.add_argument('--divide', action='store_true', help='print the count below every root move')
+    parser.add_argument('--stats', action='store_true',
+                        help='count captures, en passant, castles, promotions, checks and mates '
+                             '(makes every leaf, so no bulk counting or hashing)')
+    parser.add_argument('--hash', type=int, default=0, metavar='ENTRIES',
+                        help='perft hash table entries, 0 to disable')
+    parser.add_argument('--suite', action='store_true',
+                        help='verify the reference positions up to the given depth')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='worker processes, 0 for one per core')
+    parser.add_argument('--split', type=int, default=2, choices=(1, 2),
+                        help='plies expanded before handing subtrees to the workers')
+    args = parser.parse_args(argv)
+
+    if args.jobs == 1:
+        return run(args, Perft(hashSize=args.hash))
+    with ParallelPerft(args.jobs or None, args.hash, args.split) as walker:
+        return run(args, walker)
+
+
+def run(args, walker):
+    if args.suite:
+        return 0 if run_suite(args.depth, walker) else 1
+
+    board = FastBoard.from_fen(args.fen)
+    start = time.perf_counter()
+
+    if args.divide:
+        total = PerftStats() if args.stats else 0
+        for move, result in walker.divide(board, args.depth, stats=args.stats):
+            print(f'{move_name(move)}: {result.nodes if args.stats else result}')
+            total += result
+    elif args.stats:
+        total = walker.collect(board, args.depth)
+    else:
+        total = walker.count(board, args.depth)
+
+    elapsed = time.perf_counter() - start
+    nodes = total.nodes if args.stats else total
+
+    print(f'\nDepth {args.depth} | Nodes: {nodes}')
+    if args.stats:
+        print(total)
+    print(f'Time: {elapsed:.2f}s | {nodes_per_second(nodes, elapsed)} nps')
+    return 0
 
 
 def test_perft():
-    init()
-    for i in range(3, 4):
-        
-        nodes, captures = perft(i, divide=i)
-        print(f"Depth {i} | Nodes Searched: {nodes} | Captures: {captures}")
-        
-    
\ No newline at end of file
+    assert run_suite(2)
+    assert perft(REFERENCE_SUITE[2][1], 3, hashSize=1 << 12) == 2812
+
+    walker = Perft()
+    assert walker.collect(FastBoard(), 3) == PerftStats(8902, 34, 0, 0, 0, 12, 0)
+    assert walker.collect(FastBoard.from_fen(REFERENCE_SUITE[1][1]), 2) == PerftStats(2039, 351, 1, 91, 0, 3, 0)
+
+
+
+def test_parallel_perft():
+    board = FastBoard.from_fen(REFERENCE_SUITE[1][1])
+    expected = dict(Perft().divide(board, 3))
+    with ParallelPerft(workers=2) as walker:
+        assert dict(walker.divide(board, 3)) == expected
+        assert walker.count(FastBoard.from_fen(REFERENCE_SUITE[3][1]), 3) == 9467
+        assert walker.collect(FastBoard(), 3) == PerftStats(8902, 34, 0, 0, 0, 12, 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -306,6 +306,18 @@ def test_reference_integrity():
     
     # Castling scenario, checking if castling moves are legal when not in check
     ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", Position("e1"), [Position("c1"), Position("g1"), Position("d1"), Position("f1"), Position("d2"), Position("e2"), Position("f2")]),
+
+    # Pinned rook can only slide along the pin
+    ("4r3/8/8/8/8/8/4R3/4K3 w - - 0 1", Position("e2"), [Position("e3"), Position("e4"), Position("e5"), Position("e6"), Position("e7"), Position("e8")]),
+
+    # In check, a knight may only block or capture the checker
+    ("4r3/8/8/8/8/2N5/8/4K3 w - - 0 1", Position("c3"), [Position("e2"), Position("e4")]),
+
+    # En passant would expose the king along the rank
+    ("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1", Position("e5"), [Position("e6")]),
+
+    # No castling through an attacked square
+    ("5r2/8/8/8/8/8/8/R3K2R w KQ - 0 1", Position("e1"), [Position("c1"), Position("d1"), Position("d2"), Position("e2")]),
 ])
 def test_get_legal_moves(setup_fen, position, expected_moves):
     board = Board(fen=setup_fen)
@@ -361,6 +373,65 @@ def test_check_for_en_passant():
     result = board.check_for_en_passant(Position("e5"), Position("e6"))
     assert not result
 
+@pytest.mark.parametrize("setup_fen, from_pos, to_pos", [
+    # Quiet pawn push that sets up en passant
+    (constants.START_FEN, Position("e2"), Position("e4")),
+
+    # Capture
+    ("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1", Position("e4"), Position("d5")),
+
+    # Castling moves the rook too
+    ("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1", Position("e1"), Position("g1")),
+
+    # En passant removes a pawn off the destination square
+    ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", Position("e5"), Position("d6")),
+])
+def test_unmake_move_restores_board(setup_fen, from_pos, to_pos):
+    board = Board(fen=setup_fen)
+    fen = board.make_fen()
+    squares = [list(row) for row in board.board]
+    piece = board.get_piece(from_pos)
+
+    board.move_piece(from_pos, to_pos)
+    assert board.make_fen() != fen
+
+    assert board.unmake_move()
+    assert board.make_fen() == fen
+    assert board.board == squares
+    assert piece.position == from_pos
+    assert not piece.has_moved
+    assert not any(board.dead_pieces.values())
+    assert not board.unmake_move()
+
+def test_is_move_legal_leaves_board_unchanged():
+    board = Board(fen="4r3/8/8/8/8/8/4R3/4K3 w - - 0 1")
+    fen = board.make_fen()
+
+    assert not board.is_move_legal(Position("e2"), Position("d2"))
+    assert board.is_move_legal(Position("e2"), Position("e8"))
+    assert board.make_fen() == fen
+    assert not board.dead_pieces[constants.COLOR["BLACK"]]
+
+def test_is_move_legal_after_checkmate_keeps_the_last_move():
+    board = Board()
+    for move in ("f2f3", "e7e5", "g2g4", "d8h4"):
+        board.move_piece(Position(move[:2]), Position(move[2:]))
+    fen = board.make_fen()
+    assert board.is_checkmate
+
+    assert not board.is_move_legal(Position("a2"), Position("a3"))
+    assert board.is_checkmate
+    assert board.make_fen() == fen
+
+def test_is_move_legal_from_empty_square():
+    board = Board()
+    board.move_piece(Position("e2"), Position("e4"))
+    fen = board.make_fen()
+
+    assert not board.is_move_legal(Position("e3"), Position("e5"))
+    assert board.make_fen() == fen
+    assert len(board.undo_stack) == 1
+
 def test_is_game_over():
     board = Board()
     assert not board.is_game_over()
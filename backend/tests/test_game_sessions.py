@@ -0,0 +1,99 @@
+import time
+
+from game_sessions import SessionRegistry
+from engine.Position import Position
+from engine.FastBoard.FastBoard import FastBoard
+import engine.constants as constants
+
+
+def test_sessions_are_independent():
+    sessions = SessionRegistry()
+    first = sessions.create("first")
+    second = sessions.create("second")
+
+    first.move_piece(Position(algebraic="e2"), Position(algebraic="e4"))
+
+    assert first.make_fen() != second.make_fen()
+    assert sessions.get("first") is first
+    assert sessions.get("second") is second
+
+
+def test_sessions_capped_by_evicting_least_recently_used():
+    sessions = SessionRegistry(max_sessions=2)
+    sessions.create("a")
+    sessions.create("b")
+    sessions.get("a")
+    sessions.create("c")
+
+    assert len(sessions) == 2
+    assert "a" in sessions
+    assert "b" not in sessions
+    assert "c" in sessions
+
+
+def test_idle_sessions_are_evicted():
+    sessions = SessionRegistry(idle_timeout=60)
+    stale = sessions.create("stale")
+    stale.last_active -= 120
+    sessions.create("fresh")
+
+    assert "stale" not in sessions
+    assert sessions.get("stale") is None
+    assert sessions.get("fresh") is not None
+
+
+def test_remove_session():
+    sessions = SessionRegistry()
+    sessions.create("game")
+    sessions.remove("game")
+    sessions.remove("game")
+
+    assert sessions.get("game") is None
+
+
+def test_session_plays_and_promotes_on_fastboard():
+    sessions = SessionRegistry()
+    game = sessions.create("game")
+    game.fastboard = FastBoard.from_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 40")
+
+    assert game.move_piece(Position(algebraic="e1"), Position(algebraic="e3")) == constants.ERROR_MOVE_NOT_POSSIBLE
+    assert game.move_piece(Position(algebraic="b7"), Position(algebraic="b8")) == \
+        (constants.NO_KILL, constants.PROMOTE_POSSIBLE)
+    assert game.promote_pawn(Position(algebraic="b8"), "rook") == constants.SUCCESS_PAWN_PROMOTED_CHECK
+    assert game.make_fen() == "1R2k3/8/8/8/8/8/8/4K3 b - - 0 40"
+    assert game.get_legal_moves(Position(algebraic="b8")) == []
+
+
+def test_session_reports_checkmate():
+    sessions = SessionRegistry()
+    game = sessions.create("game")
+    for move in ("f2f3", "e7e5", "g2g4", "d8h4"):
+        game.move_piece(Position(algebraic=move[:2]), Position(algebraic=move[2:]))
+
+    assert game.game_status() == constants.CHECKMATE
+    assert game.move_piece(Position(algebraic="a2"), Position(algebraic="a3")) == \
+        (constants.NO_KILL, constants.CHECKMATE)
+
+def test_pondering_fills_the_engine_table_until_stopped():
+    session = SessionRegistry().create("ponder")
+    session.play(session.valkyrie.best_move(session.fastboard, maxDepth=3))
+    expected_reply = session.valkyrie.table.lookup(session.fastboard.hash)[3]
+
+    assert session.start_pondering()
+    time.sleep(0.2)
+    session.stop_pondering()
+
+    after_reply = FastBoard.deserialize(session.fastboard.serialize()) + expected_reply
+    assert session.valkyrie.table.lookup(after_reply.hash) is not None
+    assert session._ponder_thread is None
+
+
+def test_pondering_ends_at_its_time_limit():
+    session = SessionRegistry().create("ponder")
+    session.play(session.valkyrie.best_move(session.fastboard, maxDepth=3))
+
+    assert session.start_pondering(time_limit=100)
+    session._ponder_thread.join(timeout=5)
+
+    assert not session._ponder_thread.is_alive()
+    session.stop_pondering()
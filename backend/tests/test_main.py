@@ -0,0 +1,23 @@
+import main
+
+
+def test_parse_time_limit():
+    assert main.parse_time_limit(None) == main.DEFAULT_SEARCH_TIME
+    assert main.parse_time_limit(1500) == 1500
+    assert main.parse_time_limit("3000") == 3000
+    assert main.parse_time_limit(10 ** 9) == main.MAX_SEARCH_TIME
+    assert main.parse_time_limit(float("inf")) == main.MAX_SEARCH_TIME
+
+    for value in (0, -5, "fast", float("nan"), True, [], {}):
+        assert main.parse_time_limit(value) is None
+
+
+def test_analysis_needs_the_server_token(monkeypatch):
+    assert not main.analysis_allowed({'priority': 'high'})
+    assert not main.analysis_allowed({'priority': 'high', 'analysis_token': ''})
+
+    monkeypatch.setattr(main, "ANALYSIS_TOKEN", "secret")
+    assert main.analysis_allowed({'priority': 'high', 'analysis_token': 'secret'})
+    assert not main.analysis_allowed({'analysis_token': 'secret'})
+    for token in (None, 'guess', 1, ['secret']):
+        assert not main.analysis_allowed({'priority': 'high', 'analysis_token': token})
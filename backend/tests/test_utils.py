@@ -2,4 +2,18 @@ import engine.utils as utils
 from pprint import pprint 
 
 def test_fen_to_attributes():
-    bb = utils.fen_to_bitboards('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
\ No newline at end of file
+    bb = utils.fen_to_bitboards('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1')
+
+
+def test_object_and_bitboard_moves_round_trip():
+    from engine.FastBoard.FastBoard import FastBoard
+    from engine.Position import Position
+
+    board = FastBoard()
+    move = utils.object_move_to_bitboard(board, Position(algebraic="g1"), Position(algebraic="f3"))
+    move_object = utils.bitboard_move_to_object(move)
+
+    assert move_object.from_pos == Position(algebraic="g1")
+    assert move_object.to_pos == Position(algebraic="f3")
+    assert move_object.piece_type == 'N'
+    assert move_object.capture is None
\ No newline at end of file
@@ -0,0 +1,127 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+
+from engine.FastBoard.FastBoard import FastBoard
+from valkyrie.SharedTranspositionTable import SharedTranspositionTable
+from valkyrie.Valkyrie import Valkyrie
+
+
+def _worker(index, tableName, tableSize, stop, tasks, results):
+    engine = Valkyrie(table=SharedTranspositionTable(tableSize, name=tableName))
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        state, maxDepth, timeLimit, minDepth = task
+        # Only helpers are stopped early; the main worker finishes its search
+        move = engine.best_move(FastBoard.deserialize(state), maxDepth=maxDepth, timeLimit=timeLimit,
+                                stop=stop if index else None, minDepth=minDepth)
+        results.put((index, move))
+    engine.table.close()
+
+
+class WorkerLost(Exception):
+    pass
+
+
+class SearchBusy(Exception):
+    pass
+
+
+class LazySMP():
+    """Lazy SMP: every worker process runs the same iterative deepening
+    search on the same position, sharing one transposition table. The
+    helpers fill the table with results the main worker (0) then cuts off
+    on, and their move ordering drifts apart so they explore different
+    parts of the tree. The main worker's move is the answer.
+    """
+
+    # seconds between checks that every worker is still alive while waiting
+    # for results
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, workers=None, tableSize=1 << 18):
+        # spawn for the same reasons as SearchExecutor
+        self.context = multiprocessing.get_context("spawn")
+        self.workers = workers or os.cpu_count()
+        self.table = SharedTranspositionTable(tableSize)
+        self.start_workers()
+
+        # One search at a time owns the workers; others are turned away
+        # rather than queued behind it
+        self.lock = threading.Lock()
+
+    def start_workers(self):
+        # Fresh queues and event each time: a worker killed while holding
+        # one of their locks leaves it unusable
+        context = self.context
+        self.stop = context.Event()
+        self.results = context.Queue()
+        self.tasks = [context.Queue() for _ in range(self.workers)]
+        self.processes = [context.Process(target=_worker, daemon=True,
+                                          args=(index, self.table.name, self.table.size,
+                                                self.stop, tasks, self.results))
+                          for index, tasks in enumerate(self.tasks)]
+        for process in self.processes:
+            process.start()
+
+    def restart_workers(self):
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
+        self.start_workers()
+
+    def search(self, board: FastBoard, maxDepth=5, timeLimit=None):
+        if not self.lock.acquire(blocking=False):
+            raise SearchBusy("another search owns the workers")
+        try:
+            state = board.serialize()
+            self.stop.clear()
+            for index, tasks in enumerate(self.tasks):
+                # Every other helper starts and ends one iteration deeper, so
+                # the helpers are not all on the same iteration at once
+                stagger = index % 2 if index else 0
+                tasks.put((state, maxDepth + stagger, timeLimit if index == 0 else None, 1 + stagger))
+
+            # Helpers are stopped once the main worker answers, and all are
+            # waited for so none is still writing during the next search
+            best_move = None
+            answered = False
+            pending = len(self.tasks)
+            while pending:
+                try:
+                    index, move = self.results.get(timeout=self.POLL_INTERVAL)
+                except queue.Empty:
+                    if all(process.is_alive() for process in self.processes):
+                        continue
+                    # A worker died (killed, out of memory...) and its result
+                    # will never come. The pool is replaced for the next search.
+                    self.restart_workers()
+                    if answered:
+                        return best_move
+                    raise WorkerLost("a search worker exited before the main worker answered")
+
+                pending -= 1
+                if index == 0:
+                    best_move = move
+                    answered = True
+                    self.stop.set()
+            return best_move
+        finally:
+            self.lock.release()
+
+    async def best_move(self, board: FastBoard, maxDepth=5, timeLimit=None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.search, board, maxDepth, timeLimit)
+
+    def shutdown(self):
+        self.stop.set()
+        for tasks in self.tasks:
+            tasks.put(None)
+        for process in self.processes:
+            process.join()
+        self.table.close()
@@ -0,0 +1,76 @@
+from engine.FastBoard.moves import CAPTURE_MASK, COLOR_SHIFT
+from engine.MoveGen.MoveList import KILLER_SCORE, COUNTER_MOVE_SCORE, QUIET_SCORE
+
+# Quiet moves are keyed by side, from and to square: bits 0-11 of the move
+# and the color bit above them
+FROM_TO_MASK = 0xFFF
+
+
+def quiet_key(move):
+    return move & FROM_TO_MASK | (move >> COLOR_SHIFT & 1) << 12
+
+
+class MoveOrderer():
+    """Cheap ordering heuristics for quiet moves, learned from cutoffs.
+
+    Killers are the last two quiet moves that cut off at a ply, counter moves
+    the quiet move that last refuted a given previous move, and history the
+    depth-weighted cutoff count of each move. Captures keep their MVV-LVA
+    score from MoveList and the table move is searched before any of these.
+    """
+
+    # History scores are halved once any reaches this, so they stay below
+    # COUNTER_MOVE_SCORE and recent cutoffs outweigh old ones
+    HISTORY_LIMIT = COUNTER_MOVE_SCORE >> 1
+
+    def __init__(self, maxPly=128):
+        self.maxPly = maxPly
+        self.clear()
+
+    def clear(self):
+        self.killers = [[None, None] for _ in range(self.maxPly)]
+        self.counterMoves = [None] * (1 << 13)
+        self.history = [0] * (1 << 13)
+
+    def order(self, moves, ply, previousMove=None):
+        killers = self.killers[ply] if ply < self.maxPly else (None, None)
+        counterMove = self.counterMoves[quiet_key(previousMove)] if previousMove is not None else None
+        history = self.history
+
+        scores = moves.scores
+        for index, move in enumerate(moves):
+            # Captures and the stored principle variation are already scored
+            if scores[index] != QUIET_SCORE or move & CAPTURE_MASK:
+                continue
+            if move == killers[0]:
+                scores[index] = KILLER_SCORE + 1
+            elif move == killers[1]:
+                scores[index] = KILLER_SCORE
+            elif move == counterMove:
+                scores[index] = COUNTER_MOVE_SCORE
+            else:
+                scores[index] = history[quiet_key(move)]
+
+    def is_killer(self, move, ply):
+        return ply < self.maxPly and move in self.killers[ply]
+
+    def cutoff(self, move, ply, depth, previousMove=None):
+        # Only quiet moves are remembered, captures order themselves
+        if move & CAPTURE_MASK:
+            return
+
+        if ply < self.maxPly:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1], killers[0] = killers[0], move
+
+        if previousMove is not None:
+            self.counterMoves[quiet_key(previousMove)] = move
+
+        key = quiet_key(move)
+        self.history[key] += depth * depth
+        if self.history[key] >= self.HISTORY_LIMIT:
+            self.age()
+
+    def age(self):
+        self.history = [value >> 1 for value in self.history]
@@ -0,0 +1,141 @@
+import asyncio
+import itertools
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from engine.FastBoard.FastBoard import FastBoard
+from valkyrie.Valkyrie import Valkyrie
+
+# The engines of the games a worker process searches for, least recently
+# used first. Each game keeps its own table, killers and history from one
+# move to the next, and the oldest gives way once a worker holds
+# ENGINES_PER_WORKER of them.
+ENGINES_PER_WORKER = 8
+_engines = OrderedDict()
+_waiting = None
+
+
+class WaitingSearches():
+    """Searches sent to a worker that have not started yet. A ponder search
+    takes it as its stop event, so it gives way as soon as a real search
+    for any game queues up behind it."""
+
+    def __init__(self, context):
+        self.count = context.Value('i', 0)
+
+    def add(self, n):
+        with self.count.get_lock():
+            self.count.value += n
+
+    def is_set(self):
+        return self.count.value > 0
+
+
+def _init_worker(waiting):
+    global _waiting
+    _waiting = waiting
+
+
+def _engine(sessionId):
+    engine = _engines.pop(sessionId, None)
+    if engine is None:
+        engine = Valkyrie()
+        if len(_engines) >= ENGINES_PER_WORKER:
+            _engines.popitem(last=False)
+    _engines[sessionId] = engine
+    return engine
+
+
+def _search(state, maxDepth, timeLimit, sessionId):
+    _waiting.add(-1)
+    board = FastBoard.deserialize(state)
+    return _engine(sessionId).best_move(board, maxDepth=maxDepth, timeLimit=timeLimit)
+
+
+def _ponder(state, sessionId, timeLimit):
+    # Search the reply the game's engine expects, so its next search finds
+    # that position in the table
+    engine = _engine(sessionId)
+    board = FastBoard.deserialize(state)
+    entry = engine.table.lookup(board.hash)
+    if entry is None or entry[3] is None:
+        return
+    board += entry[3]
+    engine.ponder(board, _waiting, timeLimit=timeLimit)
+
+
+class SearchExecutor():
+    """Searches in worker processes. Each worker is a pool of its own, so
+    every search of a game goes to the same worker and finds that game's
+    engine there."""
+
+    def __init__(self, workers=None):
+        # spawn rather than fork: the server process runs an event loop and
+        # worker threads that must not be duplicated into the children
+        self.context = multiprocessing.get_context("spawn")
+        self.pools = []
+        self.waiting = []
+        for _ in range(workers or os.cpu_count()):
+            pool, waiting = self.new_pool()
+            self.pools.append(pool)
+            self.waiting.append(waiting)
+        # searches that belong to no game take turns
+        self.turns = itertools.count()
+
+    def new_pool(self):
+        waiting = WaitingSearches(self.context)
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=self.context,
+                                   initializer=_init_worker, initargs=(waiting,))
+        return pool, waiting
+
+    def worker_for(self, sessionId):
+        index = next(self.turns) if sessionId is None else hash(sessionId)
+        return index % len(self.pools)
+
+    def replace_pool(self, pool):
+        # A concurrent search may have replaced it already
+        if pool in self.pools:
+            index = self.pools.index(pool)
+            self.pools[index], self.waiting[index] = self.new_pool()
+            pool.shutdown()
+
+    def search(self, loop, index, state, maxDepth, timeLimit, sessionId):
+        # Counted as waiting first, so a ponder search in the worker stops
+        self.waiting[index].add(1)
+        return loop.run_in_executor(self.pools[index], _search, state, maxDepth, timeLimit, sessionId)
+
+    async def best_move(self, board: FastBoard, maxDepth=5, timeLimit=None, sessionId=None):
+        loop = asyncio.get_running_loop()
+        state = board.serialize()
+        index = self.worker_for(sessionId)
+        pool = self.pools[index]
+        try:
+            return await self.search(loop, index, state, maxDepth, timeLimit, sessionId)
+        except BrokenProcessPool:
+            # The worker died (killed, out of memory...). Its games lose their
+            # engines but get a fresh worker rather than failing from now on.
+            self.replace_pool(pool)
+            return await self.search(loop, index, state, maxDepth, timeLimit, sessionId)
+
+    def ponder(self, board: FastBoard, sessionId, timeLimit=None):
+        """Search the reply the game's engine expects from `board` in the
+        game's worker, until the time limit or until any search is sent to
+        that worker. Does not wait for it."""
+        pool = self.pools[self.worker_for(sessionId)]
+        try:
+            pool.submit(_ponder, board.serialize(), sessionId, timeLimit)
+        except BrokenProcessPool:
+            # The next search replaces the worker
+            pass
+
+    def shutdown(self):
+        # Waits for running searches, which end at their time limit. Python
+        # 3.8 can hang at exit after a pool is shut down without waiting.
+        # Ponder searches are stopped rather than waited for.
+        for waiting in self.waiting:
+            waiting.add(1)
+        for pool in self.pools:
+            pool.shutdown()
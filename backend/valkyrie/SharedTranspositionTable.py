@@ -0,0 +1,87 @@
+import struct
+from multiprocessing import shared_memory
+
+from valkyrie.TranspositionTable import TranspositionTable
+
+# Each slot is three 64 bit words in the shared block:
+#   0  key ^ data ^ value bits
+#   1  data: move + 1 (bits 0-25, 0 for none), depth + 1 (bits 26-33),
+#      flag (bits 34-35), generation (bits 36-43)
+#   2  value, as the bits of a double
+# Processes write the words one at a time without locking. A slot read
+# while another process is half way through writing it fails the key
+# check and is treated as a miss.
+SLOT_WORDS = 3
+DEPTH_SHIFT = 26
+FLAG_SHIFT = 34
+GENERATION_SHIFT = 36
+MOVE_MASK = (1 << DEPTH_SHIFT) - 1
+BYTE_MASK = 0xFF
+
+DOUBLE = struct.Struct('<d')
+BITS = struct.Struct('<Q')
+
+
+class SharedTranspositionTable():
+    """TranspositionTable kept in a multiprocessing.shared_memory block, so
+    search processes share what they find. Same interface as
+    TranspositionTable; other processes attach to it by name.
+    """
+    FLAGS = [EXACT, LOWER, UPPER] = TranspositionTable.FLAGS
+
+    def __init__(self, size=1 << 16, name=None):
+        self.size = 1 << (size - 1).bit_length()
+        self.mask = self.size - 1
+
+        # Only the creating process unlinks the block
+        self.owner = name is None
+        self.memory = shared_memory.SharedMemory(name=name, create=self.owner, size=self.size * SLOT_WORDS * 8)
+        self.name = self.memory.name
+        self.words = self.memory.buf.cast('Q')
+
+        # Kept per process: every searching process starts each search with
+        # new_generation(), so they count in step
+        self.generation = 0
+
+    def lookup(self, key):
+        index = (key & self.mask) * SLOT_WORDS
+        words = self.words
+        data = words[index + 1]
+        valueBits = words[index + 2]
+        if not data or words[index] ^ data ^ valueBits != key:
+            return None
+
+        move = data & MOVE_MASK
+        return ((data >> DEPTH_SHIFT & BYTE_MASK) - 1, DOUBLE.unpack(BITS.pack(valueBits))[0],
+                data >> FLAG_SHIFT & 3, move - 1 if move else None)
+
+    def store(self, key, depth, value, flag, move):
+        index = (key & self.mask) * SLOT_WORDS
+        words = self.words
+
+        # Replace by depth: a shallower result never evicts a deeper one
+        # from the same search.
+        data = words[index + 1]
+        if data and depth < (data >> DEPTH_SHIFT & BYTE_MASK) - 1 \
+                and data >> GENERATION_SHIFT == self.generation & BYTE_MASK:
+            return
+
+        data = (0 if move is None else move + 1) | (depth + 1) << DEPTH_SHIFT | flag << FLAG_SHIFT \
+            | (self.generation & BYTE_MASK) << GENERATION_SHIFT
+        valueBits = BITS.unpack(DOUBLE.pack(value))[0]
+        words[index] = key ^ data ^ valueBits
+        words[index + 1] = data
+        words[index + 2] = valueBits
+
+    def new_generation(self):
+        self.generation += 1
+
+    def clear(self):
+        self.memory.buf[:] = bytes(len(self.memory.buf))
+        self.generation = 0
+
+    def close(self):
+        self.words.release()
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
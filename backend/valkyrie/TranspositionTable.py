@@ -0,0 +1,53 @@
+class TranspositionTable():
+    FLAGS = [EXACT, LOWER, UPPER] = range(3)
+
+    def __init__(self, size=1 << 16):
+        # Round up to a power of two so a slot is just the low bits of the key.
+        self.size = 1 << (size - 1).bit_length()
+        self.mask = self.size - 1
+
+        # Parallel preallocated slot arrays, so the table never grows past its
+        # initial footprint.
+        self.keys = [0] * self.size
+        self.depths = [-1] * self.size
+        self.values = [0] * self.size
+        self.flags = [0] * self.size
+        self.moves = [None] * self.size
+
+        # Search each entry was stored by. Entries are kept from one search
+        # to the next, but stale ones give way to any new result.
+        self.generations = [0] * self.size
+        self.generation = 0
+
+    def lookup(self, key):
+        slot = key & self.mask
+        if self.keys[slot] != key or self.depths[slot] < 0:
+            return None
+        return self.depths[slot], self.values[slot], self.flags[slot], self.moves[slot]
+
+    def store(self, key, depth, value, flag, move):
+        slot = key & self.mask
+
+        # Replace by depth: a shallower result never evicts a deeper one
+        # from the same search.
+        if depth < self.depths[slot] and self.generations[slot] == self.generation:
+            return
+
+        self.keys[slot] = key
+        self.depths[slot] = depth
+        self.values[slot] = value
+        self.flags[slot] = flag
+        self.moves[slot] = move
+        self.generations[slot] = self.generation
+
+    def new_generation(self):
+        self.generation += 1
+
+    def clear(self):
+        self.keys = [0] * self.size
+        self.depths = [-1] * self.size
+        self.values = [0] * self.size
+        self.flags = [0] * self.size
+        self.moves = [None] * self.size
+        self.generations = [0] * self.size
+        self.generation = 0
@@ -1,41 +1,70 @@
+from itertools import zip_longest
+
 import engine.MoveGen.setup as setup
+from engine.bitmanipulation.utils import count_bits
+from engine.FastBoard.FastBoard import PIECE_VALUES
+from engine.MoveGen.tables import KING_ATTACKS, PIECE_SQUARE_TABLES
 
 class Valkulator:
   MODES = [LAZY, NORMAL, EAGER] = range(3)
 
   def __init__(self):
 
-    self.pieceSquareTables = setup.PieceSquareTables
     self.masks = setup.load_evaluation_masks()
 
-    self.pieceValues = (
-      1,  # PAWN
-      3,  # BISHOP
-      3,  # KNIGHT
-      5,  # ROOK
-      9,  # QUEEN
-      0   # KING
-    )
-
+    # In the order get_stages yields the terms
     self.weights = (
       1.5,    # Material
       0.001,   # Piece Square Table Values
       1,      # development
       0.3,      # Center Control
-      0.02,   # tempo bonus
-      5,      # Connectivity
-      3,      # Mobility
-      0.2,   # Bishop Pair bonus
-      2,     # Pawn structure score
-      1,      #pressure
+      0.02,   # Connectivity
+      0.05,   # Mobility
+      0.1,    # King safety
+      0.3,    # Pawn structure
+      0.05,   # Pressure
     )
 
+    # Largest size of each term after the lazy stage, for one side, in the
+    # order of the weights. A side has at most 16 pieces, each attacking at
+    # most 27 squares, and at most 8 pieces (the first on each ray, or one
+    # per knight jump). Terms are white's score minus black's, both of the
+    # same sign, so the difference stays within the same bound.
+    self.bounds = (
+      1,        # development
+      16 * 4,   # Center Control: the 4 center squares
+      8,        # Connectivity: pieces defended, per piece
+      16 * 27,  # Mobility
+      16 * 9,   # King safety: the 9 squares around the king
+      7 + 8,    # Pawn structure: 8 pawns on one file, doubled and isolated
+      16 * 8,   # Pressure
+    )
+
+    # Per mode, how far the stages after each one can move the valuation.
+    # Once the score so far misses the alpha/beta window by more than this,
+    # the rest of the terms cannot bring it back, so they are skipped.
+    self.margins = [self.get_margins(mode) for mode in Valkulator.MODES]
+
+    # Largest evaluation in any mode: 15 pieces worth a queen at most against
+    # none, the two piece square averages at the ends of the tables, and
+    # every term after the lazy stage
+    pieceSquareSpread = max(PIECE_SQUARE_TABLES) - min(PIECE_SQUARE_TABLES)
+    self.limit = (self.weights[0] * 15 * max(PIECE_VALUES) + self.weights[1] * pieceSquareSpread
+                  + self.margins[Valkulator.EAGER][0])
+
     self.memo = [{} for _ in range(len(Valkulator.MODES))]
 
-  def __call__(self, board, *args, mode=NORMAL):
-    scores = [score(board,*args) for score in self.get_scores(mode)]
-    dot_product = lambda l1,l2: sum(v1*v2 for v1,v2 in zip(l1,l2))
-    valuation = dot_product(scores, self.weights)
+  def __call__(self, board, *args, mode=NORMAL, alpha=None, beta=None):
+    # Terms are consumed in order and paired with the weights in order
+    weights = iter(self.weights)
+    valuation = 0
+    for stage, margin in zip_longest(self.get_stages(mode), self.margins[mode]):
+      for score, weight in zip(stage, weights):
+        valuation += weight * score(board, *args)
+
+      # Nothing follows the last stage, it has no margin
+      if margin is not None and alpha is not None and (valuation + margin <= alpha or valuation - margin >= beta):
+        break
 
     return valuation
 
@@ -48,74 +77,99 @@ class Valkulator:
 
   @score
   def material(self, color, board, *args):
-    pieces = board.pieces.get_color(color)
-    pieceValues = map(lambda p: self.pieceValues[p[1]], pieces)
-    return sum(pieceValues)
+    # Summed by the board as pieces come and go, see FastBoard.PIECE_VALUES
+    return board.material[color]
 
   @score
   def piece_square_value(self, color, board, *args):
     
     # For each piece, a piece square table contains a score for every
-    # square indicating the strength of a square for that piece.
-    pieces =  board.pieces.get_color(color)
-    tables = self.pieceSquareTables[color]
-    pst_values = map(lambda piece: tables[piece[1]][piece[0]], pieces)
-    return sum(pst_values) / board.pieces.size(color)
+    # square indicating the strength of a square for that piece. The board
+    # keeps the running total.
+    return board.pieceSquare[color] / board.pieces.size(color)
+
+  # The attack terms below count, for each piece's attack bitboard from
+  # Generator.find_attacks, the squares of interest it covers
 
   @score
   def development(self, color, board, *args):
-    isPieceDeveloped = lambda mask: mask & board.colors[color] == 0
-    developmentMap = map(isPieceDeveloped, self.masks.minorPieceSquares[color])
-    return sum(developmentMap) / 4 # 4 minor pieces per color
+    # Minor pieces no longer on their home squares
+    undeveloped = board.colors[color] & self.masks.minorPieceHomes[color]
+    return (4 - count_bits(undeveloped)) / 4 # 4 minor pieces per color
 
 
   @score
   def center_control(self, color, board, attacks):
-    def countCenterSquares(attack):
-      isAttackingSquare = lambda square: attack & square != 0
-      return sum(map(isAttackingSquare, self.masks.centerSquares))
-    return sum(map(countCenterSquares, attacks[color]))
+    center = self.masks.center
+    return sum(count_bits(attack & center) for attack in attacks[color])
 
   @score
   def connectivity(self, color, board, attacks):
-    def countDefences(attack):
-      isDefendingPiece = lambda p: p[0] & attack != 0
-      return sum(map(isDefendingPiece, board.pieces.get_color(color)))
-    defenceBoolMap = map(countDefences, attacks[color])
-    return sum(defenceBoolMap) / board.pieces.size(color)
+    ownPieces = board.colors[color]
+    defences = sum(count_bits(attack & ownPieces) for attack in attacks[color])
+    return defences / board.pieces.size(color)
 
   @score
   def mobility(self, color, board, attacks):
-    pass
+    # Squares each piece reaches that are not blocked by its own side
+    free = ~board.colors[color]
+    return sum(count_bits(attack & free) for attack in attacks[color])
 
   @score
-  def king_safety(self, board, attacks, color):
-    # TODO
-    pass
+  def king_safety(self, color, board, attacks):
+    # Enemy attacks on the squares around the king
+    king = board.pieceTypes[5] & board.colors[color]
+    if not king:
+      return 0
+    kingZone = KING_ATTACKS[king.bit_length() - 1] | king
+    return -sum(count_bits(attack & kingZone) for attack in attacks[not color])
 
   @score
-  def pawn_structure(self, board, attacks, color):
-    # TODO
-    pass
+  def pawn_structure(self, color, board, attacks):
+    # Doubled and isolated pawns, file by file
+    pawns = board.pieceTypes[0] & board.colors[color]
+    weaknesses = 0
+    for file, adjacent in zip(self.masks.files, self.masks.adjacentFiles):
+      count = count_bits(pawns & file)
+      if count:
+        weaknesses += count - 1
+        if not pawns & adjacent:
+          weaknesses += count
+    return -weaknesses
 
   @score
-  def pressure(self, board, attacks, color):
-    # TODO
-    pass
+  def pressure(self, color, board, attacks):
+    # Attacks on enemy pieces
+    enemyPieces = board.colors[not color]
+    return sum(count_bits(attack & enemyPieces) for attack in attacks[color])
 
   @score
   def tempo(self, color, board, *args):
     # The purpose of a tempo bonus is to discourage cyclical repetitions.
     return int(board.active == color)
 
-  def get_scores(self, mode):
+  def get_stages(self, mode):
     # Lazy Evaluation
-    yield from (self.material, self.piece_square_value)
+    yield (self.material, self.piece_square_value)
     if mode == 0: return
 
     # Normal Evaluation
-    yield from (self.development, self.center_control, self.connectivity)
+    yield (self.development, self.center_control, self.connectivity)
     if mode == 1: return
 
     # Eager Evaluation
-    yield from (self.mobility, self.king_safety, self.connectivity, self.king_safety, self.pawn_structure, self.pressure)
\ No newline at end of file
+    yield (self.mobility, self.king_safety, self.pawn_structure, self.pressure)
+
+  def get_margins(self, mode):
+    # For every stage but the last, the bounds of the terms after it
+    sizes = [len(stage) for stage in self.get_stages(mode)]
+    reach = [weight * bound for weight, bound in zip(self.weights[sizes[0]:sum(sizes)], self.bounds)]
+    margins = []
+    for size in sizes[1:]:
+      margins.append(sum(reach))
+      reach = reach[size:]
+    return tuple(margins)
+
+  def get_scores(self, mode):
+    for stage in self.get_stages(mode):
+      yield from stage
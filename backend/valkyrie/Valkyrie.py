@@ -1,105 +1,417 @@
-from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.FastBoard import FastBoard, PIECE_VALUES
 from engine.MoveGen.Generator import Generator
+from engine.MoveGen.MoveList import MoveList
+from engine.FastBoard.moves import (PIECE_SHIFT, CAPTURE_SHIFT, PROMOTION_SHIFT, TYPE_MASK, CAPTURE_MASK, PROMOTION_MASK,
+                                    move_start, move_end, move_promotion)
 import time
 from valkyrie.Valkulator import Valkulator
+from valkyrie.TranspositionTable import TranspositionTable
+from valkyrie.MoveOrderer import MoveOrderer
 from pprint import pprint
 from engine.Position import Position
-from engine.bitmanipulation.utils import lsb
+from engine.bitmanipulation.utils import lsb, count_bits
 
 
+class SearchTimeout(Exception):
+    pass
+
 
 class Valkyrie():
-    def __init__(self):
+    # number of nodes searched between two checks of the clock
+    CLOCK_INTERVAL = 1024
+
+    # Quiescence skips a capture when even winning the captured piece, plus
+    # this much (in pawns), leaves the score short of the window
+    DELTA_MARGIN = 2
+
+    # Score of being mated and bound of every search window. It must stay
+    # above Valkulator.limit, or a lopsided position scores as a mate.
+    MAX_VALUE = 10000
+
+    # Width of the null windows that only test whether a move beats the best
+    # one so far
+    NULL_WINDOW = 0.001
+
+    # Each iteration after the first searches this far (in evaluation units)
+    # either side of the previous score, widening on a fail
+    ASPIRATION_WINDOW = 3
+
+    # Null move pruning: the depth taken off the null move search, and the
+    # fewest plies left to try it at
+    NULL_MOVE_REDUCTION = 2
+    NULL_MOVE_MIN_DEPTH = 3
+    # With this much material besides pawns or less (in pawns), zugzwang is
+    # likely enough that a null move cutoff is verified by a reduced search
+    NULL_MOVE_VERIFY_MATERIAL = 5
+
+    # Late move reductions: quiet moves from this index on are searched a ply
+    # shallower, two from LMR_DEEP_INDEX on, when at least LMR_MIN_DEPTH plies are left
+    LMR_MIN_INDEX = 3
+    LMR_DEEP_INDEX = 8
+    LMR_MIN_DEPTH = 3
+
+    # Futility pruning: quiet moves at the last two plies are skipped when the
+    # static evaluation plus this many pawns per ply left cannot reach the
+    # window. King moves are exempt, their piece square values alone swing
+    # the evaluation by more than any margin.
+    FUTILITY_MARGIN = 2
+    FUTILITY_MAX_DEPTH = 2
+
+    # Plies, counted from the root through quiescence, that get a move list
+    # allocated up front. Deeper nodes allocate their own.
+    MAX_PLY = 128
+
+    def __init__(self, aspirationWindow=ASPIRATION_WINDOW, nullMove=True, lateMoveReductions=True,
+                 futilityPruning=True, table=None):
         self.generator = Generator()
         self.evaluator = Valkulator()
+        # Any table with the TranspositionTable interface, such as a
+        # SharedTranspositionTable for searching in several processes
+        self.table = table if table is not None else TranspositionTable()
+        self.ordering = MoveOrderer()
+        self.moveLists = [MoveList() for _ in range(self.MAX_PLY)]
+        # evaluation units per pawn of material
+        self.pawnValue = self.evaluator.weights[0]
+        # None searches every iteration with the full window
+        self.aspirationWindow = aspirationWindow
+        # Pruning and reductions, each switchable for comparing strength
+        self.nullMove = nullMove
+        self.lateMoveReductions = lateMoveReductions
+        self.futilityPruning = futilityPruning
+        self.deadline = None
+        # Event that interrupts the current search when set, used to stop pondering
+        self.stop = None
+        self.nodes = 0
+
+    def clear(self):
+        # Forget everything learned, for a new game
+        self.table.clear()
+        self.ordering.clear()
+        self.generator.principleVariations.clear()
     
-    def best_move(self, board: FastBoard):
-        alpha, beta = -1000, 1000
-        maximizeRoot = not board.active 
-        depth, maxDepth = 0, 5
+    def best_move(self, board: FastBoard, maxDepth=5, timeLimit=None, stop=None, minDepth=1):
+        maximizeRoot = board.active == 0
 
-        evaluation, best_move = self.search(board, maximizeRoot, alpha, beta, depth, maxDepth, 1000)
-        
+        # The table, killers and history carry over from the previous search,
+        # which has usually searched this position a move or two deep already.
+        # Its entries are only marked stale and its history scores halved.
+        self.table.new_generation()
+        self.ordering.age()
+        self.generator.principleVariations.clear()
+        self.stop = stop
+
+        # Iterative deepening. Each iteration leaves its principle variation
+        # in the table for the next one to search first. When the time limit
+        # (in milliseconds) runs out, the move of the last completed
+        # iteration is returned. The first iteration (minDepth) always completes
+        # unless stopped.
+        start = time.time()
+        best_move = None
+        evaluation = None
+        self.deadline = None
+        for iterationDepth in range(minDepth, maxDepth + 1):
+            self.nodes = 0
+            try:
+                evaluation, move = self.aspiration_search(board, maximizeRoot, iterationDepth, evaluation)
+            except SearchTimeout:
+                break
+
+            if move is not None:
+                best_move = move
+
+            if timeLimit is not None:
+                self.deadline = start + timeLimit / 1000
+                # the next iteration costs several times this one, so do not
+                # start it unless most of the budget is still left
+                if (time.time() - start) * 2 > timeLimit / 1000:
+                    break
+
+        self.deadline = None
+        self.stop = None
         return best_move
+
+    def ponder(self, board, stop, maxDepth=20, timeLimit=None):
+        # Search until stopped (or out of depth or time), only to fill the
+        # table for the next search. `board` must be the searching thread's
+        # own copy.
+        self.best_move(board, maxDepth=maxDepth, timeLimit=timeLimit, stop=stop)
         
-    def search(self, board, maximize, alpha, beta, depth, maxDepth, maxValue, isQuiet=True):
-        
+    def aspiration_search(self, board, maximize, maxDepth, guess=None):
+        # Search a window around the previous iteration's score. Most
+        # iterations land inside it and cut off more; on a fail the window
+        # is widened on that side and the iteration searched again.
+        maxValue = self.MAX_VALUE
+        window = self.aspirationWindow
+        if guess is None or window is None:
+            return self.search(board, maximize, -maxValue, maxValue, 0, maxDepth, maxValue)
+
+        alpha, beta = max(guess - window, -maxValue), min(guess + window, maxValue)
+        while True:
+            evaluation, move = self.search(board, maximize, alpha, beta, 0, maxDepth, maxValue)
+            if evaluation <= alpha and alpha > -maxValue:
+                window *= 4
+                alpha = max(evaluation - window, -maxValue)
+            elif evaluation >= beta and beta < maxValue:
+                window *= 4
+                beta = min(evaluation + window, maxValue)
+            else:
+                return evaluation, move
+
+    def ordered_moves(self, board, attacks, attackSets, depth, ttMove, previousMove):
+        # The table move is tried before anything is generated, so a cutoff
+        # on it never pays for move generation. The rest are generated once
+        # needed and picked best first by their ordering scores.
+        if ttMove is not None:
+            promotion = move_promotion(ttMove)
+            if self.generator.legal_move(board, move_start(ttMove), move_end(ttMove),
+                                         4 if promotion is None else promotion) == ttMove:
+                yield ttMove
+            else:
+                ttMove = None
+
+        moves = self.generator.find_moves(board, attacks, attackSets, moves=self.move_list(depth))
+        self.ordering.order(moves, depth, previousMove)
+
+        while len(moves) > 0:
+            move = moves.pop()
+            if move != ttMove:
+                yield move
+
+    def move_list(self, ply):
+        # Only one node per ply is searched at a time, so they can all fill
+        # the same list
+        return self.moveLists[ply] if ply < self.MAX_PLY else MoveList()
+
+    def count_node(self):
+        self.nodes += 1
+        if self.nodes % self.CLOCK_INTERVAL == 0:
+            if self.deadline is not None and time.time() > self.deadline:
+                raise SearchTimeout()
+            if self.stop is not None and self.stop.is_set():
+                raise SearchTimeout()
+
+    def quiescence(self, board, maximize, alpha, beta, maxValue, ply=0):
+        # Search captures only until the position is quiet, so leaves are
+        # never evaluated in the middle of an exchange. The side to move may
+        # stand pat on the static evaluation instead of capturing, except in
+        # check, where every evasion is searched.
+        self.count_node()
+
         attacks, attackSets = self.generator.find_attacks(board)
-        
-        # Recursive base case. Leaf has been reached. Return its valuation.
-        if depth >= maxDepth and isQuiet:
-            return self.evaluator(board, attacks)
-
-        # only search captures if depth surpassed max depth. If the max depth
-        # is surpassed and it's quiet, search all moves, but use stop search
-        # parameter to make it the last search on this branch
-        if depth < maxDepth:
-            moves = self.generator.find_moves(board, attacks, attackSets)
-        elif depth == maxDepth:
-            moves = self.generator.find_captures(board, attacks, attackSets)
+        inCheck = self.generator.is_in_check(board)
+        if inCheck:
+            best = -maxValue if maximize else maxValue
+            moves = self.generator.find_moves(board, attacks, attackSets, moves=self.move_list(ply))
         else:
-            moves = self.generator.find_strong_captures(board, attacks, attackSets,
-                                                findTrades = depth == maxDepth + 1)
+            best = standPat = self.evaluator(board, attacks, alpha=alpha, beta=beta)
+            if maximize:
+                if standPat >= beta:
+                    return standPat
+                alpha = max(alpha, standPat)
+            else:
+                if standPat <= alpha:
+                    return standPat
+                beta = min(beta, standPat)
+            moves = self.generator.find_captures(board, attacks, attackSets, moves=self.move_list(ply))
 
-        if len(moves) == 0:
-            if depth < maxDepth:
-                return -1000 if maximize else 1000, None
-            return self.evaluator(board, attacks)
-        
-        # sorting moves everytime seems to speed things up
-        moveOrder = [] 
         while len(moves) > 0:
-            m = moves.pop()
-            board+=m
-            v = self.evaluator(board,attacks, mode=0)
-            moveOrder.append((v,m))
-            board -= m
-        moves = sorted(moveOrder, key=lambda x:x[0], reverse = board.active == 1)
-        moves = [m[1] for m in moves]
-        
-        # def present_move(move):
-        #     start = Position(index=lsb(move.start))
-        #     end = Position(index=lsb(move.end)) 
-            
-        #     return f"{start}{end}"
-        # print("Looking for best move for: ", maximize)
-        # pprint([(present_move(b), a) for (a, b) in moveOrder])
-        
-        
-        # return
+            move = moves.pop()
+
+            if not inCheck:
+                # Delta pruning: this capture cannot reach the window
+                captured = move >> CAPTURE_SHIFT & TYPE_MASK
+                promotion = move >> PROMOTION_SHIFT & TYPE_MASK
+                gain = PIECE_VALUES[captured - 1] + self.DELTA_MARGIN
+                if promotion:
+                    gain += PIECE_VALUES[promotion - 1] - PIECE_VALUES[0]
+                if (standPat + gain * self.pawnValue <= alpha if maximize
+                        else standPat - gain * self.pawnValue >= beta):
+                    continue
+
+                # Captures that lose material once the exchange plays out
+                if self.generator.static_exchange(board, move) < 0:
+                    continue
+
+            board += move
+            try:
+                value = self.quiescence(board, not maximize, alpha, beta, maxValue, ply + 1)
+            finally:
+                board -= move
+
+            if maximize:
+                if value > best:
+                    best = value
+                alpha = max(alpha, best)
+            else:
+                if value < best:
+                    best = value
+                beta = min(beta, best)
+            if alpha >= beta:
+                break
+
+        return best
+
+    def null_move_search(self, board, maximize, alpha, beta, depth, maxDepth, maxValue):
+        # The cutoff value when passing the turn already fails high for the
+        # side to move, None otherwise
+        color = board.active
+        pieceMaterial = board.material[color] - count_bits(board.pieceTypes[0] & board.colors[color])
+        if not pieceMaterial:
+            return None
+
+        reducedDepth = maxDepth - self.NULL_MOVE_REDUCTION
+        if maximize:
+            nullAlpha, nullBeta = beta - self.NULL_WINDOW, beta
+        else:
+            nullAlpha, nullBeta = alpha, alpha + self.NULL_WINDOW
+
+        board.make_null()
+        try:
+            value = self.search(board, not maximize, nullAlpha, nullBeta, depth + 1, reducedDepth, maxValue)
+        finally:
+            board.unmake_null()
 
-        # beam search
-        if depth == maxDepth - 1: 
-            moves = moves[-10:]
+        if value < beta if maximize else value > alpha:
+            return None
+
+        # Verify with a reduced search of the real moves, which cannot null
+        # move again at this node
+        if pieceMaterial <= self.NULL_MOVE_VERIFY_MATERIAL:
+            value = self.search(board, maximize, nullAlpha, nullBeta, depth, reducedDepth, maxValue)
+            if value < beta if maximize else value > alpha:
+                return None
+        return value
+
+    def search(self, board, maximize, alpha, beta, depth, maxDepth, maxValue, previousMove=None):
+
+        # Recursive base case. Leaf has been reached, resolve any captures
+        # left and return its valuation.
+        if depth >= maxDepth:
+            return self.quiescence(board, maximize, alpha, beta, maxValue, depth)
+
+        self.count_node()
+
+        # Consult the transposition table. Entries are only kept for the main
+        # search, never for quiescence.
+        remainingDepth = maxDepth - depth
+        alphaOrig, betaOrig = alpha, beta
+        ttMove = None
+        entry = self.table.lookup(board.hash)
+        if entry is not None:
+            ttDepth, ttValue, ttFlag, ttMove = entry
+            if depth > 0 and ttDepth >= remainingDepth:
+                if ttFlag == TranspositionTable.EXACT:
+                    return ttValue
+                if ttFlag == TranspositionTable.LOWER:
+                    alpha = max(alpha, ttValue)
+                else:
+                    beta = min(beta, ttValue)
+                if alpha >= beta:
+                    return ttValue
+
+        attacks, attackSets = self.generator.find_attacks(board)
+        color = board.active
+        inCheck = board.pieceTypes[5] & board.colors[color] & attackSets[not color] != 0
+
+        # Null move pruning: let the opponent move twice. If a shallower
+        # search still fails high, a real move would too. Never in check,
+        # at the root or right after another null move (previousMove None),
+        # and never with only pawns left, where passing can be the best move.
+        if (self.nullMove and previousMove is not None and not inCheck
+                and remainingDepth >= self.NULL_MOVE_MIN_DEPTH):
+            value = self.null_move_search(board, maximize, alpha, beta, depth, maxDepth, maxValue)
+            if value is not None:
+                return value
+
+        # Futility pruning needs the static evaluation near the leaves only
+        futile = False
+        if self.futilityPruning and not inCheck and remainingDepth <= self.FUTILITY_MAX_DEPTH:
+            margin = self.FUTILITY_MARGIN * remainingDepth * self.pawnValue
+            staticValue = self.evaluator(board, attacks, mode=Valkulator.LAZY)
+            futile = staticValue + margin <= alpha if maximize else staticValue - margin >= beta
 
         # initilize best as worst value
         best = -maxValue if maximize else maxValue
         bestMove = None
 
         # search edges until alpha/beta cutoff occurs
-        while beta > alpha and len(moves) > 0:
-
-            # get the highest priority move from the move queue
-            move = moves.pop()
+        for index, move in enumerate(self.ordered_moves(board, attacks, attackSets, depth,
+                                                        ttMove, previousMove)):
+            # Quiet moves that cannot reach the window are pruned, and those
+            # late in the order reduced, unless they give check
+            reduction = 0
+            if index > 0 and not inCheck and not move & (CAPTURE_MASK | PROMOTION_MASK):
+                prunable = futile and move >> PIECE_SHIFT & TYPE_MASK != 5
+                reducible = (self.lateMoveReductions and index >= self.LMR_MIN_INDEX
+                             and remainingDepth >= self.LMR_MIN_DEPTH
+                             and not self.ordering.is_killer(move, depth))
+                if prunable or reducible:
+                    board += move
+                    givesCheck = self.generator.is_in_check(board)
+                    board -= move
+                    if prunable and not givesCheck:
+                        continue
+                    if reducible and not givesCheck:
+                        reduction = 2 if index >= self.LMR_DEEP_INDEX and remainingDepth > 3 else 1
 
             # get child node by updating board
             board += move
             
-            # make recursive call to perform depth first search
-            value = self.search(board, not maximize, alpha, beta, depth + 1, maxDepth, maxValue, isQuiet = move.captureType is None)
-            
-            # revert board
-            board -= move
+            # make recursive call to perform depth first search, reverting the
+            # board even if the search is interrupted by the clock. Principal
+            # variation search: the first move gets the full window, the rest
+            # a null window that only shows whether they beat it, and are
+            # searched again in full when they do. A reduced move that beats
+            # it is first searched again at full depth.
+            try:
+                if index == 0:
+                    value = self.search(board, not maximize, alpha, beta, depth + 1, maxDepth, maxValue,
+                                        previousMove = move)
+                else:
+                    if maximize:
+                        nullAlpha, nullBeta = alpha, alpha + self.NULL_WINDOW
+                    else:
+                        nullAlpha, nullBeta = beta - self.NULL_WINDOW, beta
+                    value = self.search(board, not maximize, nullAlpha, nullBeta, depth + 1, maxDepth - reduction,
+                                        maxValue, previousMove = move)
+                    if reduction and (value > alpha if maximize else value < beta):
+                        value = self.search(board, not maximize, nullAlpha, nullBeta, depth + 1, maxDepth,
+                                            maxValue, previousMove = move)
+                    if alpha < value < beta:
+                        value = self.search(board, not maximize, alpha, beta, depth + 1, maxDepth, maxValue,
+                                            previousMove = move)
+            finally:
+                board -= move
 
             # maximize white and minimize black
-            if maximize == 0:
-                best = max(value, best)
+            if maximize:
+                if bestMove is None or value > best:
+                    best, bestMove = value, move
                 alpha = max(alpha, best)
-                bestMove = move
             else:
-                best = min(value, best)
+                if bestMove is None or value < best:
+                    best, bestMove = value, move
                 beta = min(beta,best)
-                bestMove = move
+
+            if alpha >= beta:
+                self.ordering.cutoff(move, depth, remainingDepth, previousMove)
+                break
+
+        if bestMove is None:
+            # Moves are legal, so none left is checkmate, or stalemate
+            # when the side to move is not in check
+            if not self.generator.is_in_check(board):
+                best = 0
+            return (best, None) if depth == 0 else best
+
+        if best <= alphaOrig:
+            flag = TranspositionTable.UPPER
+        elif best >= betaOrig:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+            self.generator.set_a_principle_variation(board, bestMove)
+        self.table.store(board.hash, remainingDepth, best, flag, bestMove)
 
         # if depth is 0, the search is complete
         return (best, bestMove) if depth == 0 else best
@@ -0,0 +1,72 @@
+import pytest
+
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import move_color
+from valkyrie.LazySMP import LazySMP, SearchBusy, WorkerLost
+from valkyrie.SharedTranspositionTable import SharedTranspositionTable
+from valkyrie.TranspositionTable import TranspositionTable
+
+
+def test_shared_table_entries_are_seen_through_every_attachment():
+    table = SharedTranspositionTable(size=16)
+    other = SharedTranspositionTable(size=16, name=table.name)
+    try:
+        table.store(3, 4, -1.5, TranspositionTable.LOWER, 123456)
+        assert other.lookup(3) == (4, -1.5, TranspositionTable.LOWER, 123456)
+
+        other.store(3, 2, 0.5, TranspositionTable.EXACT, None)
+        assert table.lookup(3) == (4, -1.5, TranspositionTable.LOWER, 123456)
+        assert table.lookup(19) is None
+
+        # a slot caught half written fails the key check
+        other.words[3 * 3 + 2] ^= 1
+        assert table.lookup(3) is None
+    finally:
+        other.close()
+        table.close()
+
+
+def test_lazy_smp_returns_move_of_main_worker():
+    search = LazySMP(workers=2, tableSize=1 << 12)
+    board = FastBoard()
+    key = board.hash
+    try:
+        best_move = search.search(board, maxDepth=2)
+        assert search.table.lookup(key) is not None
+    finally:
+        search.shutdown()
+
+    assert best_move is not None
+    assert move_color(best_move) == board.active
+    assert board.hash == key
+
+
+def test_lazy_smp_replaces_workers_that_died():
+    search = LazySMP(workers=2, tableSize=1 << 12)
+    board = FastBoard()
+    try:
+        # Without the main worker there is no answer
+        search.processes[0].kill()
+        with pytest.raises(WorkerLost):
+            search.search(board, maxDepth=2)
+
+        # A lost helper only costs its share of the search
+        search.processes[1].kill()
+        assert search.search(board, maxDepth=2) is not None
+
+        assert all(process.is_alive() for process in search.processes)
+        assert search.search(board, maxDepth=64, timeLimit=300) is not None
+    finally:
+        search.shutdown()
+
+
+def test_lazy_smp_turns_away_a_second_search():
+    search = LazySMP(workers=2, tableSize=1 << 12)
+    board = FastBoard()
+    try:
+        with search.lock:
+            with pytest.raises(SearchBusy):
+                search.search(board, maxDepth=2)
+        assert search.search(board, maxDepth=2) is not None
+    finally:
+        search.shutdown()
@@ -0,0 +1,36 @@
+from engine.FastBoard.moves import encode
+from engine.MoveGen.MoveList import MoveList, KILLER_SCORE, COUNTER_MOVE_SCORE
+from valkyrie.MoveOrderer import MoveOrderer
+
+
+def quiet(start, end, color=0):
+    return encode(start, end, 1, color)
+
+
+def test_quiet_moves_ordered_by_killers_counters_and_history():
+    ordering = MoveOrderer()
+    reply = quiet(52, 36, color=1)
+    killer, counter, historyMove, plain = quiet(1, 16), quiet(6, 21), quiet(2, 17), quiet(5, 20)
+    capture = encode(12, 20, 0, 0, captureType=4)
+
+    ordering.cutoff(counter, ply=5, depth=1, previousMove=reply)
+    ordering.cutoff(historyMove, ply=3, depth=4)
+    ordering.cutoff(historyMove, ply=3, depth=4)
+    ordering.cutoff(killer, ply=2, depth=2)
+    ordering.cutoff(capture, ply=2, depth=6)
+
+    moves = MoveList()
+    for move in (plain, historyMove, counter, killer, capture):
+        moves.push(move)
+    ordering.order(moves, ply=2, previousMove=reply)
+
+    assert [moves.pop() for _ in range(len(moves))] == [capture, killer, counter, historyMove, plain]
+    assert ordering.killers[2] == [killer, None]
+
+
+def test_history_is_aged_below_counter_moves():
+    ordering = MoveOrderer()
+    move = quiet(1, 16)
+    for _ in range(MoveOrderer.HISTORY_LIMIT):
+        ordering.cutoff(move, ply=0, depth=10)
+    assert 0 < max(ordering.history) < COUNTER_MOVE_SCORE < KILLER_SCORE
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+from engine.FastBoard.FastBoard import FastBoard
+from engine.FastBoard.moves import move_color
+from valkyrie.SearchExecutor import SearchExecutor, ENGINES_PER_WORKER, _engine, _engines
+
+
+def test_search_executor_returns_move_from_worker():
+    executor = SearchExecutor(workers=1)
+    board = FastBoard()
+    key = board.hash
+
+    try:
+        best_move = asyncio.run(executor.best_move(board, maxDepth=2, sessionId="game"))
+    finally:
+        executor.shutdown()
+
+    assert best_move is not None
+    assert move_color(best_move) == board.active
+    assert board.hash == key
+
+
+def test_search_executor_keeps_an_engine_per_game():
+    executor = SearchExecutor(workers=3)
+    try:
+        assert all(executor.worker_for("game") == executor.worker_for("game") for _ in range(5))
+    finally:
+        executor.shutdown()
+
+    engine = _engine("game")
+    assert _engine("game") is engine
+    assert _engine("other") is not engine
+
+    for game in range(ENGINES_PER_WORKER):
+        _engine(game)
+    assert _engine("game") is not engine
+    _engines.clear()
+
+
+def test_search_executor_replaces_a_worker_that_died():
+    executor = SearchExecutor(workers=1)
+    board = FastBoard()
+
+    async def search_after_kill():
+        assert await executor.best_move(board, maxDepth=1, sessionId="game") is not None
+        pool = executor.pools[0]
+        for process in list(pool._processes.values()):
+            process.kill()
+            process.join()
+        best_move = await executor.best_move(board, maxDepth=1, sessionId="game")
+        return pool, best_move
+
+    try:
+        brokenPool, best_move = asyncio.run(search_after_kill())
+        assert best_move is not None
+        assert executor.pools[0] is not brokenPool
+    finally:
+        executor.shutdown()
+
+
+def test_search_executor_ponder_gives_way_to_a_search():
+    executor = SearchExecutor(workers=1)
+
+    async def search_while_pondering():
+        board = FastBoard()
+        board += await executor.best_move(board, maxDepth=3, sessionId="game")
+        executor.ponder(board, "game", timeLimit=60000)
+        await asyncio.sleep(1)
+        start = time.monotonic()
+        assert await executor.best_move(board, maxDepth=1, sessionId="other") is not None
+        return time.monotonic() - start
+
+    try:
+        assert asyncio.run(search_while_pondering()) < 10
+    finally:
+        executor.shutdown()
@@ -1,10 +1,14 @@
 import pytest
+import time
 
 from unittest.mock import patch
 from engine.board import Board 
 from valkyrie.Valkyrie import Valkyrie
 from engine.Move import Move
 from engine.FastBoard.FastBoard import FastBoard
+from valkyrie.TranspositionTable import TranspositionTable
+from valkyrie.Valkulator import Valkulator
+from engine.FastBoard.moves import move_name
 
 @pytest.mark.skip()
 def test_best_move():
@@ -34,4 +38,181 @@ def test_temp_valkyrie():
     board = FastBoard()
     
     best_move = engine.best_move(board)
-    print(best_move)
\ No newline at end of file
+    print(best_move)
+
+def test_transposition_table_replaces_by_depth():
+    table = TranspositionTable(size=16)
+    table.store(3, 4, 1.5, TranspositionTable.EXACT, None)
+    table.store(3, 2, -1.0, TranspositionTable.LOWER, None)
+    assert table.lookup(3) == (4, 1.5, TranspositionTable.EXACT, None)
+
+    table.store(19, 5, 2.0, TranspositionTable.UPPER, None)
+    assert table.lookup(3) is None
+    assert table.lookup(19) == (5, 2.0, TranspositionTable.UPPER, None)
+
+
+def test_best_move_leaves_board_unchanged():
+    engine = Valkyrie()
+    board = FastBoard()
+    key = board.hash
+
+    engine.best_move(board)
+
+    assert board.hash == key
+    assert engine.table.lookup(key) is not None
+
+
+def test_best_move_respects_time_limit():
+    engine = Valkyrie()
+    board = FastBoard()
+    key = board.hash
+
+    start = time.time()
+    best_move = engine.best_move(board, maxDepth=20, timeLimit=200)
+
+    assert best_move is not None
+    assert time.time() - start < 2
+    assert board.hash == key
+
+
+def test_lazy_evaluation_skips_terms_outside_window():
+    evaluator = Valkulator()
+    engine = Valkyrie()
+    # white is a queen up
+    board = FastBoard.from_fen('rnb1kbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 3')
+    attacks, _ = engine.generator.find_attacks(board)
+
+    lazy = evaluator(board, attacks, mode=Valkulator.LAZY)
+    full = evaluator(board, attacks)
+    margin, = evaluator.margins[Valkulator.NORMAL]
+    assert lazy != full
+
+    assert evaluator(board, attacks, alpha=lazy + margin, beta=lazy + margin + 1) == lazy
+    assert evaluator(board, attacks, alpha=lazy - margin - 1, beta=lazy - margin) == lazy
+    assert evaluator(board, attacks, alpha=lazy - 1, beta=lazy + 1) == full
+
+
+def test_lazy_margins_cover_the_skipped_terms():
+    evaluator = Valkulator()
+    engine = Valkyrie()
+    afterLazy, afterNormal = evaluator.margins[Valkulator.EAGER]
+    for fen in ('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                'QQQQQQQQ/QQQQQQK1/8/8/3k4/8/pppppppp/8 w - - 0 1',
+                '4k3/8/8/3Q4/8/8/PPPPPPPP/RNB1KBNR w KQ - 0 1'):
+        board = FastBoard.from_fen(fen)
+        attacks, _ = engine.generator.find_attacks(board)
+        lazy = evaluator(board, attacks, mode=Valkulator.LAZY)
+        normal = evaluator(board, attacks, mode=Valkulator.NORMAL)
+        eager = evaluator(board, attacks, mode=Valkulator.EAGER)
+
+        assert abs(normal - lazy) <= evaluator.margins[Valkulator.NORMAL][0]
+        assert abs(eager - lazy) <= afterLazy
+        assert abs(eager - normal) <= afterNormal
+
+
+def test_evaluation_stays_below_the_mate_score():
+    evaluator = Valkulator()
+    engine = Valkyrie()
+    assert evaluator.limit < Valkyrie.MAX_VALUE
+    for fen in ('QQQQQQQQ/QQQQQQK1/8/8/3k4/8/pppppppp/8 w - - 0 1',
+                'qqqqqqqq/qqqqqqk1/8/8/8/8/8/4K3 b - - 0 1',
+                '3k4/8/8/8/8/8/8/1K6 w - - 0 1',
+                '6k1/8/8/8/8/8/8/3K4 b - - 0 1'):
+        board = FastBoard.from_fen(fen)
+        attacks, _ = engine.generator.find_attacks(board)
+        for mode in Valkulator.MODES:
+            assert abs(evaluator(board, attacks, mode=mode)) <= evaluator.limit
+
+
+def test_eager_terms():
+    evaluator = Valkulator()
+    engine = Valkyrie()
+
+    # white: doubled isolated c pawns and an isolated a pawn
+    board = FastBoard.from_fen('4k3/4p3/8/8/8/2P5/P1P5/4K3 w - - 0 1')
+    attacks, _ = engine.generator.find_attacks(board)
+    assert evaluator.pawn_structure(board, attacks) == -4 + 1
+
+    # black queen checking the white king from a distance
+    board = FastBoard.from_fen('4k3/8/8/8/1q6/8/8/4K3 w - - 0 1')
+    attacks, _ = engine.generator.find_attacks(board)
+    assert evaluator.king_safety(board, attacks) < 0
+    assert evaluator.pressure(board, attacks) < 0
+    assert evaluator.mobility(board, attacks) < 0
+    assert evaluator(board, attacks, mode=Valkulator.EAGER) < evaluator(board, attacks, mode=Valkulator.NORMAL)
+
+
+def test_quiescence_resolves_captures_before_evaluating():
+    engine = Valkyrie()
+    # white to move can win a hanging knight; black's pawn is defended
+    board = FastBoard.from_fen('4k3/8/4p3/3p4/5n2/8/5R2/4K3 w - - 0 1')
+    attacks, _ = engine.generator.find_attacks(board)
+    standPat = engine.evaluator(board, attacks)
+
+    assert engine.quiescence(board, True, -1000, 1000, 1000) > standPat
+    # a side already above beta stands pat
+    assert engine.quiescence(board, True, -1000, standPat - 1, 1000) == standPat
+
+
+@pytest.mark.parametrize("guess", [-50, 0, 50])
+def test_aspiration_search_widens_to_the_full_window_score(guess):
+    board = FastBoard.from_fen('r1bqkbnr/pppp1ppp/2n5/4p3/3PP3/5N2/PPP2PPP/RNBQKB1R b KQkq - 0 3')
+    # pruning decisions depend on the window, so only the plain search is window independent
+    unpruned = dict(nullMove=False, lateMoveReductions=False, futilityPruning=False)
+    expected, _ = Valkyrie(**unpruned).aspiration_search(board, False, 3)
+
+    evaluation, move = Valkyrie(**unpruned).aspiration_search(board, False, 3, guess)
+
+    assert evaluation == pytest.approx(expected)
+    assert move is not None
+
+
+def test_best_move_without_aspiration_window():
+    engine = Valkyrie(aspirationWindow=None)
+    assert engine.best_move(FastBoard(), maxDepth=3) is not None
+
+
+@pytest.mark.parametrize("switches", [
+    dict(),
+    dict(nullMove=False),
+    dict(lateMoveReductions=False),
+    dict(futilityPruning=False),
+    dict(nullMove=False, lateMoveReductions=False, futilityPruning=False),
+])
+def test_pruning_switches_find_back_rank_mate(switches):
+    engine = Valkyrie(**switches)
+    board = FastBoard.from_fen('6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1')
+    assert move_name(engine.best_move(board, maxDepth=4)) == 'a1a8'
+
+
+def test_no_null_move_with_only_pawns():
+    engine = Valkyrie()
+    # passing would be best for white here: any king move gives up the pawn
+    board = FastBoard.from_fen('8/8/8/8/8/2k5/2p5/2K5 w - - 0 1')
+    assert engine.null_move_search(board, True, -1000, 1000, 1, 5, 1000) is None
+
+
+def test_table_entries_from_an_older_search_give_way():
+    table = TranspositionTable(size=16)
+    table.store(3, 4, 1.5, TranspositionTable.EXACT, None)
+    table.new_generation()
+    assert table.lookup(3) == (4, 1.5, TranspositionTable.EXACT, None)
+
+    table.store(19, 1, 2.0, TranspositionTable.UPPER, None)
+    assert table.lookup(3) is None
+    assert table.lookup(19) == (1, 2.0, TranspositionTable.UPPER, None)
+
+
+def test_search_state_carries_over_between_moves():
+    engine = Valkyrie()
+    board = FastBoard()
+    first = board.hash
+
+    board += engine.best_move(board, maxDepth=3)
+    history = sum(engine.ordering.history)
+    board += engine.best_move(board, maxDepth=3)
+
+    assert engine.table.lookup(first) is not None
+    assert sum(engine.ordering.history) >= history // 2
+    engine.clear()
+    assert engine.table.lookup(first) is None
@@ -4,7 +4,7 @@ import Row from "./Row";
 import * as fen from "@/app/utils/fenString/fenString";
 import { PIECE_COLOR } from "@/app/constants/constants";
 import { useWebSocket } from "@/app/services/WebSocketContext";
-import { WEBSOCKET } from "@/app/services/constants";
+import { ENGINE, WEBSOCKET } from "@/app/services/constants";
 import coordsToAlgebraic from "@/app/utils/coordsToAlgebraic";
 import log from "@/app/utils/log";
 import useSound from "use-sound";
@@ -442,6 +442,9 @@ const Board = () => {
   const wsRequestEngineMove = () => {
     const message = {
       type: WEBSOCKET.TYPES.NEXT_MOVE,
+      data: {
+        time_limit: ENGINE.TIME_LIMIT,
+      },
     };
 
     sendMessage(message);
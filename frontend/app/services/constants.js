@@ -9,3 +9,9 @@ export const WEBSOCKET = {
   },
 };
 
+export const ENGINE = {
+  // search budget for an engine move, in milliseconds. The engine keeps
+  // deepening until it is spent, so a reply takes between half of it and all
+  // of it (less only when the position is forced).
+  TIME_LIMIT: 3000,
+};